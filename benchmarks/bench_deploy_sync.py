@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Deploy and Sync Benchmarks
+
+This script generates synthetic large project trees (thousands of markdown
+files, a multi-MB working-solutions.md, deep archive/ trees) and times the
+deployment and framework sync hot paths on them:
+
+- LLMContextDeployer.deploy (fresh deployment and --update)
+- FrameworkSyncTool.analyze_improvements (cold and warm manifest)
+- FrameworkSyncTool._show_file_diff on MB-sized files
+- FrameworkSyncTool.generate_sync_report
+
+Each case runs in its own process and records wall time, peak RSS and
+read/write syscall counts (from /proc/self/io where available). Results are
+written as JSON so runs on different commits can be compared.
+
+Usage:
+    python3 benchmarks/bench_deploy_sync.py --scale medium --output bench.json
+    python3 benchmarks/bench_deploy_sync.py --scale medium --compare bench-main.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import platform
+import resource
+import tempfile
+import argparse
+import subprocess
+import importlib.util
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Synthetic tree sizes: markdown files, working-solutions.md size, archive depth
+SCALES = {
+    "small": {"files": 300, "solutions_mb": 0.5, "archive_depth": 3},
+    "medium": {"files": 3000, "solutions_mb": 2, "archive_depth": 5},
+    "large": {"files": 15000, "solutions_mb": 8, "archive_depth": 7}
+}
+
+CASES = ["deploy", "deploy_update", "analyze_cold", "analyze_warm", "show_file_diff", "generate_sync_report"]
+
+# A case counts as a regression when it is this much slower than the baseline
+REGRESSION_RATIO = 1.2
+
+WORDS = ("pipeline camera sensor frame buffer latency driver config build test session context "
+         "hypothesis evidence solution failure retry timeout device stream format caps").split()
+
+
+def load_sync_module():
+    """Import sync-framework-improvements.py, whose name is not importable."""
+    spec = importlib.util.spec_from_file_location("sync_framework_improvements",
+                                                  REPO_ROOT / "sync-framework-improvements.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_markdown(rng: random.Random, sections: int, lines_per_section: int) -> str:
+    """Generate markdown with headings, bullets and code fences."""
+    out = []
+    for section in range(sections):
+        out.append(f"## {rng.choice(WORDS).title()} {section}\n")
+        for line in range(lines_per_section):
+            if line % 12 == 11:
+                out.append("```bash\n" + " ".join(rng.choices(WORDS, k=6)) + "\n```\n")
+            else:
+                out.append("- " + " ".join(rng.choices(WORDS, k=rng.randint(6, 14))) + "\n")
+        out.append("\n")
+    return "".join(out)
+
+
+def write_sized(path: Path, rng: random.Random, size_bytes: int) -> None:
+    """Write a synthetic markdown file of roughly size_bytes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("# Working Solutions\n\n")
+        written = 0
+        section = 0
+        while written < size_bytes:
+            chunk = synthetic_markdown(rng, 1, 40).replace("## ", f"## Solution {section}: ", 1)
+            f.write(chunk)
+            written += len(chunk)
+            section += 1
+
+
+def mutate(path: Path, rng: random.Random, edits: int) -> None:
+    """Apply scattered line edits, insertions and deletions to a file."""
+    lines = path.read_text(encoding='utf-8').split("\n")
+    for _ in range(edits):
+        index = rng.randrange(len(lines))
+        action = rng.random()
+        if action < 0.4:
+            lines[index] = "- " + " ".join(rng.choices(WORDS, k=8)) + " (edited)"
+        elif action < 0.7:
+            lines.insert(index, "- " + " ".join(rng.choices(WORDS, k=8)) + " (added)")
+        else:
+            del lines[index]
+    path.write_text("\n".join(lines), encoding='utf-8')
+
+
+def bench_objects(workdir: Path):
+    """Deploy object store kept inside the workspace, away from the repo and ~/.cache."""
+    from context_objects import ObjectStore
+    return ObjectStore(workdir / "framework", workdir / "objects")
+
+
+def generate_workspace(workdir: Path, scale: Dict, seed: int = 42) -> None:
+    """Build the synthetic framework and project trees under workdir.
+
+    framework/ mirrors this repository's LM_context; project/ is a
+    deployment of it grown to the requested scale, with edited guides so
+    the sync tool has modifications to find.
+    """
+    import deploy
+    rng = random.Random(seed)
+
+    framework = workdir / "framework"
+    shutil.copytree(REPO_ROOT / "LM_context", framework / "LM_context",
+                    ignore=shutil.ignore_patterns(".index", ".objects", ".journal", ".backups", "__pycache__"))
+
+    project = workdir / "project"
+    project.mkdir()
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        deploy.LLMContextDeployer(str(project), quiet=True, objects=bench_objects(workdir)).deploy()
+    context = project / "LM_context"
+
+    # Framework-tracked files the project has improved
+    for category in ("llm-guides", "human-guides"):
+        for guide in sorted((context / category).glob("*.md")):
+            mutate(guide, rng, 20)
+    (context / "llm-guides" / "llm-extra-benchmark-guide.md").write_text(synthetic_markdown(rng, 5, 10))
+
+    # MB-sized working solutions, with a diverged framework copy for diffing
+    solutions_bytes = int(scale["solutions_mb"] * 1024 * 1024)
+    write_sized(context / "dynamic" / "working-solutions.md", rng, solutions_bytes)
+    shutil.copy2(context / "dynamic" / "working-solutions.md", workdir / "working-solutions.framework.md")
+    mutate(context / "dynamic" / "working-solutions.md", rng, max(50, solutions_bytes // 20000))
+
+    # Thousands of markdown files: failed solutions and a deep archive tree
+    failed_dir = context / "dynamic" / "failed-solutions"
+    failed_dir.mkdir(parents=True, exist_ok=True)
+    for index in range(scale["files"] // 10):
+        (failed_dir / f"failure-{index:05d}.md").write_text(synthetic_markdown(rng, 3, 6))
+    for index in range(scale["files"] - scale["files"] // 10):
+        parts = [f"level{depth}-{(index >> depth) % 4}" for depth in range(scale["archive_depth"])]
+        path = context / "archive" / "daily-logs" / Path(*parts) / f"log-{index:05d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(synthetic_markdown(rng, 2, 5))
+
+
+def io_syscalls() -> Optional[Dict[str, int]]:
+    """Read/write syscall counters of this process (Linux only)."""
+    try:
+        with open("/proc/self/io", 'r') as f:
+            fields = dict(line.split(": ") for line in f.read().splitlines())
+        return {"read": int(fields["syscr"]), "write": int(fields["syscw"])}
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process in KiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_case(case: str, workdir: Path) -> Dict:
+    """Run one benchmark case in this process and measure it."""
+    import deploy
+    sync = load_sync_module()
+    framework = workdir / "framework"
+    project = workdir / "project"
+    extra = {}
+
+    def analyze(tool):
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            return tool.analyze_improvements()
+
+    # Setup that should not be measured
+    objects = bench_objects(workdir)
+    if case == "deploy":
+        target = Path(tempfile.mkdtemp(prefix="deploy-", dir=workdir))
+    elif case == "analyze_cold":
+        (framework / sync.MANIFEST_FILENAME).unlink(missing_ok=True)
+    elif case == "analyze_warm":
+        analyze(sync.FrameworkSyncTool(str(project), str(framework), analyze_only=True))
+    elif case == "generate_sync_report":
+        report_tool = sync.FrameworkSyncTool(str(project), str(framework), analyze_only=True)
+        improvements = analyze(report_tool)
+
+    syscalls_before = io_syscalls()
+    started = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        if case == "deploy":
+            deploy.LLMContextDeployer(str(target), quiet=True, objects=objects).deploy()
+        elif case == "deploy_update":
+            deploy.LLMContextDeployer(str(project), update=True, quiet=True, objects=objects).deploy()
+        elif case in ("analyze_cold", "analyze_warm"):
+            tool = sync.FrameworkSyncTool(str(project), str(framework), analyze_only=True)
+            improvements = tool.analyze_improvements()
+            extra = {"tree_syscalls": tool.syscalls_used(), "manifest_hits": tool.manifest.hits,
+                     "modified_files": len(improvements["modified_files"])}
+        elif case == "show_file_diff":
+            tool = sync.FrameworkSyncTool(str(project), str(framework), analyze_only=True, diff_max_lines=None)
+            tool._show_file_diff(str(workdir / "working-solutions.framework.md"),
+                                 str(project / "LM_context" / "dynamic" / "working-solutions.md"))
+        elif case == "generate_sync_report":
+            report_tool.generate_sync_report(improvements)
+        else:
+            raise ValueError(f"Unknown benchmark case: {case}")
+    wall = time.perf_counter() - started
+    syscalls_after = io_syscalls()
+
+    result = {"case": case, "wall_seconds": round(wall, 4), "peak_rss_kb": peak_rss_kb()}
+    if syscalls_before and syscalls_after:
+        result["read_syscalls"] = syscalls_after["read"] - syscalls_before["read"]
+        result["write_syscalls"] = syscalls_after["write"] - syscalls_before["write"]
+    result.update(extra)
+    return result
+
+
+def run_suite(scale_name: str, repeat: int, cases: List[str], keep: bool) -> Dict:
+    """Generate a workspace and run every case `repeat` times in subprocesses."""
+    workdir = Path(tempfile.mkdtemp(prefix=f"llm-context-bench-{scale_name}-"))
+    try:
+        print(f"🏗️ Generating {scale_name} workspace in {workdir}...")
+        started = time.perf_counter()
+        sys.path.insert(0, str(REPO_ROOT))
+        generate_workspace(workdir, SCALES[scale_name])
+        print(f"   done in {time.perf_counter() - started:.1f}s")
+
+        results = []
+        for case in cases:
+            runs = []
+            for _ in range(repeat):
+                completed = subprocess.run(
+                    [sys.executable, __file__, "--run-case", case, "--workdir", str(workdir)],
+                    capture_output=True, text=True, cwd=str(REPO_ROOT)
+                )
+                if completed.returncode != 0:
+                    raise RuntimeError(f"Case {case} failed:\n{completed.stderr}")
+                runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+            best = min(runs, key=lambda run: run["wall_seconds"])
+            best["runs"] = [run["wall_seconds"] for run in runs]
+            best["peak_rss_kb"] = max(run["peak_rss_kb"] for run in runs)
+            results.append(best)
+            print(f"  ⏱️ {case:<22} {best['wall_seconds']:>8.3f}s  {best['peak_rss_kb'] / 1024:>7.1f} MiB"
+                  + (f"  {best['read_syscalls']:>7} reads {best['write_syscalls']:>7} writes" if "read_syscalls" in best else ""))
+    finally:
+        if keep:
+            print(f"📁 Workspace kept: {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        "version": 1,
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale_name,
+        "scale_config": SCALES[scale_name],
+        "repeat": repeat,
+        "results": results
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current commit of the repository, if it is a git checkout."""
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                   text=True, cwd=str(REPO_ROOT))
+        return completed.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(current: Dict, baseline: Dict) -> bool:
+    """Print per-case ratios against a baseline run; True if nothing regressed."""
+    previous = {result["case"]: result for result in baseline["results"]}
+    print(f"\n📊 Compared with {baseline.get('commit') or 'baseline'} ({baseline['scale']}):")
+    ok = True
+    for result in current["results"]:
+        before = previous.get(result["case"])
+        if not before or not before["wall_seconds"]:
+            continue
+        ratio = result["wall_seconds"] / before["wall_seconds"]
+        regressed = ratio > REGRESSION_RATIO
+        ok &= not regressed
+        print(f"  {'❌' if regressed else '✅'} {result['case']:<22} {before['wall_seconds']:>8.3f}s → "
+              f"{result['wall_seconds']:>8.3f}s  ({ratio:.2f}x)")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark deploy and sync on synthetic large projects",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Record a baseline on main, then compare a branch against it
+  python3 benchmarks/bench_deploy_sync.py --scale medium --output bench-main.json
+  python3 benchmarks/bench_deploy_sync.py --scale medium --compare bench-main.json
+
+  # Only the sync analysis, three runs each
+  python3 benchmarks/bench_deploy_sync.py --cases analyze_cold analyze_warm --repeat 3
+        """
+    )
+
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small",
+                        help="Synthetic project size (default: small)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case; the fastest is reported (default: 1)")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES, help="Cases to run (default: all)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE_JSON",
+                        help=f"Compare with an earlier run; exit 1 if a case is over {REGRESSION_RATIO}x slower")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated workspace")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.run_case:
+        sys.path.insert(0, str(REPO_ROOT))
+        print(json.dumps(run_case(args.run_case, Path(args.workdir))))
+        return
+
+    report = run_suite(args.scale, args.repeat, args.cases, args.keep)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if not compare(report, baseline):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+LLM Context Archiver
+
+This script keeps the hot context files small by moving finished content
+into compressed archives under LM_context/archive/daily-logs/:
+
+- completed iterations from dynamic/current-iteration.md
+- all but the newest session entries from dynamic/session-handoff.md
+- ✅ VALIDATED hypotheses from evolving/assumptions-log.md
+
+Each hot file keeps a single pointer line to its archives. Archives are
+zstd-compressed when the zstandard module is installed, gzip otherwise.
+
+Usage:
+    python3 context_archiver.py /path/to/project
+    python3 context_archiver.py /path/to/project --max-bytes 8192 --keep-sessions 3
+    python3 context_archiver.py /path/to/project --show assumptions-log
+"""
+
+import re
+import sys
+import gzip
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from context_sections import parse_sections, resolve_context_dir
+from context_journal import WriteJournal, JournalBatch
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ARCHIVE_DIR = "archive/daily-logs"
+ARCHIVE_INDEX_FILENAME = "archive-index.json"
+POINTER_MARKER = "<!-- archive-pointer -->"
+
+ITERATION_FILE = "dynamic/current-iteration.md"
+HANDOFF_FILE = "dynamic/session-handoff.md"
+ASSUMPTIONS_FILE = "evolving/assumptions-log.md"
+HOT_FILES = [ITERATION_FILE, HANDOFF_FILE, ASSUMPTIONS_FILE]
+
+DEFAULT_MAX_BYTES = 8192
+DEFAULT_KEEP_SESSIONS = 3
+
+# "ITERATION 1 COMPLETION SUMMARY", "Iteration 2 ✅ COMPLETE", ...
+COMPLETED_ITERATION_PATTERN = re.compile(r"iteration\s+\d+.*\bcomplet(e|ed|ion)\b", re.IGNORECASE)
+# "### H1: ..." / "#### V2: ..." with a ✅ VALIDATED status or result line
+HYPOTHESIS_PATTERN = re.compile(r"^[HV]\d+\b")
+VALIDATED_PATTERN = re.compile(r"^\*\*(Status|Result):\*\*\s*✅\s*VALIDATED", re.MULTILINE)
+# Session entries are headings that mention a session and carry a date
+SESSION_PATTERN = re.compile(r"\bsession\b", re.IGNORECASE)
+ISO_DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+LONG_DATE_PATTERN = re.compile(r"([A-Z][a-z]+)\s+(\d{1,2})(?:-\d{1,2})?,\s*(\d{4})")
+
+
+def entry_date(title: str) -> Optional[datetime]:
+    """Parse the date of a session entry heading, if it has one."""
+    match = ISO_DATE_PATTERN.search(title)
+    if match:
+        try:
+            return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            return None
+    match = LONG_DATE_PATTERN.search(title)
+    if match:
+        for fmt in ("%B %d %Y", "%b %d %Y"):
+            try:
+                return datetime.strptime(f"{match.group(1)} {match.group(2)} {match.group(3)}", fmt)
+            except ValueError:
+                continue
+    return None
+
+
+def section_spans(text: str) -> List[Dict]:
+    """Parse sections and add the line span each covers with its subsections."""
+    sections = parse_sections(text)
+    total_lines = len(text.splitlines())
+    for index, section in enumerate(sections):
+        end = total_lines + 1
+        for following in sections[index + 1:]:
+            if following["level"] <= section["level"]:
+                end = following["start_line"]
+                break
+        section["end_line"] = end
+    return sections
+
+
+class ContextArchiver:
+    def __init__(self, context_dir: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                 keep_sessions: int = DEFAULT_KEEP_SESSIONS, compression: str = "auto", dry_run: bool = False):
+        self.context_dir = resolve_context_dir(context_dir)
+        self.archive_dir = self.context_dir / ARCHIVE_DIR
+        self.index_path = self.archive_dir / ARCHIVE_INDEX_FILENAME
+        self.max_bytes = max_bytes
+        self.keep_sessions = keep_sessions
+        self.dry_run = dry_run
+        self.batch_id: Optional[str] = None
+
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requested but the zstandard module is not installed")
+        if compression == "auto":
+            compression = "zstd" if zstandard is not None else "gzip"
+        self.compression = compression
+        self.index = self.load_index()
+
+    def load_index(self) -> Dict:
+        """Load the archive index (hot file -> archived section records)."""
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable archive index: {e}", file=sys.stderr)
+        return {"version": 1, "files": {}}
+
+    def save_index(self, batch: JournalBatch) -> None:
+        """Write the archive index through the run's journal batch."""
+        batch.write_text(self.index_path, json.dumps(self.index, indent=1, sort_keys=True))
+
+    def archive_name(self, relative_path: str, day: str) -> str:
+        """Archive file for one hot file and day, relative to LM_context/."""
+        suffix = ".zst" if self.compression == "zstd" else ".gz"
+        return f"{ARCHIVE_DIR}/{day}-{Path(relative_path).stem}.md{suffix}"
+
+    def append_archive(self, batch: JournalBatch, archive_relative: str, text: str) -> None:
+        """Append a compressed frame to an archive, journaled.
+
+        Both gzip members and zstd frames concatenate, so archiving twice on
+        the same day appends to one file that still decompresses as a whole.
+        The file is rewritten through the batch so a rollback drops the frame.
+        """
+        data = text.encode('utf-8')
+        if archive_relative.endswith(".zst"):
+            data = zstandard.ZstdCompressor(level=10).compress(data)
+        else:
+            data = gzip.compress(data, compresslevel=9)
+        path = self.context_dir / archive_relative
+        existing = path.read_bytes() if path.exists() else b""
+        batch.write_bytes(path, existing + data)
+
+    @staticmethod
+    def read_archive(path: Path) -> str:
+        """Decompress a whole archive file."""
+        data = path.read_bytes()
+        if path.suffix == ".zst":
+            if zstandard is None:
+                raise ValueError(f"{path.name} is zstd-compressed but the zstandard module is not installed")
+            reader = zstandard.ZstdDecompressor().stream_reader(data, read_across_frames=True)
+            return reader.read().decode('utf-8')
+        return gzip.decompress(data).decode('utf-8')
+
+    def select_sections(self, relative_path: str, sections: List[Dict], size: int) -> List[Dict]:
+        """Pick the sections of a hot file that should be archived."""
+        if relative_path == ITERATION_FILE:
+            return [s for s in sections if s["level"] >= 2 and COMPLETED_ITERATION_PATTERN.search(s["title"])]
+
+        if relative_path == ASSUMPTIONS_FILE:
+            selected = []
+            for section in sections:
+                if not HYPOTHESIS_PATTERN.match(section["title"]):
+                    continue
+                if VALIDATED_PATTERN.search(section["text"]):
+                    selected.append(section)
+            return selected
+
+        # Session handoff: keep the newest entries, and fewer while over the ceiling
+        entries = [(entry_date(s["title"]), order, s) for order, s in enumerate(sections)
+                   if s["level"] >= 2 and SESSION_PATTERN.search(s["title"]) and entry_date(s["title"])]
+        entries.sort(key=lambda item: (item[0], item[1]))
+        keep = self.keep_sessions
+        while True:
+            archived = [s for _, _, s in entries[:max(0, len(entries) - keep)]]
+            archived_bytes = sum(len(s["text"].encode('utf-8')) for s in archived)
+            if keep <= 1 or size - archived_bytes <= self.max_bytes:
+                return archived
+            keep -= 1
+
+    @staticmethod
+    def outermost(sections: List[Dict]) -> List[Dict]:
+        """Drop selected sections nested inside another selected section."""
+        result = []
+        for section in sorted(sections, key=lambda s: s["start_line"]):
+            if result and section["start_line"] < result[-1]["end_line"]:
+                continue
+            result.append(section)
+        return result
+
+    def pointer_line(self, relative_path: str) -> str:
+        """Render the one-line pointer from a hot file to its archives."""
+        records = self.index["files"].get(relative_path, [])
+        archives = sorted({record["archive"] for record in records})
+        latest = archives[-1] if archives else ""
+        older = f" (+{len(archives) - 1} older)" if len(archives) > 1 else ""
+        return (f"> 📦 {len(records)} archived sections: `{latest}`{older} - "
+                f"`python3 context_archiver.py --show {Path(relative_path).stem}` {POINTER_MARKER}")
+
+    @staticmethod
+    def set_pointer(lines: List[str], pointer: str) -> List[str]:
+        """Insert or replace the pointer line below the file title."""
+        lines = [line for line in lines if POINTER_MARKER not in line]
+        insert_at = 0
+        if lines and lines[0].startswith("# "):
+            insert_at = 1
+            while insert_at < len(lines) and lines[insert_at].startswith("**"):
+                insert_at += 1
+        lines.insert(insert_at, pointer)
+        return lines
+
+    def archive_file(self, relative_path: str, day: str, now: str, batch: Optional[JournalBatch] = None) -> Dict:
+        """Archive the finished sections of one hot file (batch is None on a dry run)."""
+        path = self.context_dir / relative_path
+        text = path.read_text(encoding='utf-8')
+        size = len(text.encode('utf-8'))
+        sections = section_spans(text)
+        selected = self.outermost(self.select_sections(relative_path, sections, size))
+
+        result = {"path": relative_path, "before": size, "after": size, "archived": [s["title"] for s in selected]}
+        if not selected:
+            return result
+
+        lines = text.split("\n")
+        archived_text = [f"<!-- archived from {relative_path} at {now} -->", ""]
+        for section in selected:
+            archived_text.append("\n".join(lines[section["start_line"] - 1:section["end_line"] - 1]).rstrip("\n"))
+            archived_text.append("")
+        for section in reversed(selected):
+            del lines[section["start_line"] - 1:section["end_line"] - 1]
+
+        archive_relative = self.archive_name(relative_path, day)
+        records = self.index["files"].setdefault(relative_path, [])
+        records += [{"section": s["path"], "archive": archive_relative, "archived": now} for s in selected]
+        new_text = "\n".join(self.set_pointer(lines, self.pointer_line(relative_path)))
+        result["after"] = len(new_text.encode('utf-8'))
+        result["archive"] = archive_relative
+
+        if batch is not None:
+            # Archive first, so an interrupted run never loses content
+            self.append_archive(batch, archive_relative, "\n".join(archived_text) + "\n")
+            batch.write_text(path, new_text, path.stat().st_mode & 0o7777)
+        return result
+
+    def run(self) -> List[Dict]:
+        """Archive every hot file and report sizes against the ceiling."""
+        now = datetime.now()
+        results = []
+        # One journaled batch per run: context_journal.py rollback undoes it
+        batch = None if self.dry_run else WriteJournal(self.context_dir).begin("archive hot context files")
+        try:
+            for relative_path in HOT_FILES:
+                if (self.context_dir / relative_path).exists():
+                    results.append(self.archive_file(relative_path, now.strftime('%Y-%m-%d'),
+                                                     now.isoformat(timespec='seconds'), batch))
+            if batch is not None and any(result["archived"] for result in results):
+                self.save_index(batch)
+        except BaseException:
+            if batch is not None:
+                batch.close("failed")
+            raise
+        if batch is not None:
+            batch.close()
+            self.batch_id = batch.batch_id if batch.manifest["entries"] else None
+        for result in results:
+            result["over_ceiling"] = result["after"] > self.max_bytes
+        return results
+
+    def show(self, name: str) -> str:
+        """Return the decompressed archives of a hot file (by stem or path)."""
+        matches = [path for path in self.index["files"] if path == name or Path(path).stem == name]
+        if not matches:
+            raise ValueError(f"No archives recorded for {name}")
+        archives = sorted({record["archive"] for record in self.index["files"][matches[0]]})
+        return "\n".join(self.read_archive(self.context_dir / archive) for archive in archives)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Archive finished content out of the hot LM_context files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Archive completed iterations, old sessions and validated hypotheses
+  python3 context_archiver.py /Users/vn/ws/melexis-simple
+
+  # Preview with a tighter ceiling
+  python3 context_archiver.py /Users/vn/ws/melexis-simple --max-bytes 4096 --dry-run
+
+  # Read archived hypotheses back
+  python3 context_archiver.py /Users/vn/ws/melexis-simple --show assumptions-log
+        """
+    )
+
+    parser.add_argument(
+        "context_dir",
+        nargs="?",
+        default=".",
+        help="Project directory or its LM_context/ directory (default: current directory)"
+    )
+
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        help=f"Byte ceiling for each hot file (default: {DEFAULT_MAX_BYTES})"
+    )
+
+    parser.add_argument(
+        "--keep-sessions",
+        type=int,
+        default=DEFAULT_KEEP_SESSIONS,
+        help=f"Newest session entries kept in session-handoff.md (default: {DEFAULT_KEEP_SESSIONS})"
+    )
+
+    parser.add_argument(
+        "--compression",
+        choices=["auto", "gzip", "zstd"],
+        default="auto",
+        help="Archive compression (default: zstd if installed, else gzip)"
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be archived without changing any file"
+    )
+
+    parser.add_argument(
+        "--show",
+        metavar="FILE",
+        help="Print the archived content of a hot file (e.g. session-handoff)"
+    )
+
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Exit with status 1 if a hot file is still over the ceiling"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        archiver = ContextArchiver(args.context_dir, args.max_bytes, args.keep_sessions,
+                                   args.compression, args.dry_run)
+        if not archiver.context_dir.is_dir():
+            print(f"❌ LM_context not found: {archiver.context_dir}")
+            sys.exit(1)
+        if args.show:
+            print(archiver.show(args.show))
+            return
+        results = archiver.run()
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"🗄️ Archiving {archiver.context_dir} ({archiver.compression}, ceiling {args.max_bytes} bytes)"
+          + (" - dry run" if args.dry_run else ""))
+    for result in results:
+        icon = "⚠️" if result["over_ceiling"] else "✅"
+        print(f"  {icon} {result['path']}: {result['before']} → {result['after']} bytes")
+        for section in result["archived"]:
+            print(f"      📦 {section}")
+        if result["over_ceiling"]:
+            print("      still over the ceiling - nothing else is eligible for archiving")
+    if archiver.batch_id:
+        print(f"📒 Journaled as batch {archiver.batch_id} "
+              f"(undo: python3 context_journal.py rollback {archiver.batch_id} {archiver.context_dir.parent})")
+
+    if args.strict and any(result["over_ceiling"] for result in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
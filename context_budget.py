@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+LLM Context Token Budget Estimator
+
+This script walks a deployed LM_context/ tree, estimates the token cost of
+every context file and produces an ordered load plan that fits a token
+budget, following the documented session-start priority order
+(session-handoff, current-iteration, environment, failed-solutions, ...).
+
+Usage:
+    python3 context_budget.py /path/to/project --budget 4000
+    python3 context_budget.py /path/to/project/LM_context --budget 4000 --json
+"""
+
+import re
+import sys
+import json
+import argparse
+from typing import Dict, List, Optional
+
+from context_journal import atomic_write
+from context_sections import content_digest, iter_markdown_files, resolve_context_dir
+
+INDEX_DIR = ".index"
+TOKEN_CACHE_FILENAME = "token-cache.json"
+
+# Session-start load order; a trailing slash means every file in that directory
+LOAD_PRIORITY = [
+    "dynamic/session-handoff.md",
+    "dynamic/current-iteration.md",
+    "static/environment.md",
+    "dynamic/failed-solutions/",
+    "evolving/assumptions-log.md",
+    "dynamic/working-solutions.md"
+]
+
+# Entries the session start command always reads
+CORE_ENTRIES = 4
+
+# Directories never counted as session context
+EXCLUDED_DIRS = {INDEX_DIR, "archive", "human-guides", "__pycache__"}
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate a BPE token count without a tokenizer model.
+
+    Letter runs count one token per ~4 characters, digit runs one per 3
+    digits, and every other non-space character (punctuation, markdown
+    syntax, emoji) one token each. This tracks cl100k-style counts within
+    roughly 10-15% on English markdown.
+    """
+    tokens = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        run = match.group(0)
+        first = run[0]
+        if first.isascii() and first.isalpha():
+            tokens += (len(run) + 3) // 4
+        elif first.isdigit():
+            tokens += (len(run) + 2) // 3
+        else:
+            tokens += 1
+    return tokens
+
+
+class ContextBudget:
+    def __init__(self, context_dir: str):
+        self.context_dir = resolve_context_dir(context_dir)
+        self.cache_path = self.context_dir / INDEX_DIR / TOKEN_CACHE_FILENAME
+        self.cache = {"files": {}, "tokens": {}}
+        self.cache_dirty = False
+        self.cache_hits = 0
+        self.load_cache()
+
+    def load_cache(self) -> None:
+        """Load cached token estimates keyed by content hash."""
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.cache["files"] = data.get("files", {})
+                self.cache["tokens"] = data.get("tokens", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable token cache: {e}", file=sys.stderr)
+
+    def save_cache(self) -> None:
+        """Write the token cache back if anything changed."""
+        if not self.cache_dirty:
+            return
+        live_digests = {entry["digest"] for entry in self.cache["files"].values()}
+        self.cache["tokens"] = {digest: count for digest, count in self.cache["tokens"].items() if digest in live_digests}
+        # Atomic: the watch daemon may rewrite the cache while a CLI run reads it
+        atomic_write(self.cache_path, json.dumps(self.cache, indent=1, sort_keys=True).encode('utf-8'))
+        self.cache_dirty = False
+
+    def context_files(self) -> List[str]:
+        """List context files (relative paths) that count towards the budget."""
+        return iter_markdown_files(self.context_dir, EXCLUDED_DIRS)
+
+    def file_tokens(self, relative_path: str) -> Dict:
+        """Return size and estimated tokens of one file, using the cache.
+
+        Unchanged size/mtime reuses the recorded digest; a changed file is
+        hashed, and only content never seen before is tokenized.
+        """
+        path = self.context_dir / relative_path
+        st = path.stat()
+        entry = self.cache["files"].get(relative_path)
+
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns \
+                and entry["digest"] in self.cache["tokens"]:
+            self.cache_hits += 1
+            return {"path": relative_path, "bytes": st.st_size, "tokens": self.cache["tokens"][entry["digest"]]}
+
+        data = path.read_bytes()
+        digest = content_digest(data)
+        if digest in self.cache["tokens"]:
+            self.cache_hits += 1
+        else:
+            self.cache["tokens"][digest] = estimate_tokens(data.decode('utf-8', errors='replace'))
+        self.cache["files"][relative_path] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "digest": digest}
+        self.cache_dirty = True
+        return {"path": relative_path, "bytes": st.st_size, "tokens": self.cache["tokens"][digest]}
+
+    def build_plan(self, budget: int) -> Dict:
+        """Build an ordered load plan that fits within a token budget.
+
+        Files are taken in LOAD_PRIORITY order and loaded while they fit;
+        anything that would exceed the budget is deferred. Files outside
+        the priority list are on-demand and never preloaded.
+        """
+        files = self.context_files()
+        estimates = {relative_path: self.file_tokens(relative_path) for relative_path in files}
+        self.save_cache()
+
+        ordered = []
+        for rank, entry in enumerate(LOAD_PRIORITY):
+            if entry.endswith("/"):
+                matches = [f for f in files if f.startswith(entry)]
+            else:
+                matches = [entry] if entry in estimates else []
+            ordered += [(rank, relative_path) for relative_path in matches]
+        prioritized = {relative_path for _, relative_path in ordered}
+
+        plan = []
+        used = 0
+        for rank, relative_path in ordered:
+            item = dict(estimates[relative_path], core=rank < CORE_ENTRIES)
+            if used + item["tokens"] <= budget:
+                used += item["tokens"]
+                item["action"] = "load"
+            else:
+                item["action"] = "defer"
+            item["cumulative"] = used
+            plan.append(item)
+
+        for relative_path in files:
+            if relative_path not in prioritized:
+                plan.append(dict(estimates[relative_path], core=False, action="on-demand", cumulative=used))
+
+        total = sum(item["tokens"] for item in estimates.values())
+        return {
+            "context_dir": str(self.context_dir),
+            "budget": budget,
+            "planned_tokens": used,
+            "total_tokens": total,
+            "reduction_percent": round(100 * (1 - used / total), 1) if total else 0.0,
+            "core_deferred": [item["path"] for item in plan if item["core"] and item["action"] == "defer"],
+            "cache_hits": self.cache_hits,
+            "files": plan
+        }
+
+    @staticmethod
+    def print_plan(plan: Dict) -> None:
+        """Print a load plan as a table."""
+        icons = {"load": "✅", "defer": "⏸️ ", "on-demand": "📚"}
+        print(f"📊 Context load plan for {plan['context_dir']} (budget: {plan['budget']} tokens)\n")
+        print(f"{'#':>3}  {'Action':<11} {'Tokens':>7} {'Total':>7}  File")
+        for index, item in enumerate(plan["files"], 1):
+            print(f"{index:>3}  {icons[item['action']]} {item['action']:<8} {item['tokens']:>7} "
+                  f"{item['cumulative']:>7}  {item['path']}")
+        print()
+        print(f"📦 Planned: {plan['planned_tokens']} of {plan['total_tokens']} tokens "
+              f"({plan['reduction_percent']}% reduction vs. loading everything)")
+        print(f"🗂️ Cache hits: {plan['cache_hits']}")
+        if plan["core_deferred"]:
+            print(f"⚠️ Core files over budget: {', '.join(plan['core_deferred'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Estimate LM_context token usage and plan context loading within a budget",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Show the load plan for a 4k-token session start budget
+  python3 context_budget.py /Users/vn/ws/melexis-simple --budget 4000
+
+  # Fail (exit 1) when core session files no longer fit, e.g. in CI
+  python3 context_budget.py /Users/vn/ws/melexis-simple --budget 4000 --strict
+        """
+    )
+
+    parser.add_argument(
+        "context_dir",
+        nargs="?",
+        default=".",
+        help="Project directory or its LM_context/ directory (default: current directory)"
+    )
+
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=4000,
+        help="Token budget for session start context (default: 4000)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the plan as JSON"
+    )
+
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Exit with status 1 if any core session file does not fit the budget"
+    )
+
+    args = parser.parse_args()
+
+    budget = ContextBudget(args.context_dir)
+    if not budget.context_dir.is_dir():
+        print(f"❌ LM_context not found: {budget.context_dir}")
+        sys.exit(1)
+
+    plan = budget.build_plan(args.budget)
+
+    if args.json:
+        print(json.dumps(plan, indent=2))
+    else:
+        budget.print_plan(plan)
+
+    if args.strict and plan["core_deferred"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
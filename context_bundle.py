@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+LLM Context Bundle
+
+Packs a whole LM_context/ tree into one file that loads and transfers
+faster than dozens of small markdown files. A bundle is:
+
+    b"LMCB"  u16 format version  u32 header length      (little endian)
+    header   zlib-compressed JSON: codec, and per file its mode, size,
+             digest and the offset, length and digest of each section
+    payload  one independently compressed frame per distinct section
+
+Markdown files are stored as their heading-delimited sections, other files
+as a single section. Sections are zstd-compressed when the zstandard module
+is installed, zlib otherwise. The reader maps the bundle with mmap and
+decompresses only the frame that is asked for, so one section can be pulled
+out of a large bundle without touching the rest.
+
+Usage:
+    python3 context_bundle.py pack /path/to/project -o project-context.lmcb
+    python3 context_bundle.py unpack project-context.lmcb /path/to/other/project
+    python3 context_bundle.py list project-context.lmcb
+    python3 context_bundle.py show project-context.lmcb dynamic/session-handoff.md --section "Next Steps"
+"""
+
+import os
+import sys
+import mmap
+import json
+import zlib
+import struct
+import argparse
+from pathlib import Path, PurePosixPath
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from context_sections import parse_sections, content_digest, resolve_context_dir, SKIPPED_DIRS, PREAMBLE
+from context_journal import WriteJournal, atomic_write
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+BUNDLE_MAGIC = b"LMCB"
+BUNDLE_VERSION = 1
+PREFIX = struct.Struct("<4sHI")
+BUNDLE_SUFFIX = ".lmcb"
+
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 9
+
+
+def split_file(relative_path: str, data: bytes) -> List[Dict]:
+    """Cut a file into the sections it is stored as.
+
+    Markdown is split at headings when the sections join back to exactly
+    the original text; anything else is one PREAMBLE section.
+    """
+    if relative_path.endswith(".md"):
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            text = None
+        if text is not None:
+            sections = parse_sections(text)
+            if sections and "".join(section["text"] for section in sections) == text:
+                return [{"path": section["path"], "level": section["level"],
+                         "data": section["text"].encode('utf-8')} for section in sections]
+    return [{"path": PREAMBLE, "level": 0, "data": data}]
+
+
+def check_bundle_path(relative_path: str) -> str:
+    """Reject bundled paths that could land outside LM_context/ on unpack."""
+    parts = PurePosixPath(relative_path).parts
+    if (not relative_path or "\\" in relative_path or PurePosixPath(relative_path).is_absolute()
+            or ".." in parts or (parts and ":" in parts[0])):
+        raise ValueError(f"unsafe path in bundle: {relative_path!r}")
+    return relative_path
+
+
+def check_bundle_mode(relative_path: str, mode) -> int:
+    """Permission bits a bundled file may be written with: rwx only.
+
+    setuid, setgid and sticky bits are dropped, so a crafted bundle cannot
+    plant privileged files in a project.
+    """
+    if type(mode) is not int or mode < 0:
+        raise ValueError(f"invalid mode in bundle for {relative_path!r}: {mode!r}")
+    return mode & 0o777
+
+
+def pack_bundle(context_dir: str, output: Path, compression: str = "auto") -> Dict:
+    """Write every file below a project's LM_context/ into one bundle.
+
+    Tool state (.index/, .journal/, ...) and hidden files are left out.
+    Returns the bundle header.
+    """
+    context_dir = resolve_context_dir(context_dir)
+    if compression == "zstd" and zstandard is None:
+        raise ValueError("zstd compression requested but the zstandard module is not installed")
+    if compression == "auto":
+        compression = "zstd" if zstandard is not None else "zlib"
+    compress = (zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress if compression == "zstd"
+                else lambda data: zlib.compress(data, ZLIB_LEVEL))
+
+    header = {
+        "created": datetime.now().isoformat(timespec='seconds'),
+        "source": str(context_dir),
+        "codec": compression,
+        "files": []
+    }
+    frames: List[bytes] = []
+    offset = 0
+    # Repeated sections (shared boilerplate, copied guides) are stored once
+    stored: Dict[str, List[int]] = {}
+
+    for root, dirs, names in os.walk(context_dir):
+        dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRS and not d.startswith('.'))
+        for name in sorted(names):
+            if name.startswith('.'):
+                continue
+            path = Path(root) / name
+            relative_path = path.relative_to(context_dir).as_posix()
+            data = path.read_bytes()
+            entry = {
+                "path": relative_path,
+                "mode": path.stat().st_mode & 0o777,
+                "size": len(data),
+                "digest": content_digest(data),
+                "sections": []
+            }
+            for section in split_file(relative_path, data):
+                digest = content_digest(section["data"])
+                if digest not in stored:
+                    frame = compress(section["data"])
+                    stored[digest] = [offset, len(frame)]
+                    frames.append(frame)
+                    offset += len(frame)
+                entry["sections"].append({
+                    "path": section["path"],
+                    "level": section["level"],
+                    "offset": stored[digest][0],
+                    "length": stored[digest][1],
+                    "size": len(section["data"]),
+                    "digest": digest
+                })
+            header["files"].append(entry)
+
+    # Section paths repeat their parents' headings, so the index compresses well
+    header_bytes = zlib.compress(json.dumps(header, separators=(',', ':')).encode('utf-8'), ZLIB_LEVEL)
+    atomic_write(Path(output), PREFIX.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(header_bytes))
+                 + header_bytes + b"".join(frames))
+    return header
+
+
+class ContextBundle:
+    """Read-only, memory-mapped access to a packed bundle."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except BaseException:
+            self.mapped.close()
+            raise
+
+    def _read_header(self) -> None:
+        if len(self.mapped) < PREFIX.size:
+            raise ValueError(f"{self.path.name} is not a context bundle")
+        magic, version, header_length = PREFIX.unpack_from(self.mapped, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"{self.path.name} is not a context bundle")
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"{self.path.name} has bundle format {version}, expected {BUNDLE_VERSION}")
+        try:
+            self.header = json.loads(zlib.decompress(self.mapped[PREFIX.size:PREFIX.size + header_length]))
+        except (zlib.error, ValueError) as e:
+            raise ValueError(f"{self.path.name} has a corrupt header: {e}")
+        self.payload_start = PREFIX.size + header_length
+        # Bundles come from other machines: every path must stay below LM_context/
+        # and every mode is reduced to plain permission bits
+        try:
+            self.files = {}
+            for entry in self.header["files"]:
+                relative_path = check_bundle_path(entry["path"])
+                entry["mode"] = check_bundle_mode(relative_path, entry.get("mode"))
+                self.files[relative_path] = entry
+        except ValueError as e:
+            raise ValueError(f"{self.path.name}: {e}")
+
+        codec = self.header["codec"]
+        if codec == "zstd":
+            if zstandard is None:
+                raise ValueError(f"{self.path.name} is zstd-compressed but the zstandard module is not installed")
+            self._decompress = zstandard.ZstdDecompressor().decompress
+        elif codec == "zlib":
+            self._decompress = zlib.decompress
+        else:
+            raise ValueError(f"{self.path.name} uses unknown codec {codec}")
+
+    def __enter__(self) -> "ContextBundle":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.mapped.close()
+
+    def file(self, relative_path: str) -> Dict:
+        """Header entry of one file (mode, size, digest, sections)."""
+        if relative_path not in self.files:
+            raise KeyError(f"{relative_path} is not in {self.path.name}")
+        return self.files[relative_path]
+
+    def list_files(self, prefix: str = "", suffix: str = "") -> List[str]:
+        """Paths of the bundled files, optionally filtered like TreeSnapshot.list_files."""
+        return [path for path in self.files if path.startswith(prefix) and path.endswith(suffix)]
+
+    def _read(self, section: Dict) -> bytes:
+        start = self.payload_start + section["offset"]
+        data = self._decompress(self.mapped[start:start + section["length"]])
+        if len(data) != section["size"]:
+            raise ValueError(f"{self.path.name}: section {section['path']} is corrupt")
+        return data
+
+    def read_section(self, relative_path: str, section_path: str) -> str:
+        """Decompress one section of one file."""
+        for section in self.file(relative_path)["sections"]:
+            if section["path"] == section_path:
+                return self._read(section).decode('utf-8')
+        raise KeyError(f"{relative_path} has no section {section_path}")
+
+    def read_bytes(self, relative_path: str) -> bytes:
+        """Reassemble a whole file from its sections."""
+        entry = self.file(relative_path)
+        data = b"".join(self._read(section) for section in entry["sections"])
+        if content_digest(data) != entry["digest"]:
+            raise ValueError(f"{self.path.name}: {relative_path} does not match its digest")
+        return data
+
+    def read_text(self, relative_path: str) -> str:
+        return self.read_bytes(relative_path).decode('utf-8')
+
+    def unpack(self, project_dir: Path, force: bool = False) -> Dict[str, List[str]]:
+        """Write the bundle into project_dir/LM_context/ as one journaled batch.
+
+        Files already holding the bundled content are skipped; files with
+        other content are kept unless force is set.
+        """
+        context_dir = Path(project_dir).resolve() / "LM_context"
+        outcome = {"written": [], "unchanged": [], "kept": []}
+        with WriteJournal(project_dir).begin(f"unpack {self.path.name}") as batch:
+            for relative_path, entry in self.files.items():
+                target = (context_dir / relative_path).resolve()
+                if not target.is_relative_to(context_dir.resolve()):
+                    raise ValueError(f"{self.path.name}: {relative_path} resolves outside {context_dir}")
+                if target.exists():
+                    if target.stat().st_size == entry["size"] and content_digest(target.read_bytes()) == entry["digest"]:
+                        outcome["unchanged"].append(relative_path)
+                        continue
+                    if not force:
+                        outcome["kept"].append(relative_path)
+                        continue
+                batch.write_bytes(target, self.read_bytes(relative_path),
+                                  check_bundle_mode(relative_path, entry["mode"]))
+                outcome["written"].append(relative_path)
+        return outcome
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pack LM_context/ into a single-file bundle and read it back",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Pack a project's context for another machine
+  python3 context_bundle.py pack /Users/vn/ws/melexis-simple -o melexis-simple.lmcb
+
+  # Unpack it there (files edited locally are kept unless --force)
+  python3 context_bundle.py unpack melexis-simple.lmcb /home/vn/ws/melexis-simple
+
+  # Pull one section without unpacking anything
+  python3 context_bundle.py show melexis-simple.lmcb dynamic/session-handoff.md --section "Next Steps"
+
+  # Deploy the framework's guides from a bundle
+  python3 context_bundle.py pack /path/to/llm-context-system -o framework.lmcb
+  python3 deploy.py --bundle framework.lmcb ./my-new-project
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    pack_parser = subparsers.add_parser("pack", help="Pack a project's LM_context/ into a bundle")
+    pack_parser.add_argument(
+        "project",
+        nargs="?",
+        default=".",
+        help="Project directory or its LM_context/ directory (default: current directory)"
+    )
+    pack_parser.add_argument("-o", "--output", help=f"Bundle file (default: <project name>{BUNDLE_SUFFIX})")
+    pack_parser.add_argument(
+        "--compression",
+        choices=["auto", "zstd", "zlib"],
+        default="auto",
+        help="Section compression (default: zstd if installed, else zlib)"
+    )
+
+    unpack_parser = subparsers.add_parser("unpack", help="Write a bundle into a project's LM_context/")
+    unpack_parser.add_argument("bundle", help="Bundle file")
+    unpack_parser.add_argument("project", nargs="?", default=".", help="Project directory (default: current directory)")
+    unpack_parser.add_argument("--force", action="store_true", help="Also overwrite files that differ from the bundle")
+
+    list_parser = subparsers.add_parser("list", help="List the files and sections of a bundle")
+    list_parser.add_argument("bundle", help="Bundle file")
+    list_parser.add_argument("--sections", action="store_true", help="Also list each file's sections")
+
+    show_parser = subparsers.add_parser("show", help="Print one file or section from a bundle")
+    show_parser.add_argument("bundle", help="Bundle file")
+    show_parser.add_argument("file", help="File path relative to LM_context/")
+    show_parser.add_argument("--section", help="Section heading path (as shown by 'list --sections')")
+
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        context_dir = resolve_context_dir(args.project)
+        if not context_dir.is_dir():
+            print(f"❌ LM_context not found: {context_dir}")
+            sys.exit(1)
+        project_name = context_dir.parent.name if context_dir.name == "LM_context" else context_dir.name
+        output = Path(args.output or f"{project_name}{BUNDLE_SUFFIX}")
+        try:
+            header = pack_bundle(args.project, output, args.compression)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        raw = sum(entry["size"] for entry in header["files"])
+        print(f"📦 Packed {len(header['files'])} files ({raw:,} bytes) into {output} "
+              f"({output.stat().st_size:,} bytes, {header['codec']})")
+        return
+
+    try:
+        bundle = ContextBundle(args.bundle)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    with bundle:
+        if args.command == "list":
+            print(f"📦 {bundle.path} ({bundle.header['codec']}, packed {bundle.header['created']}):\n")
+            for relative_path, entry in bundle.files.items():
+                print(f"  {entry['size']:>8,}  {relative_path}")
+                if args.sections:
+                    for section in entry["sections"]:
+                        print(f"  {section['size']:>8,}    {'#' * section['level'] or '-'} {section['path']}")
+            return
+
+        try:
+            if args.command == "show":
+                if args.section:
+                    sys.stdout.write(bundle.read_section(args.file, args.section))
+                else:
+                    sys.stdout.write(bundle.read_text(args.file))
+                return
+            outcome = bundle.unpack(args.project, args.force)
+        except (KeyError, ValueError) as e:
+            print(f"❌ {e.args[0]}")
+            sys.exit(1)
+
+    print(f"📂 Unpacked {args.bundle}: {len(outcome['written'])} written, "
+          f"{len(outcome['unchanged'])} unchanged, {len(outcome['kept'])} kept (locally modified)")
+    for relative_path in outcome["kept"]:
+        print(f"  - kept: {relative_path} (use --force to overwrite)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+LLM Context Knowledge Compiler
+
+This script automates the knowledge compilation step of session end
+(knowledge/session-knowledge-compilation.md). It streams the session logs
+in LM_context/archive/daily-logs/ (compressed archives included) and the
+current session handoff section by section, drops sections whose content
+was already seen - byte-identical after whitespace normalization, or a
+near duplicate by SimHash - and writes one canonical copy of each section
+to LM_context/static/knowledge-base/compiled-knowledge.md. Every canonical
+section lists the other places its content appeared.
+
+Sources are read twice (once to fingerprint, once to write) and the output
+is spooled to a temporary file as it is produced, so memory use stays
+bounded by the largest single section plus the per-section fingerprints,
+rather than the archive size.
+
+Usage:
+    python3 context_compiler.py /path/to/project
+    python3 context_compiler.py /path/to/project --dry-run
+    python3 context_compiler.py /path/to/project --include knowledge --include LM_context/system-docs
+"""
+
+import io
+import re
+import sys
+import gzip
+import json
+import argparse
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from context_sections import iter_sections, content_digest, file_digest, new_hasher, simhash, hamming_distance, SIMHASH_BITS
+from context_budget import estimate_tokens
+from context_journal import atomic_write
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DAILY_LOGS_DIR = "LM_context/archive/daily-logs"
+HANDOFF_FILE = "LM_context/dynamic/session-handoff.md"
+OUTPUT_FILE = "LM_context/static/knowledge-base/compiled-knowledge.md"
+SOURCE_SUFFIXES = (".md", ".md.gz", ".md.zst")
+
+# Sections within this many bits of an earlier one are near duplicates
+NEAR_DUPLICATE_DISTANCE = 8
+# Shorter sections are only deduplicated when byte-identical
+NEAR_DUPLICATE_MIN_WORDS = 30
+SHINGLE_SIZE = 3
+MAX_LISTED_REFERENCES = 5
+# Pigeonhole: two hashes within NEAR_DUPLICATE_DISTANCE bits share at least one band
+SIMHASH_BANDS = NEAR_DUPLICATE_DISTANCE + 1
+
+WORD_PATTERN = re.compile(r"\w+")
+GENERATED_MARKERS = ("<!-- archive-pointer -->", "<!-- compiled-from", "<!-- archived from")
+
+
+def open_source(path: Path) -> io.TextIOBase:
+    """Open a markdown source as a text stream, decompressing on the fly."""
+    if path.name.endswith(".gz"):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    if path.name.endswith(".zst"):
+        if zstandard is None:
+            raise ValueError(f"{path.name} is zstd-compressed but the zstandard module is not installed")
+        raw = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(raw, encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def section_body(section: Dict) -> str:
+    """The section text without its heading line."""
+    if section["level"] == 0:
+        return section["text"]
+    return section["text"].partition("\n")[2]
+
+
+def normalized(text: str) -> str:
+    """Collapse whitespace so reflowed copies hash the same."""
+    return " ".join(text.split())
+
+
+def near_duplicate_hash(words: List[str]) -> int:
+    """SimHash over overlapping word shingles."""
+    features: Dict[str, float] = {}
+    for start in range(max(1, len(words) - SHINGLE_SIZE + 1)):
+        shingle = " ".join(words[start:start + SHINGLE_SIZE])
+        features[shingle] = features.get(shingle, 0.0) + 1.0
+    return simhash(features)
+
+
+def simhash_bands(value: int) -> List[Tuple[int, int]]:
+    width = SIMHASH_BITS // SIMHASH_BANDS
+    return [(band, (value >> (band * width)) & ((1 << width) - 1)) for band in range(SIMHASH_BANDS)]
+
+
+class KnowledgeCompiler:
+    def __init__(self, project_dir: str, includes: Optional[List[str]] = None):
+        self.project_dir = Path(project_dir).resolve()
+        if self.project_dir.name == "LM_context":
+            self.project_dir = self.project_dir.parent
+        self.output_path = self.project_dir / OUTPUT_FILE
+        self.includes = includes or []
+
+        # Canonical sections in first-seen order, keyed by their location
+        self.canonical: Dict[Tuple[str, int], Dict] = {}
+        self.by_digest: Dict[str, Tuple[str, int]] = {}
+        self.bands: Dict[Tuple[int, int], List[Tuple[int, Tuple[str, int]]]] = {}
+        self.stats = {"sources": 0, "sections": 0, "canonical": 0, "exact_duplicates": 0,
+                      "near_duplicates": 0, "input_tokens": 0, "output_tokens": 0}
+
+    def source_files(self) -> List[str]:
+        """Sources in compilation order: daily logs by name (date), handoff, then includes."""
+        sources = []
+        for directory in [DAILY_LOGS_DIR] + self.includes:
+            root = self.project_dir / directory
+            if root.is_dir():
+                sources += sorted(
+                    path.relative_to(self.project_dir).as_posix() for path in root.rglob("*")
+                    if path.is_file() and path.name.endswith(SOURCE_SUFFIXES)
+                    and not any(part.startswith(".") for part in path.relative_to(root).parts)
+                )
+            elif root.is_file():
+                sources.append(directory)
+            if directory == DAILY_LOGS_DIR and (self.project_dir / HANDOFF_FILE).exists():
+                sources.append(HANDOFF_FILE)
+        output = self.output_path.relative_to(self.project_dir).as_posix()
+        return list(dict.fromkeys(source for source in sources if source != output))
+
+    def stream_sections(self, relative_path: str) -> Iterator[Dict]:
+        """Yield the non-empty, non-generated sections of one source."""
+        with open_source(self.project_dir / relative_path) as stream:
+            for section in iter_sections(stream):
+                body = section_body(section).strip()
+                if not body or body.startswith(GENERATED_MARKERS):
+                    continue
+                yield section
+
+    def _find_near_duplicate(self, value: int) -> Optional[Tuple[str, int]]:
+        for band in simhash_bands(value):
+            for candidate, location in self.bands.get(band, []):
+                if hamming_distance(candidate, value) <= NEAR_DUPLICATE_DISTANCE:
+                    return location
+        return None
+
+    def fingerprint_pass(self) -> None:
+        """First pass: pick the canonical copy of every section and collect references."""
+        for relative_path in self.source_files():
+            self.stats["sources"] += 1
+            for section in self.stream_sections(relative_path):
+                self.stats["sections"] += 1
+                body = section_body(section)
+                self.stats["input_tokens"] += estimate_tokens(section["text"])
+                location = (relative_path, section["start_line"])
+                reference = {"path": relative_path, "line": section["start_line"], "heading": section["path"]}
+
+                # Short bodies ("- None", "**Status:** ✅") only repeat the
+                # same knowledge under the same heading
+                words = WORD_PATTERN.findall(body.lower())
+                is_short = len(words) < NEAR_DUPLICATE_MIN_WORDS
+                digest = content_digest(normalized((section["title"] + "\n" if is_short else "") + body))
+                if digest in self.by_digest:
+                    self.canonical[self.by_digest[digest]]["references"].append(dict(reference, kind="exact"))
+                    self.stats["exact_duplicates"] += 1
+                    continue
+
+                value = None if is_short else near_duplicate_hash(words)
+                original = self._find_near_duplicate(value) if value is not None else None
+                if original is not None:
+                    self.canonical[original]["references"].append(dict(reference, kind="near"))
+                    self.by_digest[digest] = original
+                    self.stats["near_duplicates"] += 1
+                    continue
+
+                self.by_digest[digest] = location
+                self.canonical[location] = {"heading": section["path"], "level": section["level"], "references": []}
+                if value is not None:
+                    for band in simhash_bands(value):
+                        self.bands.setdefault(band, []).append((value, location))
+        self.stats["canonical"] = len(self.canonical)
+
+    def write_pass(self) -> Iterator[str]:
+        """Second pass: stream the sources again and yield the output section by section."""
+        yield "\n".join([
+            "# Compiled Knowledge Base",
+            f"<!-- compiled-from {self.stats['sources']} sources by context_compiler.py; edit the sources, not this file -->",
+            "",
+            f"{self.stats['canonical']} unique sections from {self.stats['sections']} "
+            f"({self.stats['exact_duplicates']} exact and {self.stats['near_duplicates']} near duplicates folded in).",
+            ""
+        ]) + "\n"
+        for relative_path in self.source_files():
+            emitted_header = False
+            # Headings of skipped sections, emitted when a subsection is kept
+            pending: List[Dict] = []
+            with open_source(self.project_dir / relative_path) as stream:
+                for section in iter_sections(stream):
+                    while pending and pending[-1]["level"] >= section["level"]:
+                        pending.pop()
+                    entry = self.canonical.get((relative_path, section["start_line"]))
+                    if entry is None:
+                        if section["level"] > 0:
+                            pending.append(section)
+                        continue
+                    lines = []
+                    if not emitted_header:
+                        lines += [f"## 📄 {relative_path}", ""]
+                        emitted_header = True
+                    for parent in pending:
+                        lines += [self._heading(parent), ""]
+                    pending = []
+                    lines.append(self._heading(section))
+                    if entry["references"]:
+                        lines.append(f"<sub>📎 Also in: {self._references(entry['references'])}</sub>")
+                    lines += ["", section_body(section).strip(), ""]
+                    yield "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _heading(section: Dict) -> str:
+        """Nest a source heading below the per-source "##" heading."""
+        return "#" * min(6, section["level"] + 2 if section["level"] else 3) + " " + section["title"]
+
+    @staticmethod
+    def _references(references: List[Dict]) -> str:
+        shown = [
+            f"{ref['path']}:{ref['line']}" + (" (near)" if ref["kind"] == "near" else "")
+            for ref in references[:MAX_LISTED_REFERENCES]
+        ]
+        if len(references) > MAX_LISTED_REFERENCES:
+            shown.append(f"+{len(references) - MAX_LISTED_REFERENCES} more")
+        return ", ".join(shown)
+
+    def compile(self, dry_run: bool = False) -> Dict:
+        """Compile the knowledge base; unchanged output is not rewritten."""
+        self.fingerprint_pass()
+        self.stats["output_tokens"] = 0
+        self.stats["output_path"] = str(self.output_path)
+
+        hasher = new_hasher()
+        with tempfile.NamedTemporaryFile(prefix="compiled-knowledge-", suffix=".md") as spool:
+            for chunk in self.write_pass():
+                self.stats["output_tokens"] += estimate_tokens(chunk)
+                data = chunk.encode('utf-8')
+                hasher.update(data)
+                if not dry_run:
+                    spool.write(data)
+            spool.flush()
+
+            unchanged = self.output_path.exists() and file_digest(self.output_path) == hasher.hexdigest()
+            self.stats["written"] = not dry_run and not unchanged
+            if self.stats["written"]:
+                atomic_write(self.output_path, None, clone_from=Path(spool.name))
+        return self.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile session logs into a deduplicated static/knowledge-base/",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Session end: fold archived logs and the handoff into the knowledge base
+  python3 context_compiler.py /Users/vn/ws/melexis-simple
+
+  # See how much duplicated text there is without writing anything
+  python3 context_compiler.py /Users/vn/ws/LLM_Context_System --include knowledge --include LM_context/system-docs --dry-run
+        """
+    )
+
+    parser.add_argument(
+        "project",
+        nargs="?",
+        default=".",
+        help="Project directory or its LM_context/ directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        help="Extra directory or file (relative to the project) to compile; may be repeated"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report duplicates without writing the knowledge base")
+    parser.add_argument("--json", action="store_true", help="Print statistics as JSON")
+
+    args = parser.parse_args()
+
+    compiler = KnowledgeCompiler(args.project, args.include)
+    if not (compiler.project_dir / "LM_context").is_dir():
+        print(f"❌ LM_context not found in {compiler.project_dir}")
+        sys.exit(1)
+
+    started = datetime.now()
+    try:
+        stats = compiler.compile(args.dry_run)
+    except (OSError, ValueError, EOFError) as e:
+        print(f"❌ Compilation failed: {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return
+
+    if stats["written"]:
+        print(f"📚 Knowledge base written: {stats['output_path']}")
+    elif args.dry_run:
+        print(f"🔍 Dry run - would write: {stats['output_path']}")
+    else:
+        print(f"✅ Knowledge base already up to date: {stats['output_path']}")
+    print(f"   {stats['sources']} sources, {stats['sections']} sections → {stats['canonical']} canonical "
+          f"({stats['exact_duplicates']} exact, {stats['near_duplicates']} near duplicates)")
+    # Small inputs can come out larger once headings and references are added
+    if stats["output_tokens"] < stats["input_tokens"]:
+        saving = f"{100 * (1 - stats['output_tokens'] / stats['input_tokens']):.0f}% saved"
+    else:
+        saving = "no saving, headings and references outweigh the duplicates"
+    print(f"   ~{stats['output_tokens']} tokens vs ~{stats['input_tokens']} in the sources ({saving}, "
+          f"{(datetime.now() - started).total_seconds():.2f}s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+LLM Context Failed-Solutions Index
+
+This script fingerprints every entry in LM_context/dynamic/failed-solutions/
+so a session can ask "did we already try this?" instead of reading the whole
+directory. Each entry (one "## ..." section of a *-failures.md file) is
+normalized into its component, the commands it tried and its error
+signature. Each part keeps its set of word tokens (compound words like
+opencv-python also count as their parts) and a 64-bit SimHash. A short
+query such as a proposed approach is scored by how many of its tokens an
+entry contains; a long one such as an error log is compared by SimHash
+Hamming distance. Only the matching entries are printed for loading into
+context. The index lives in LM_context/.index/failures.json and is updated
+incrementally from file sizes and mtimes.
+
+Usage:
+    python3 context_failures.py lookup "pip install opencv in the system python" --project /path/to/project
+    python3 context_failures.py lookup --error-log build.log --project /path/to/project
+    python3 context_failures.py index --project /path/to/project
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from context_sections import parse_sections, iter_markdown_files, simhash, hamming_distance, SIMHASH_BITS, PREAMBLE
+
+INDEX_DIR = ".index"
+FAILURE_INDEX_FILENAME = "failures.json"
+FAILED_SOLUTIONS_DIR = "dynamic/failed-solutions"
+INDEX_VERSION = 2
+
+# Largest Hamming distance (of 64 bits) still reported as a match
+DEFAULT_MAX_DISTANCE = 20
+
+# Queries with fewer normalized words are matched by token overlap: SimHash
+# of a few words says little about a long entry that contains them
+SHORT_QUERY_WORDS = 30
+# Smallest share of a short query's tokens an entry must contain
+DEFAULT_MIN_OVERLAP = 0.6
+
+# Error log lines worth fingerprinting; everything else is noise
+ERROR_LINE_PATTERN = re.compile(
+    r"error|exception|fail|fatal|denied|not found|no such|cannot|can't|unable|traceback|"
+    r"segmentation|timed? ?out|refused|undefined|missing|abort", re.IGNORECASE
+)
+MAX_ERROR_LINES = 20
+
+# Values that differ between otherwise identical failures
+VOLATILE_PATTERNS = [
+    (re.compile(r"\b0x[0-9a-f]+\b"), " hex "),
+    (re.compile(r"\b[0-9a-f]{12,}\b"), " hash "),
+    (re.compile(r"(?:[\w.~-]*/)+([\w.-]+)"), r" \1 "),
+    (re.compile(r"\d+"), " n "),
+]
+WORD_PATTERN = re.compile(r"[a-z_][a-z0-9_.+-]*[a-z0-9_+]|[a-z]")
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on",
+    "or", "that", "the", "this", "to", "was", "with", "we", "n", "failed", "approach", "tried"
+}
+
+FIELD_PATTERN = re.compile(r"^\s*[-*]*\s*\*\*([^*:]+):?\*\*:?\s*(.*)$")
+ERROR_FIELDS = {"error message", "error", "symptoms", "root cause"}
+COMPONENT_FIELDS = {"component", "category", "area"}
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase text, mask volatile values and drop stop words."""
+    text = text.lower()
+    for pattern, replacement in VOLATILE_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return [word for word in WORD_PATTERN.findall(text) if word not in STOP_WORDS]
+
+
+def stem(word: str) -> str:
+    """Strip common English endings so "hangs" and "hanging" match "hang"."""
+    for suffix in ("ing", "ed", "es", "s"):
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    return word
+
+
+def tokens(text: str) -> List[str]:
+    """Sorted distinct stemmed tokens of text; compound words also add their parts."""
+    found = set()
+    for word in normalize_words(text):
+        found.add(stem(word))
+        parts = [part for part in re.split(r"[-._+]+", word) if part and part not in STOP_WORDS]
+        if len(parts) > 1:
+            found.update(stem(part) for part in parts)
+    return sorted(found)
+
+
+def fingerprint(text: str) -> Optional[int]:
+    """SimHash of a text's normalized words and word pairs (None when empty)."""
+    words = normalize_words(text)
+    if not words:
+        return None
+    features: Dict[str, float] = {}
+    for index, word in enumerate(words):
+        features[word] = features.get(word, 0.0) + 1.0
+        if index + 1 < len(words):
+            pair = f"{word} {words[index + 1]}"
+            features[pair] = features.get(pair, 0.0) + 1.0
+    return simhash(features)
+
+
+def error_signature(log_text: str) -> str:
+    """Pick the lines of an error log that describe the failure."""
+    lines = []
+    seen = set()
+    for line in log_text.splitlines():
+        if not ERROR_LINE_PATTERN.search(line):
+            continue
+        key = " ".join(normalize_words(line))
+        if key and key not in seen:
+            seen.add(key)
+            lines.append(line.strip())
+    if not lines:
+        lines = [line.strip() for line in log_text.splitlines() if line.strip()][-MAX_ERROR_LINES:]
+    return "\n".join(lines[:MAX_ERROR_LINES])
+
+
+def split_entries(text: str) -> List[Dict]:
+    """Group a failures file into entries: one per "##" section, subsections included.
+
+    A file without "##" headings is one entry per "#" section, or a single
+    entry when it has no headings at all.
+    """
+    sections = parse_sections(text)
+    levels = {section["level"] for section in sections}
+    entry_level = 2 if 2 in levels else 1 if 1 in levels else 0
+    entries = []
+    for section in sections:
+        if section["level"] == entry_level:
+            entries.append({"title": section["title"], "start_line": section["start_line"], "text": section["text"]})
+        elif section["level"] > entry_level and entries:
+            entries[-1]["text"] += section["text"]
+    for entry in entries:
+        entry["end_line"] = entry["start_line"] + len(entry["text"].splitlines()) - 1
+    return entries
+
+
+def describe_entry(entry: Dict, file_component: str) -> Dict:
+    """Normalize one failure entry into component, approach and error parts."""
+    component = file_component
+    commands: List[str] = []
+    errors: List[str] = []
+    in_fence = False
+    for line in entry["text"].splitlines():
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            if line.strip() and not line.strip().startswith("#"):
+                commands.append(line)
+            continue
+        field = FIELD_PATTERN.match(line)
+        if field:
+            name = field.group(1).strip().lower()
+            if name in ERROR_FIELDS:
+                errors.append(field.group(2))
+            elif name in COMPONENT_FIELDS and field.group(2).strip():
+                component = field.group(2).strip()
+    title = re.sub(r"[❌✅⚠️]", "", entry["title"]).strip()
+    return {
+        "title": title,
+        "component": component,
+        "approach_text": "\n".join(commands) or title,
+        "error_text": "\n".join(errors)
+    }
+
+
+class FailureIndex:
+    def __init__(self, project_dir: str):
+        self.project_dir = Path(project_dir).resolve()
+        if self.project_dir.name == "LM_context":
+            self.project_dir = self.project_dir.parent
+        self.context_dir = self.project_dir / "LM_context"
+        self.failures_dir = self.context_dir / FAILED_SOLUTIONS_DIR
+        self.index_path = self.context_dir / INDEX_DIR / FAILURE_INDEX_FILENAME
+        self.index = self.load()
+        self.stats = {"files": 0, "entries": 0, "files_read": 0}
+
+    def load(self) -> Dict:
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                if index.get("version") == INDEX_VERSION:
+                    return index
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable failure index: {e}", file=sys.stderr)
+        return {"version": INDEX_VERSION, "files": {}}
+
+    def update(self) -> Dict:
+        """Re-fingerprint failure files whose size or mtime changed."""
+        old_files = self.index["files"]
+        new_files = {}
+        if self.failures_dir.is_dir():
+            for relative_path in iter_markdown_files(self.failures_dir):
+                path = self.failures_dir / relative_path
+                st = path.stat()
+                previous = old_files.get(relative_path)
+                if previous and previous["size"] == st.st_size and previous["mtime_ns"] == st.st_mtime_ns:
+                    new_files[relative_path] = previous
+                    continue
+                self.stats["files_read"] += 1
+                new_files[relative_path] = {
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "entries": self._fingerprint_file(path)
+                }
+
+        self.stats["files"] = len(new_files)
+        self.stats["entries"] = sum(len(item["entries"]) for item in new_files.values())
+        if new_files != old_files:
+            self.index["files"] = new_files
+            self.save()
+        return self.stats
+
+    @staticmethod
+    def _fingerprint_file(path: Path) -> List[Dict]:
+        file_component = re.sub(r"-?failures?$", "", path.stem) or path.stem
+        entries = []
+        for entry in split_entries(path.read_text(encoding='utf-8', errors='replace')):
+            if entry["title"] == PREAMBLE:
+                entry["title"] = path.stem
+            described = describe_entry(entry, file_component)
+            approach = fingerprint(described["approach_text"])
+            error = fingerprint(described["error_text"])
+            entry_tokens = tokens(entry["text"])
+            entries.append({
+                "title": described["title"],
+                "component": described["component"],
+                "start_line": entry["start_line"],
+                "end_line": entry["end_line"],
+                "fingerprints": {
+                    "approach": approach,
+                    "error": error,
+                    "entry": fingerprint(entry["text"])
+                },
+                "tokens": {
+                    "approach": tokens(described["approach_text"]),
+                    "error": tokens(described["error_text"]),
+                    "entry": entry_tokens
+                }
+            })
+        return entries
+
+    def save(self) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(FAILURE_INDEX_FILENAME + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f)
+        tmp_path.replace(self.index_path)
+
+    def lookup(self, text: str, max_distance: int = DEFAULT_MAX_DISTANCE, top_k: int = 5,
+               component: Optional[str] = None, min_overlap: float = DEFAULT_MIN_OVERLAP) -> List[Dict]:
+        """Return past failures whose approach, error or whole entry is near text, closest first.
+
+        Short texts are matched by token overlap (see lookup_tokens), long
+        ones such as error logs by SimHash distance.
+        """
+        if len(normalize_words(text)) < SHORT_QUERY_WORDS:
+            return self.lookup_tokens(text, min_overlap, top_k, component)
+        query = fingerprint(text)
+        if query is None:
+            return []
+        matches: List[Tuple[int, str, Dict]] = []
+        for relative_path, entry in self._entries(component):
+            distances = [
+                (hamming_distance(query, value), field)
+                for field, value in entry["fingerprints"].items() if value is not None
+            ]
+            if not distances:
+                continue
+            distance, field = min(distances)
+            if distance <= max_distance:
+                matches.append((distance, field, dict(entry, path=f"{FAILED_SOLUTIONS_DIR}/{relative_path}")))
+        matches.sort(key=lambda match: (match[0], match[2]["path"], match[2]["start_line"]))
+        return [
+            dict(entry, distance=distance, matched_on=field,
+                 similarity=round(1 - distance / SIMHASH_BITS, 3))
+            for distance, field, entry in matches[:top_k]
+        ]
+
+    def lookup_tokens(self, text: str, min_overlap: float = DEFAULT_MIN_OVERLAP, top_k: int = 5,
+                      component: Optional[str] = None) -> List[Dict]:
+        """Return past failures containing most of a short text's tokens, best first.
+
+        An entry part scores the share of query tokens it contains; ties go
+        to the part with the higher Jaccard similarity, i.e. the tighter one.
+        """
+        query = set(tokens(text))
+        if not query:
+            return []
+        matches: List[Tuple[float, float, str, Dict]] = []
+        for relative_path, entry in self._entries(component):
+            scores = []
+            for field, field_tokens in entry["tokens"].items():
+                shared = len(query.intersection(field_tokens))
+                if shared:
+                    scores.append((shared / len(query), shared / len(query.union(field_tokens)), field))
+            if not scores:
+                continue
+            overlap, jaccard, field = max(scores)
+            if overlap >= min_overlap:
+                matches.append((overlap, jaccard, field, dict(entry, path=f"{FAILED_SOLUTIONS_DIR}/{relative_path}")))
+        matches.sort(key=lambda match: (-match[0], -match[1], match[3]["path"], match[3]["start_line"]))
+        return [
+            dict(entry, overlap=round(overlap, 3), jaccard=round(jaccard, 3), matched_on=field,
+                 similarity=round(overlap, 3))
+            for overlap, jaccard, field, entry in matches[:top_k]
+        ]
+
+    def _entries(self, component: Optional[str] = None) -> Iterator[Tuple[str, Dict]]:
+        """Indexed entries with their file, optionally of one component."""
+        for relative_path, item in self.index["files"].items():
+            for entry in item["entries"]:
+                if component and component.lower() not in entry["component"].lower():
+                    continue
+                yield relative_path, entry
+
+    def entry_text(self, match: Dict) -> str:
+        """Read the lines of one matched entry."""
+        lines = (self.context_dir / match["path"]).read_text(encoding='utf-8', errors='replace').splitlines(keepends=True)
+        return "".join(lines[match["start_line"] - 1:match["end_line"]])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find near-duplicate past failures in dynamic/failed-solutions/",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Before suggesting an approach: was it tried already?
+  python3 context_failures.py lookup "pip install opencv in the system python" --project /Users/vn/ws/melexis-simple
+
+  # After a failure: has this error been seen before?
+  python3 context_failures.py lookup --error-log build.log --project /Users/vn/ws/melexis-simple
+  make 2>&1 | python3 context_failures.py lookup --error-log -
+
+  # Refresh the fingerprints only
+  python3 context_failures.py index --project /Users/vn/ws/melexis-simple
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    lookup_parser = subparsers.add_parser("lookup", help="Print past failures similar to an approach or error log")
+    lookup_parser.add_argument("text", nargs="?", help="Proposed approach, command or error message")
+    lookup_parser.add_argument("--error-log", help="Error log file to match ('-' for stdin)")
+    lookup_parser.add_argument("--component", help="Only match entries of this component")
+    lookup_parser.add_argument("--top-k", type=int, default=5, help="Maximum entries to return (default: 5)")
+    lookup_parser.add_argument(
+        "--max-distance",
+        type=int,
+        default=DEFAULT_MAX_DISTANCE,
+        help=f"Largest Hamming distance of {SIMHASH_BITS} bits counted as similar for long queries "
+             f"(default: {DEFAULT_MAX_DISTANCE})"
+    )
+    lookup_parser.add_argument(
+        "--min-overlap",
+        type=float,
+        default=DEFAULT_MIN_OVERLAP,
+        help=f"Smallest share of a short query's words an entry must contain (default: {DEFAULT_MIN_OVERLAP})"
+    )
+    lookup_parser.add_argument("--brief", action="store_true", help="List matches without printing the entries")
+    lookup_parser.add_argument("--json", action="store_true", help="Print matches as JSON")
+
+    index_parser = subparsers.add_parser("index", help="Update the fingerprint index without looking anything up")
+
+    for sub in (lookup_parser, index_parser):
+        sub.add_argument(
+            "--project",
+            default=".",
+            help="Project directory or its LM_context/ directory (default: current directory)"
+        )
+
+    args = parser.parse_args()
+
+    index = FailureIndex(args.project)
+    if not index.context_dir.is_dir():
+        print(f"❌ LM_context not found in {index.project_dir}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    stats = index.update()
+    if args.command == "index":
+        print(f"🧬 Failure index: {index.index_path}")
+        print(f"   {stats['entries']} entries in {stats['files']} files "
+              f"({stats['files_read']} re-read, {time.perf_counter() - started:.2f}s)")
+        return
+
+    if args.error_log:
+        log_text = sys.stdin.read() if args.error_log == "-" else Path(args.error_log).read_text(encoding='utf-8', errors='replace')
+        query = error_signature(log_text)
+    elif args.text:
+        query = args.text
+    else:
+        lookup_parser.error("give an approach/error text or --error-log")
+
+    lookup_started = time.perf_counter()
+    matches = index.lookup(query, args.max_distance, args.top_k, args.component, args.min_overlap)
+    lookup_ms = (time.perf_counter() - lookup_started) * 1000
+
+    if args.json:
+        print(json.dumps(matches, indent=2, ensure_ascii=False))
+        return
+
+    if not matches:
+        print(f"✅ No similar failure among {stats['entries']} recorded entries ({lookup_ms:.1f} ms)")
+        return
+
+    print(f"⚠️ {len(matches)} similar past failures among {stats['entries']} entries ({lookup_ms:.1f} ms):\n")
+    for match in matches:
+        print(f"❌ {match['title']}  (similarity {match['similarity']}, on {match['matched_on']})")
+        print(f"   📄 {match['path']}:{match['start_line']}-{match['end_line']}")
+    if args.brief:
+        return
+    for match in matches:
+        print(f"\n<!-- {match['path']}:{match['start_line']}-{match['end_line']} -->")
+        print(index.entry_text(match).rstrip())
+
+if __name__ == "__main__":
+    main()
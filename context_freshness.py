@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+LLM Context Freshness Index
+
+This script keeps a machine-readable freshness index for a deployed
+LM_context/ tree at LM_context/.index/freshness.json (per-file hash, last
+change and the sections changed since the last session close) and rewrites
+the Context Status block in dynamic/session-handoff.md from it, so the LLM
+can skip files that have not changed.
+
+Usage:
+    python3 context_freshness.py /path/to/project
+    python3 context_freshness.py /path/to/project --close-session
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from context_sections import content_digest, section_digests, iter_markdown_files, resolve_context_dir
+from context_journal import WriteJournal, atomic_write
+
+INDEX_DIR = ".index"
+FRESHNESS_FILENAME = "freshness.json"
+HANDOFF_FILE = "dynamic/session-handoff.md"
+
+STATUS_START = "<!-- context-status:start -->"
+STATUS_END = "<!-- context-status:end -->"
+STATUS_HEADINGS = ("Context Freshness Status", "Context Status")
+
+# Lines of the Context Status block: label -> file or directory (trailing slash)
+STATUS_ENTRIES = [
+    ("Environment", "static/environment.md"),
+    ("Current Iteration", "dynamic/current-iteration.md"),
+    ("Assumptions", "evolving/assumptions-log.md"),
+    ("Failed Solutions", "dynamic/failed-solutions/"),
+    ("Working Solutions", "dynamic/working-solutions.md")
+]
+
+
+class FreshnessIndex:
+    def __init__(self, context_dir: str):
+        self.context_dir = resolve_context_dir(context_dir)
+        self.index_path = self.context_dir / INDEX_DIR / FRESHNESS_FILENAME
+        self.index = self.load()
+
+    def load(self) -> Dict:
+        """Load the previous index, or start an empty one."""
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable freshness index: {e}", file=sys.stderr)
+        return {"version": 1, "session_closed": None, "files": {}, "baseline": {}}
+
+    def save(self) -> None:
+        """Write the index to LM_context/.index/freshness.json (atomically, the watcher rewrites it too)."""
+        atomic_write(self.index_path, json.dumps(self.index, indent=1, sort_keys=True).encode('utf-8'))
+
+    def _file_entry(self, relative_path: str, now: str) -> Dict:
+        """Build the index entry for one file, reusing it when unchanged."""
+        path = self.context_dir / relative_path
+        st = path.stat()
+        previous = self.index["files"].get(relative_path)
+
+        if previous and previous["size"] == st.st_size and previous["mtime_ns"] == st.st_mtime_ns:
+            entry = dict(previous)
+        else:
+            text = path.read_text(encoding='utf-8', errors='replace')
+            digest = content_digest(text)
+            if previous and previous["digest"] == digest:
+                last_changed = previous["last_changed"]
+            elif previous:
+                last_changed = now
+            else:
+                last_changed = datetime.fromtimestamp(st.st_mtime).isoformat(timespec='seconds')
+            entry = {
+                "digest": digest,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "last_changed": last_changed,
+                "sections": section_digests(text)
+            }
+
+        baseline = self.index["baseline"].get(relative_path)
+        if baseline is None:
+            entry["status"] = "new" if self.index["session_closed"] else "unchanged"
+            entry["changed_sections"] = list(entry["sections"]) if self.index["session_closed"] else []
+        elif baseline["digest"] == entry["digest"]:
+            entry["status"] = "unchanged"
+            entry["changed_sections"] = []
+        else:
+            changed = [
+                section for section, digest in entry["sections"].items()
+                if baseline["sections"].get(section) != digest and not self._is_status_section(section)
+            ]
+            removed = [
+                section for section in baseline["sections"]
+                if section not in entry["sections"] and not self._is_status_section(section)
+            ]
+            # A rewrite of the generated status block alone is not a change
+            entry["status"] = "changed" if changed or removed else "unchanged"
+            entry["changed_sections"] = changed + [f"{section} (removed)" for section in removed]
+        return entry
+
+    @staticmethod
+    def _is_status_section(section_path: str) -> bool:
+        """True for the generated Context Status section itself."""
+        return section_path.split(" > ")[-1] in STATUS_HEADINGS
+
+    def update(self, close_session: bool = False, rewrite_status: bool = True) -> Dict:
+        """Refresh the index against the files on disk.
+
+        With close_session the current state becomes the new baseline, so
+        the next session sees every file as unchanged until it is edited.
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        if not self.index["session_closed"] and not self.index["baseline"]:
+            close_session = True
+
+        files = [path for path in iter_markdown_files(self.context_dir, ["archive"]) if path != HANDOFF_FILE]
+        new_files = {relative_path: self._file_entry(relative_path, now) for relative_path in files}
+        self.index["removed"] = sorted(set(self.index["baseline"]) - set(new_files) - {HANDOFF_FILE})
+        self.index["files"] = new_files
+
+        if close_session:
+            self._set_baseline(now)
+
+        if rewrite_status and (self.context_dir / HANDOFF_FILE).exists():
+            self.rewrite_context_status()
+
+        # Hash the handoff last, after its status block has been rewritten
+        if (self.context_dir / HANDOFF_FILE).exists():
+            self.index["files"][HANDOFF_FILE] = self._file_entry(HANDOFF_FILE, now)
+            if close_session:
+                self._set_baseline(now)
+
+        self.index["updated"] = now
+        self.save()
+        return self.index
+
+    def _set_baseline(self, now: str) -> None:
+        """Record the current files as the session-close baseline."""
+        self.index["session_closed"] = now
+        self.index["baseline"] = {
+            relative_path: {"digest": entry["digest"], "sections": entry["sections"]}
+            for relative_path, entry in self.index["files"].items()
+        }
+        self.index["removed"] = []
+        for entry in self.index["files"].values():
+            entry["status"] = "unchanged"
+            entry["changed_sections"] = []
+
+    def entry_status(self, target: str) -> Optional[Dict]:
+        """Summarize the status of a file or directory (trailing slash)."""
+        if target.endswith("/"):
+            entries = {path: entry for path, entry in self.index["files"].items() if path.startswith(target)}
+            if not entries:
+                return None
+            changed = [path for path, entry in entries.items() if entry["status"] != "unchanged"]
+            return {
+                "status": "changed" if changed else "unchanged",
+                "last_changed": max(entry["last_changed"] for entry in entries.values()),
+                "detail": [Path(path).name for path in changed]
+            }
+        entry = self.index["files"].get(target)
+        if entry is None:
+            return None
+        return {"status": entry["status"], "last_changed": entry["last_changed"], "detail": entry["changed_sections"]}
+
+    def status_lines(self) -> List[str]:
+        """Render the Context Status bullet lines from the index."""
+        closed = (self.index["session_closed"] or "")[:10]
+        lines = []
+        for label, target in STATUS_ENTRIES:
+            status = self.entry_status(target)
+            if status is None:
+                lines.append(f"- **{label}:** ➖ NOT PRESENT")
+            elif status["status"] == "unchanged":
+                lines.append(f"- **{label}:** ✅ UNCHANGED (since {closed}, last change {status['last_changed'][:10]})")
+            else:
+                detail = ", ".join(status["detail"][:5])
+                if len(status["detail"]) > 5:
+                    detail += f", +{len(status['detail']) - 5} more"
+                word = "NEW" if status["status"] == "new" else "UPDATED"
+                lines.append(f"- **{label}:** ⚠️ {word} {status['last_changed'][:10]}" + (f" - {detail}" if detail else ""))
+        lines.append("")
+        lines.append(f"**LLM Optimization:** Only read files marked ⚠️ - generated from `.index/{FRESHNESS_FILENAME}`")
+        return lines
+
+    def rewrite_context_status(self) -> None:
+        """Replace the Context Status block in session-handoff.md.
+
+        The generated block is wrapped in marker comments. On first run an
+        existing "Context Freshness Status"/"Context Status" section body is
+        replaced; otherwise a new section is inserted before the first
+        second-level heading.
+        """
+        handoff_path = self.context_dir / HANDOFF_FILE
+        lines = handoff_path.read_text(encoding='utf-8').split("\n")
+        block = [STATUS_START] + self.status_lines() + [STATUS_END]
+
+        if STATUS_START in lines and STATUS_END in lines:
+            start = lines.index(STATUS_START)
+            end = lines.index(STATUS_END, start)
+            lines[start:end + 1] = block
+        else:
+            heading = next((i for i, line in enumerate(lines)
+                            if line.lstrip("#").strip() in STATUS_HEADINGS and line.startswith("#")), None)
+            if heading is not None:
+                end = next((i for i in range(heading + 1, len(lines)) if lines[i].startswith("#")), len(lines))
+                lines[heading + 1:end] = [""] + block + [""]
+            else:
+                insert_at = next((i for i, line in enumerate(lines) if line.startswith("## ")), len(lines))
+                lines[insert_at:insert_at] = ["## Context Status", ""] + block + [""]
+
+        new_text = "\n".join(lines)
+        if new_text != handoff_path.read_text(encoding='utf-8'):
+            # Journaled, so context_journal.py rollback can restore the handoff
+            with WriteJournal(self.context_dir).begin("refresh Context Status") as batch:
+                batch.write_text(handoff_path, new_text, handoff_path.stat().st_mode & 0o7777)
+
+    def print_summary(self) -> None:
+        """Print which files must be read and which can be skipped."""
+        changed = [path for path, entry in self.index["files"].items() if entry["status"] != "unchanged"]
+        unchanged = [path for path, entry in self.index["files"].items() if entry["status"] == "unchanged"]
+        print(f"🕒 Freshness index: {self.index_path}")
+        print(f"   Last session close: {self.index['session_closed'] or 'never'}")
+        if changed:
+            print(f"\n⚠️ Changed since last session ({len(changed)}):")
+            for path in changed:
+                sections = self.index["files"][path]["changed_sections"]
+                print(f"  - {path}" + (f" ({', '.join(sections[:3])}{'...' if len(sections) > 3 else ''})" if sections else ""))
+        print(f"\n✅ Unchanged, safe to skip ({len(unchanged)}):")
+        for path in unchanged:
+            print(f"  - {path}")
+        if self.index.get("removed"):
+            print(f"\n🗑️ Removed: {', '.join(self.index['removed'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Maintain the LM_context freshness index and Context Status block",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Refresh the index and the Context Status block (e.g. at session start)
+  python3 context_freshness.py /Users/vn/ws/melexis-simple
+
+  # Mark the current state as the baseline at session end
+  python3 context_freshness.py /Users/vn/ws/melexis-simple --close-session
+        """
+    )
+
+    parser.add_argument(
+        "context_dir",
+        nargs="?",
+        default=".",
+        help="Project directory or its LM_context/ directory (default: current directory)"
+    )
+
+    parser.add_argument(
+        "--close-session",
+        action="store_true",
+        help="Record the current state as the session-close baseline"
+    )
+
+    parser.add_argument(
+        "--no-rewrite",
+        action="store_true",
+        help="Update the index without touching session-handoff.md"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the index as JSON"
+    )
+
+    args = parser.parse_args()
+
+    freshness = FreshnessIndex(args.context_dir)
+    if not freshness.context_dir.is_dir():
+        print(f"❌ LM_context not found: {freshness.context_dir}")
+        sys.exit(1)
+
+    index = freshness.update(close_session=args.close_session, rewrite_status=not args.no_rewrite)
+
+    if args.json:
+        print(json.dumps(index, indent=2))
+    else:
+        freshness.print_summary()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+LLM Context Write Journal
+
+Crash-safe, reversible writes into a project or framework tree. Every
+write goes to a temporary file next to its target, is fsynced and renamed
+into place. The writes of one run form a batch whose manifest
+(LM_context/.journal/<batch-id>.json) records each file's content hash
+before and after. Previous contents are kept once per distinct content in
+LM_context/.backups/, so a whole batch can be undone with one command.
+Only the last KEEP_BATCHES batches are kept: each committed batch prunes
+older manifests and the backups no remaining manifest refers to.
+
+Usage:
+    python3 context_journal.py list /path/to/project
+    python3 context_journal.py rollback 20250724-081858-3f2a /path/to/project
+    python3 context_journal.py prune --keep 10 /path/to/project
+"""
+
+import os
+import sys
+import json
+import shutil
+import secrets
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from context_sections import content_digest, file_digest
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+JOURNAL_DIR = ".journal"
+BACKUP_DIR = ".backups"
+
+# Batches kept for rollback; older ones are pruned when a batch commits
+KEEP_BATCHES = 50
+
+# ioctl(2) request that makes a copy-on-write clone (Btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+
+def fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory (no-op where unsupported)."""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def clone_file(source: Path, target: Path, link: str = "auto") -> str:
+    """Create target with source's content as cheaply as the filesystem allows.
+
+    link="hardlink" shares source's inode (only safe for immutable sources
+    such as content-addressed blobs); "auto" tries a copy-on-write reflink;
+    both fall back to a plain copy. Returns the method used.
+    """
+    if link == "hardlink":
+        try:
+            os.link(source, target)
+            return "hardlink"
+        except OSError:
+            pass
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        if link == "auto" and fcntl is not None:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return "reflink"
+            except OSError:
+                pass
+        shutil.copyfileobj(src, dst)
+    return "copy"
+
+
+def atomic_write(target: Path, data: Optional[bytes], mode: Optional[int] = None,
+                 copystat_from: Optional[Path] = None, clone_from: Optional[Path] = None,
+                 link: str = "auto") -> str:
+    """Write data (or clone_from's content) to target via a fsynced temp file and rename."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per thread too: the watch daemon and fleet deploys write from threads
+    tmp_path = target.with_name(f".{target.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+    method = "write"
+    try:
+        if clone_from is not None:
+            method = clone_file(clone_from, tmp_path, link)
+        else:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+        if method != "hardlink":
+            with open(tmp_path, 'rb+') as f:
+                os.fsync(f.fileno())
+            if copystat_from is not None:
+                shutil.copystat(copystat_from, tmp_path)
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    fsync_directory(target.parent)
+    return method
+
+
+class JournalBatch:
+    """One run's writes, recorded in a batch manifest before they happen."""
+
+    def __init__(self, journal: "WriteJournal", batch_id: str, description: str):
+        self.journal = journal
+        self.batch_id = batch_id
+        self.manifest = {
+            "id": batch_id,
+            "description": description,
+            # Batch ids only resolve seconds; this orders batches started in the same one
+            "started": datetime.now().isoformat(timespec='microseconds'),
+            "status": "open",
+            "entries": []
+        }
+
+    def __enter__(self) -> "JournalBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close("failed" if exc_type else "committed")
+
+    def _record(self, target: Path, after: str) -> None:
+        """Back up target's current content and add the change to the manifest.
+
+        The manifest names the change before the rename happens, so an
+        interrupted batch can still be rolled back.
+        """
+        before = None
+        before_mode = None
+        previous = None
+        if target.exists():
+            previous = target.read_bytes()
+            before = content_digest(previous)
+            before_mode = target.stat().st_mode & 0o7777
+
+        self.manifest["entries"].append({
+            "path": self.journal.relative(target),
+            "before": before,
+            "before_mode": before_mode,
+            "after": after
+        })
+        self.journal.save_manifest(self.manifest)
+        # Stored after the manifest names it, so a concurrent prune sees it referenced
+        if previous is not None:
+            self.journal.store_backup(previous)
+
+    def write_bytes(self, target: Path, data: bytes, mode: Optional[int] = None,
+                    copystat_from: Optional[Path] = None) -> None:
+        """Replace (or create) target with data, journaled."""
+        target = Path(target).resolve()
+        self._record(target, content_digest(data))
+        atomic_write(target, data, mode, copystat_from)
+
+    def write_text(self, target: Path, text: str, mode: Optional[int] = None) -> None:
+        self.write_bytes(target, text.encode('utf-8'), mode)
+
+    def copy_file(self, source: Path, target: Path, digest: Optional[str] = None, link: str = "auto",
+                  copystat_from: Optional[Path] = None) -> str:
+        """Copy source over target, journaled; returns how the content was placed.
+
+        The content is reflinked (or hardlinked, see clone_file) where the
+        filesystem allows. Mode and times come from copystat_from, default
+        source, like shutil.copy2. digest is source's blob digest if known.
+        """
+        target = Path(target).resolve()
+        self._record(target, digest or file_digest(source))
+        return atomic_write(target, None, copystat_from=copystat_from or Path(source),
+                            clone_from=Path(source), link=link)
+
+    def close(self, status: str = "committed") -> None:
+        """Finish the batch; an empty batch leaves no manifest behind."""
+        if self.manifest["status"] != "open":
+            return
+        self.manifest["status"] = status
+        self.manifest["finished"] = datetime.now().isoformat(timespec='seconds')
+        if self.manifest["entries"]:
+            self.journal.save_manifest(self.manifest)
+            if status == "committed":
+                try:
+                    self.journal.prune()
+                except OSError as e:
+                    print(f"⚠️ Could not prune {self.journal.journal_dir}: {e}", file=sys.stderr)
+
+
+class WriteJournal:
+    def __init__(self, root: Path):
+        root = Path(root).resolve()
+        if root.name == "LM_context":
+            root = root.parent
+        self.root = root
+        self.journal_dir = root / "LM_context" / JOURNAL_DIR
+        self.backup_dir = root / "LM_context" / BACKUP_DIR
+
+    def relative(self, path: Path) -> str:
+        """Path relative to the root, as stored in manifests."""
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def begin(self, description: str) -> JournalBatch:
+        """Start a new batch of writes."""
+        batch_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(2)}"
+        return JournalBatch(self, batch_id, description)
+
+    def backup_path(self, digest: str) -> Path:
+        return self.backup_dir / digest[:2] / digest
+
+    def store_backup(self, data: bytes) -> str:
+        """Keep one copy of data per distinct content; return its digest.
+
+        An existing backup is touched, which keeps a prune that started
+        before this batch's manifest was written from removing it.
+        """
+        digest = content_digest(data)
+        path = self.backup_path(digest)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            atomic_write(path, data)
+        return digest
+
+    def save_manifest(self, manifest: Dict) -> None:
+        atomic_write(self.journal_dir / f"{manifest['id']}.json",
+                     json.dumps(manifest, indent=1).encode('utf-8'))
+
+    def load_manifest(self, batch_id: str) -> Dict:
+        path = self.journal_dir / f"{batch_id}.json"
+        if not path.exists():
+            raise ValueError(f"Unknown batch: {batch_id}")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def batches(self) -> List[Dict]:
+        """All batch manifests, oldest first."""
+        if not self.journal_dir.is_dir():
+            return []
+        manifests = []
+        for path in sorted(self.journal_dir.glob("*.json")):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    manifests.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return sorted(manifests, key=lambda manifest: manifest["started"])
+
+    def prune(self, keep: int = KEEP_BATCHES) -> Dict[str, int]:
+        """Drop all but the newest keep batches, then unreferenced backups.
+
+        Open batches (still running, or interrupted) are never dropped.
+        """
+        started = datetime.now().timestamp()
+        outcome = {"batches_removed": 0, "backups_removed": 0, "bytes_freed": 0}
+        manifests = self.batches()
+        closed = [manifest for manifest in manifests if manifest["status"] != "open"]
+        for manifest in closed[:max(0, len(closed) - keep)]:
+            (self.journal_dir / f"{manifest['id']}.json").unlink(missing_ok=True)
+            manifests.remove(manifest)
+            outcome["batches_removed"] += 1
+        if not self.backup_dir.is_dir():
+            return outcome
+
+        referenced = {entry["before"] for manifest in manifests for entry in manifest["entries"]}
+        for backup in self.backup_dir.glob("*/*"):
+            if backup.name in referenced or backup.name.startswith('.'):
+                continue
+            try:
+                st = backup.stat()
+                if st.st_mtime >= started:
+                    continue
+                backup.unlink()
+            except FileNotFoundError:
+                continue
+            outcome["backups_removed"] += 1
+            outcome["bytes_freed"] += st.st_size
+        return outcome
+
+    def rollback(self, batch_id: str, force: bool = False) -> Dict:
+        """Restore every file a batch wrote to its content before the batch.
+
+        A file changed again since the batch is a conflict and is left
+        alone unless force is set. Files the batch created are removed.
+        """
+        manifest = self.load_manifest(batch_id)
+        if manifest["status"] == "rolled_back":
+            raise ValueError(f"Batch {batch_id} was already rolled back on {manifest['rolled_back']}")
+
+        outcome = {"restored": [], "removed": [], "unchanged": [], "conflicts": []}
+        for entry in reversed(manifest["entries"]):
+            target = self.root / entry["path"]
+            current = file_digest(target) if target.exists() else None
+            if current == entry["before"]:
+                outcome["unchanged"].append(entry["path"])
+                continue
+            if current != entry["after"] and not force:
+                outcome["conflicts"].append(entry["path"])
+                continue
+            if entry["before"] is None:
+                target.unlink()
+                fsync_directory(target.parent)
+                outcome["removed"].append(entry["path"])
+            else:
+                backup = self.backup_path(entry["before"])
+                if not backup.exists():
+                    outcome["conflicts"].append(f"{entry['path']} (backup {entry['before'][:12]} missing)")
+                    continue
+                atomic_write(target, backup.read_bytes(), entry.get("before_mode"))
+                outcome["restored"].append(entry["path"])
+
+        if not outcome["conflicts"]:
+            manifest["status"] = "rolled_back"
+            manifest["rolled_back"] = datetime.now().isoformat(timespec='seconds')
+            self.save_manifest(manifest)
+        return outcome
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="List journaled write batches and roll them back",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Show recent syncs and deployments into the framework
+  python3 context_journal.py list /path/to/llm-context-system
+
+  # Undo one of them
+  python3 context_journal.py rollback 20250724-081858-3f2a /path/to/llm-context-system
+
+  # Keep only the last 10 batches and the backups they need
+  python3 context_journal.py prune --keep 10 /path/to/llm-context-system
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    list_parser = subparsers.add_parser("list", help="List write batches")
+    rollback_parser = subparsers.add_parser("rollback", help="Undo every write of one batch")
+    rollback_parser.add_argument("batch_id", help="Batch id as shown by 'list'")
+    rollback_parser.add_argument("--force", action="store_true",
+                                 help="Also restore files that changed again after the batch")
+    prune_parser = subparsers.add_parser("prune", help="Drop old batches and the backups only they used")
+    prune_parser.add_argument("--keep", type=int, default=KEEP_BATCHES,
+                              help=f"Batches to keep (default: {KEEP_BATCHES})")
+
+    for sub in (list_parser, rollback_parser, prune_parser):
+        sub.add_argument(
+            "root",
+            nargs="?",
+            default=".",
+            help="Project or framework directory holding LM_context/ (default: current directory)"
+        )
+
+    args = parser.parse_args()
+
+    journal = WriteJournal(args.root)
+    if not (journal.root / "LM_context").is_dir():
+        print(f"❌ LM_context not found in {journal.root}")
+        sys.exit(1)
+
+    if args.command == "list":
+        batches = journal.batches()
+        if not batches:
+            print("📒 No journaled writes yet")
+            return
+        print(f"📒 Write batches in {journal.root}:\n")
+        for manifest in batches[-20:]:
+            icon = {"committed": "✅", "failed": "💥", "rolled_back": "↩️", "open": "⏳"}.get(manifest["status"], "❔")
+            print(f"  {icon} {manifest['id']}  {len(manifest['entries']):>3} files  {manifest['description']}")
+        return
+
+    if args.command == "prune":
+        if args.keep < 0:
+            parser.error("--keep must be 0 or more")
+        outcome = journal.prune(args.keep)
+        print(f"🧹 {outcome['batches_removed']} batches and {outcome['backups_removed']} backups removed "
+              f"({outcome['bytes_freed']:,} bytes)")
+        return
+
+    try:
+        outcome = journal.rollback(args.batch_id, args.force)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"↩️ Rolled back {args.batch_id}: {len(outcome['restored'])} restored, "
+          f"{len(outcome['removed'])} removed, {len(outcome['unchanged'])} already original")
+    for path in outcome["restored"]:
+        print(f"  ✅ restored: {path}")
+    for path in outcome["removed"]:
+        print(f"  🗑️ removed: {path}")
+    if outcome["conflicts"]:
+        print(f"\n⚠️ Left alone (changed since the batch - use --force to overwrite):")
+        for path in outcome["conflicts"]:
+            print(f"  - {path}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
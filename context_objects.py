@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+LLM Context Object Store
+
+Content-addressed storage for framework documents. The framework keeps the
+same text in several places (knowledge/ and LM_context/system-docs/, old
+.backup-* copies, every deployed guide), so each distinct content is kept
+once as a blob in LM_context/.objects/<digest>, and a small path -> digest
+map (LM_context/.objects/paths.json) remembers which file holds which blob
+as long as its size and mtime are unchanged. Deploy and sync resolve files
+through the store: two files are compared by digest without reading them,
+and copies are placed from the blob as a reflink (or a hardlink, on
+request) where the filesystem supports it. Deploys only read the framework
+checkout, so their store lives in the user's cache directory instead
+(cache_store).
+
+Usage:
+    python3 context_objects.py scan /path/to/llm-context-system
+    python3 context_objects.py gc /path/to/llm-context-system
+"""
+
+import os
+import sys
+import json
+import argparse
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from context_journal import JournalBatch, atomic_write
+from context_sections import file_digest
+
+OBJECTS_DIR = ".objects"
+PATHS_FILENAME = "paths.json"
+
+# How deploy and sync place a blob's content: "auto" reflinks where the
+# filesystem can and copies otherwise; "hardlink" (deploy only) shares the
+# blob's inode, read-only
+LINK_MODES = ["auto", "hardlink", "copy"]
+
+# Framework trees that hold documents, relative to the framework root
+SCAN_ROOTS = ["LM_context", "knowledge"]
+SKIPPED_DIRS = {".index", ".backups", ".journal", OBJECTS_DIR, "__pycache__"}
+
+CACHE_SUBDIR = "llm-context-system/objects"
+
+
+class ObjectStore:
+    """Blobs named by content digest plus a path -> digest map, for one root."""
+
+    def __init__(self, root: Path, objects_dir: Optional[Path] = None):
+        root = Path(root).resolve()
+        if root.name == "LM_context":
+            root = root.parent
+        self.root = root
+        self.objects_dir = Path(objects_dir) if objects_dir is not None else root / "LM_context" / OBJECTS_DIR
+        # A store outside the root may be shared by several checkouts
+        self.shared = objects_dir is not None
+        self.paths_path = self.objects_dir / PATHS_FILENAME
+        self.paths: Dict[str, Dict] = self.load()
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        # Fleet deploys share one store across threads
+        self.lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict]:
+        """Load the path map, or start an empty one."""
+        if self.paths_path.exists():
+            try:
+                with open(self.paths_path, 'r', encoding='utf-8') as f:
+                    return json.load(f).get("paths", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable object map {self.paths_path}: {e}", file=sys.stderr)
+        return {}
+
+    def save(self) -> None:
+        """Write the path map back if anything changed."""
+        with self.lock:
+            if not self.dirty:
+                return
+            atomic_write(self.paths_path, json.dumps(
+                {"version": 1, "paths": self.paths}, indent=1, sort_keys=True).encode('utf-8'))
+            self.dirty = False
+
+    def relative(self, path: Path) -> str:
+        """Map key for a path: relative to the root, absolute outside it or in a shared store."""
+        path = Path(path).resolve()
+        if not self.shared and path.is_relative_to(self.root):
+            return path.relative_to(self.root).as_posix()
+        return str(path)
+
+    def blob_path(self, digest: str) -> Path:
+        return self.objects_dir / digest
+
+    def cached_digest(self, path: Path, st: os.stat_result) -> Optional[str]:
+        """Return the mapped digest if the file's size and mtime are unchanged."""
+        entry = self.paths.get(self.relative(path))
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            self.hits += 1
+            return entry["digest"]
+        return None
+
+    def record(self, path: Path, digest: str, st: Optional[os.stat_result] = None) -> None:
+        """Remember that path currently holds the blob digest."""
+        st = st or Path(path).stat()
+        self.paths[self.relative(path)] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "digest": digest
+        }
+        self.dirty = True
+
+    def digest(self, path: Path, st: Optional[os.stat_result] = None) -> str:
+        """Return a file's digest, hashing it only when the map is stale."""
+        st = st or Path(path).stat()
+        cached = self.cached_digest(path, st)
+        if cached is not None:
+            return cached
+        self.misses += 1
+        digest = file_digest(path)
+        self.record(path, digest, st)
+        return digest
+
+    def ingest(self, path: Path, digest: Optional[str] = None) -> str:
+        """Make sure path's content is stored as a blob; return its digest.
+
+        The blob is a reflink or copy, never a hardlink: the source may be
+        edited in place later, while a blob must never change.
+        """
+        path = Path(path)
+        with self.lock:
+            digest = digest or self.digest(path)
+            if not self.has_blob(digest):
+                atomic_write(self.blob_path(digest), None, clone_from=path, link="auto")
+        return digest
+
+    def store_bytes(self, digest: str, load) -> str:
+        """Store a blob whose content is only loaded (load()) when it is missing."""
+        with self.lock:
+            if not self.has_blob(digest):
+                atomic_write(self.blob_path(digest), load())
+        return digest
+
+    def has_blob(self, digest: str) -> bool:
+        """Whether an intact blob exists for digest.
+
+        A blob hardlinked out to a project could have been edited in place
+        despite being read-only, so a linked blob is re-hashed before reuse;
+        a damaged one is reported missing and replaced with a new inode.
+        """
+        blob = self.blob_path(digest)
+        try:
+            st = blob.stat()
+        except FileNotFoundError:
+            return False
+        return st.st_nlink == 1 or file_digest(blob) == digest
+
+    def place(self, batch: JournalBatch, digest: str, target: Path, link: str = "auto",
+              copystat_from: Optional[Path] = None) -> str:
+        """Write the blob digest to target through a journal batch.
+
+        Returns how the content was placed ("reflink", "hardlink" or "copy").
+        The target is recorded in the map when it lies under the root.
+        """
+        method = batch.copy_file(self.blob_path(digest), target, digest, link, copystat_from)
+        if method == "hardlink":
+            # The target shares the blob's inode: an in-place edit would
+            # change the blob for every project, so make both read-only
+            os.chmod(target, os.stat(target).st_mode & ~0o222)
+        if not self.shared and Path(target).resolve().is_relative_to(self.root):
+            with self.lock:
+                self.record(target, digest)
+        return method
+
+    def scan(self) -> Dict[str, List[str]]:
+        """Ingest every document under SCAN_ROOTS; return digest -> paths."""
+        by_digest: Dict[str, List[str]] = {}
+        for scan_root in SCAN_ROOTS:
+            for directory, dirnames, filenames in os.walk(self.root / scan_root):
+                dirnames[:] = sorted(d for d in dirnames if d not in SKIPPED_DIRS)
+                for filename in sorted(filenames):
+                    if filename.startswith('.') and ".backup-" not in filename:
+                        continue
+                    path = Path(directory) / filename
+                    digest = self.ingest(path)
+                    by_digest.setdefault(digest, []).append(self.relative(path))
+        return by_digest
+
+    def gc(self) -> Dict[str, int]:
+        """Drop map entries for vanished files and blobs no entry references."""
+        outcome = {"entries_dropped": 0, "blobs_removed": 0, "bytes_freed": 0}
+        with self.lock:
+            for key in list(self.paths):
+                path = Path(key) if os.path.isabs(key) else self.root / key
+                if not path.is_file():
+                    del self.paths[key]
+                    outcome["entries_dropped"] += 1
+                    self.dirty = True
+            referenced = {entry["digest"] for entry in self.paths.values()}
+        if self.objects_dir.is_dir():
+            for blob in self.objects_dir.iterdir():
+                if blob.name == PATHS_FILENAME or blob.name.startswith('.') or blob.name in referenced:
+                    continue
+                outcome["bytes_freed"] += blob.stat().st_size
+                blob.unlink()
+                outcome["blobs_removed"] += 1
+        self.save()
+        return outcome
+
+
+def cache_store(root: Path) -> ObjectStore:
+    """Store for root kept in $XDG_CACHE_HOME (~/.cache), outside the checkout.
+
+    Blobs are named by content, so every framework checkout can share it;
+    its path map is keyed by absolute path.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return ObjectStore(root, Path(cache_home) / CACHE_SUBDIR)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Store framework documents once by content digest",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Store every framework document and list duplicated content
+  python3 context_objects.py scan /path/to/llm-context-system
+
+  # Remove blobs no longer referenced by any file
+  python3 context_objects.py gc /path/to/llm-context-system
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    scan_parser = subparsers.add_parser("scan", help="Store all documents and report duplicates")
+    gc_parser = subparsers.add_parser("gc", help="Remove unreferenced blobs")
+
+    for sub in (scan_parser, gc_parser):
+        sub.add_argument(
+            "root",
+            nargs="?",
+            default=".",
+            help="Framework directory holding LM_context/ (default: current directory)"
+        )
+
+    args = parser.parse_args()
+
+    store = ObjectStore(args.root)
+    if not (store.root / "LM_context").is_dir():
+        print(f"❌ LM_context not found in {store.root}")
+        sys.exit(1)
+
+    if args.command == "gc":
+        outcome = store.gc()
+        print(f"🧹 {outcome['blobs_removed']} blobs removed ({outcome['bytes_freed']:,} bytes), "
+              f"{outcome['entries_dropped']} stale paths dropped")
+        return
+
+    by_digest = store.scan()
+    store.save()
+    files = sum(len(paths) for paths in by_digest.values())
+    duplicated = {digest: paths for digest, paths in by_digest.items() if len(paths) > 1}
+    saved = sum(store.blob_path(digest).stat().st_size * (len(paths) - 1) for digest, paths in duplicated.items())
+    print(f"🗃️ {files} files, {len(by_digest)} distinct blobs in {store.objects_dir} "
+          f"({store.hits} cached digests, {store.misses} files hashed)")
+    if not duplicated:
+        return
+    print(f"\n♻️ {len(duplicated)} contents stored more than once ({saved:,} bytes of copies):")
+    for digest, paths in sorted(duplicated.items(), key=lambda item: -len(item[1])):
+        print(f"  {digest[:12]}  " + ", ".join(paths))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+LLM Context Delta Pack Builder
+
+This script builds a compact LM_context/.index/context-pack.md for session
+start. The session-start files (session-handoff, current-iteration,
+environment, failed-solutions) are split into heading-delimited sections
+and compared with the snapshot taken at the last session close (the
+freshness index baseline). Only new or changed sections are included in
+full; every unchanged section gets a one-line stub.
+
+Usage:
+    python3 context_pack.py /path/to/project
+    python3 context_pack.py /path/to/project --close-session
+"""
+
+import sys
+import argparse
+from datetime import datetime
+from typing import Dict, List
+
+from context_sections import parse_sections, iter_markdown_files, resolve_context_dir
+from context_freshness import FreshnessIndex, INDEX_DIR
+from context_budget import estimate_tokens
+from context_journal import atomic_write
+
+PACK_FILENAME = "context-pack.md"
+
+# Files read at session start, in order; a trailing slash means a directory
+PACK_SOURCES = [
+    "dynamic/session-handoff.md",
+    "dynamic/current-iteration.md",
+    "static/environment.md",
+    "dynamic/failed-solutions/"
+]
+
+
+class ContextPackBuilder:
+    def __init__(self, context_dir: str):
+        self.context_dir = resolve_context_dir(context_dir)
+        self.pack_path = self.context_dir / INDEX_DIR / PACK_FILENAME
+        self.freshness = FreshnessIndex(str(self.context_dir))
+
+    def source_files(self) -> List[str]:
+        """List the session-start files that exist, in load order."""
+        files = []
+        for source in PACK_SOURCES:
+            if source.endswith("/"):
+                if (self.context_dir / source).is_dir():
+                    files += [source + name for name in iter_markdown_files(self.context_dir / source)]
+            elif (self.context_dir / source).exists():
+                files.append(source)
+        return files
+
+    def build(self) -> Dict:
+        """Write the delta pack and return statistics about it."""
+        index = self.freshness.update(rewrite_status=False)
+        baseline = index["baseline"]
+
+        lines = []
+        stats = {"changed": 0, "unchanged": 0, "full_tokens": 0}
+        for relative_path in self.source_files():
+            text = (self.context_dir / relative_path).read_text(encoding='utf-8', errors='replace')
+            stats["full_tokens"] += estimate_tokens(text)
+            baseline_sections = baseline.get(relative_path, {}).get("sections", {})
+            is_new_file = relative_path not in baseline
+
+            lines.append(f"## 📄 {relative_path}" + (" (new file)" if is_new_file else ""))
+            lines.append("")
+            sections = parse_sections(text)
+            for section in sections:
+                line_count = section["text"].count("\n") or 1
+                if not is_new_file and baseline_sections.get(section["path"]) == section["digest"]:
+                    stats["unchanged"] += 1
+                    lines.append(f"- ✅ unchanged: {section['path']} "
+                                 f"(lines {section['start_line']}-{section['start_line'] + line_count - 1})")
+                    continue
+                stats["changed"] += 1
+                marker = "🆕 new" if section["path"] not in baseline_sections else "⚠️ changed"
+                lines.append("")
+                lines.append(f"<!-- {marker}: {section['path']} -->")
+                lines.append(section["text"].rstrip("\n"))
+                lines.append("")
+            current_paths = {section["path"] for section in sections}
+            for path in [path for path in baseline_sections if path not in current_paths]:
+                lines.append(f"- 🗑️ removed: {path}")
+            lines.append("")
+
+        for relative_path in index.get("removed", []):
+            if any(relative_path == source or (source.endswith("/") and relative_path.startswith(source))
+                   for source in PACK_SOURCES):
+                lines.append(f"## 🗑️ {relative_path} (removed since last session)")
+                lines.append("")
+
+        body = "\n".join(lines)
+        header = [
+            "# Context Pack",
+            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+            f"**Baseline:** session closed {index['session_closed'] or 'never'}",
+            f"**Sections:** {stats['changed']} new/changed in full, {stats['unchanged']} unchanged as stubs",
+            "",
+            "Unchanged sections are listed with their line ranges; open the file only if you need one of them.",
+            "",
+            ""
+        ]
+        content = "\n".join(header) + body
+        stats["pack_tokens"] = estimate_tokens(content)
+
+        # The watch daemon rebuilds the pack while the LLM may be reading it
+        atomic_write(self.pack_path, content.encode('utf-8'))
+        stats["pack_path"] = str(self.pack_path)
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build a section-level delta context pack for session start",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Session start: build the pack, then have the LLM read .index/context-pack.md
+  python3 context_pack.py /Users/vn/ws/melexis-simple
+
+  # Session end: snapshot the current sections as the next baseline
+  python3 context_pack.py /Users/vn/ws/melexis-simple --close-session
+        """
+    )
+
+    parser.add_argument(
+        "context_dir",
+        nargs="?",
+        default=".",
+        help="Project directory or its LM_context/ directory (default: current directory)"
+    )
+
+    parser.add_argument(
+        "--close-session",
+        action="store_true",
+        help="Record the current sections as the baseline instead of building a pack"
+    )
+
+    args = parser.parse_args()
+
+    builder = ContextPackBuilder(args.context_dir)
+    if not builder.context_dir.is_dir():
+        print(f"❌ LM_context not found: {builder.context_dir}")
+        sys.exit(1)
+
+    if args.close_session:
+        index = builder.freshness.update(close_session=True)
+        print(f"📸 Session baseline recorded: {index['session_closed']}")
+        return
+
+    stats = builder.build()
+    saved = 100 * (1 - stats["pack_tokens"] / stats["full_tokens"]) if stats["full_tokens"] else 0.0
+    print(f"📦 Context pack written: {stats['pack_path']}")
+    print(f"   {stats['changed']} changed sections, {stats['unchanged']} unchanged stubs")
+    print(f"   ~{stats['pack_tokens']} tokens vs ~{stats['full_tokens']} for full files ({saved:.0f}% saved)")
+
+if __name__ == "__main__":
+    main()
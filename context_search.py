@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+LLM Context Section Search
+
+This script keeps a BM25 full-text index (SQLite FTS5) of the markdown
+sections under knowledge/ and LM_context/archive/ (including compressed
+daily-log archives) and returns the best matching sections with their
+heading paths, so on-demand resource access can read one or two sections
+instead of whole files. The index lives at LM_context/.index/search.db
+and is updated incrementally before every search.
+
+Usage:
+    python3 context_search.py search "pipeline stalls on EOS" --project /path/to/project
+    python3 context_search.py index --project /path/to/project
+"""
+
+import sys
+import json
+import re
+import sqlite3
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+from context_sections import content_digest, parse_sections
+from context_archiver import ContextArchiver
+
+INDEX_DIR = ".index"
+SEARCH_DB_FILENAME = "search.db"
+
+# Trees indexed below the project root
+SEARCH_ROOTS = ["knowledge", "LM_context/archive"]
+SEARCH_SUFFIXES = (".md", ".md.gz", ".md.zst")
+
+# BM25 column weights: path, heading, body, start_line
+HEADING_WEIGHT = 4.0
+BODY_WEIGHT = 1.0
+
+QUERY_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS sections USING fts5(
+    path UNINDEXED, heading, body, start_line UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+"""
+
+
+def read_document(path: Path) -> str:
+    """Read a markdown file, decompressing archived daily logs."""
+    if path.name.endswith((".gz", ".zst")):
+        return ContextArchiver.read_archive(path)
+    return path.read_text(encoding='utf-8', errors='replace')
+
+
+def match_query(query: str) -> str:
+    """Turn free text into an FTS5 query that ORs the quoted terms.
+
+    Quoting keeps punctuation in user input from being parsed as FTS5
+    syntax; OR lets BM25 rank partial matches instead of dropping them.
+    """
+    terms = QUERY_TERM_PATTERN.findall(query.lower())
+    return " OR ".join(f'"{term}"' for term in dict.fromkeys(terms))
+
+
+class SectionSearchIndex:
+    def __init__(self, project_dir: str):
+        self.project_dir = Path(project_dir).resolve()
+        if self.project_dir.name == "LM_context":
+            self.project_dir = self.project_dir.parent
+        self.db_path = self.project_dir / "LM_context" / INDEX_DIR / SEARCH_DB_FILENAME
+        self.stats = {"indexed": 0, "unchanged": 0, "removed": 0, "sections": 0}
+        self.conn = None
+
+    def connect(self) -> sqlite3.Connection:
+        """Open (and create) the index database."""
+        if self.conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path))
+            self.conn.executescript(SCHEMA)
+        return self.conn
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def source_files(self) -> List[Path]:
+        """List indexable files below the search roots."""
+        files = []
+        for root in SEARCH_ROOTS:
+            root_path = self.project_dir / root
+            if root_path.is_dir():
+                files += sorted(p for p in root_path.rglob("*")
+                                if p.name.endswith(SEARCH_SUFFIXES) and p.is_file()
+                                and not any(part.startswith(".") for part in p.relative_to(root_path).parts))
+        return files
+
+    def update(self) -> Dict:
+        """Bring the index in line with the files on disk.
+
+        Files whose size and mtime are unchanged are skipped without being
+        read; a touched file whose content digest is unchanged only has its
+        stat refreshed. Sections of changed files are replaced.
+        """
+        conn = self.connect()
+        known = {row[0]: row[1:] for row in conn.execute("SELECT path, size, mtime_ns, digest FROM files")}
+        seen = set()
+
+        with conn:
+            for path in self.source_files():
+                relative_path = path.relative_to(self.project_dir).as_posix()
+                seen.add(relative_path)
+                st = path.stat()
+                previous = known.get(relative_path)
+                if previous and previous[0] == st.st_size and previous[1] == st.st_mtime_ns:
+                    self.stats["unchanged"] += 1
+                    continue
+
+                try:
+                    text = read_document(path)
+                except (OSError, ValueError, EOFError) as e:
+                    print(f"⚠️ Skipping {relative_path}: {e}", file=sys.stderr)
+                    continue
+                digest = content_digest(text)
+                conn.execute("INSERT OR REPLACE INTO files (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+                             (relative_path, st.st_size, st.st_mtime_ns, digest))
+                if previous and previous[2] == digest:
+                    self.stats["unchanged"] += 1
+                    continue
+
+                conn.execute("DELETE FROM sections WHERE path = ?", (relative_path,))
+                sections = parse_sections(text)
+                conn.executemany(
+                    "INSERT INTO sections (path, heading, body, start_line) VALUES (?, ?, ?, ?)",
+                    [(relative_path, section["path"], section["text"], section["start_line"]) for section in sections]
+                )
+                self.stats["indexed"] += 1
+                self.stats["sections"] += len(sections)
+
+            for relative_path in set(known) - seen:
+                conn.execute("DELETE FROM sections WHERE path = ?", (relative_path,))
+                conn.execute("DELETE FROM files WHERE path = ?", (relative_path,))
+                self.stats["removed"] += 1
+
+        return self.stats
+
+    def search(self, query: str, top_k: int = 5) -> List[Dict]:
+        """Return the top-k sections for a query, best first."""
+        fts_query = match_query(query)
+        if not fts_query:
+            return []
+        rows = self.connect().execute(
+            f"""SELECT path, heading, start_line,
+                       bm25(sections, 0, {HEADING_WEIGHT}, {BODY_WEIGHT}, 0) AS score,
+                       snippet(sections, 2, '[', ']', ' … ', 16)
+                FROM sections WHERE sections MATCH ?
+                ORDER BY score LIMIT ?""",
+            (fts_query, top_k)
+        ).fetchall()
+        return [
+            {"path": path, "heading": heading, "start_line": start_line,
+             "score": round(-score, 3), "snippet": " ".join(snippet.split())}
+            for path, heading, start_line, score, snippet in rows
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Full-text search over knowledge/ and LM_context/archive/ sections",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Find the two most relevant sections for a question
+  python3 context_search.py search "GStreamer pipeline hangs" --top-k 2
+
+  # Refresh the index only (e.g. after archiving)
+  python3 context_search.py index --project /Users/vn/ws/melexis-simple
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    search_parser = subparsers.add_parser("search", help="Return the top-k matching sections")
+    search_parser.add_argument("query", help="Free-text query")
+    search_parser.add_argument("--top-k", type=int, default=5, help="Number of sections to return (default: 5)")
+    search_parser.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    index_parser = subparsers.add_parser("index", help="Update the index without searching")
+
+    for sub in (search_parser, index_parser):
+        sub.add_argument(
+            "--project",
+            default=".",
+            help="Project (or framework) directory holding knowledge/ and/or LM_context/ (default: current directory)"
+        )
+
+    args = parser.parse_args()
+
+    index = SectionSearchIndex(args.project)
+    if not (index.project_dir / "LM_context").is_dir() and not (index.project_dir / "knowledge").is_dir():
+        print(f"❌ Neither LM_context/ nor knowledge/ found in {index.project_dir}")
+        sys.exit(1)
+
+    try:
+        stats = index.update()
+        if args.command == "index":
+            print(f"🔎 Search index: {index.db_path}")
+            print(f"   {stats['indexed']} files indexed ({stats['sections']} sections), "
+                  f"{stats['unchanged']} unchanged, {stats['removed']} removed")
+            return
+
+        results = index.search(args.query, args.top_k)
+    finally:
+        index.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    if not results:
+        print(f"🔎 No sections match: {args.query}")
+        return
+    print(f"🔎 Top {len(results)} sections for: {args.query}\n")
+    for rank, result in enumerate(results, 1):
+        print(f"{rank}. {result['heading']}  (score {result['score']})")
+        print(f"   📄 {result['path']}:{result['start_line']}")
+        print(f"   {result['snippet']}")
+        print()
+
+if __name__ == "__main__":
+    main()
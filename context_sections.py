@@ -0,0 +1,144 @@
+"""
+Markdown section helpers shared by the LM_context tools.
+
+Context files are split into heading-delimited sections so tools can track,
+diff, index and load context at section granularity instead of whole files.
+"""
+
+import os
+import re
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+
+# Pseudo heading for text that appears before the first heading
+PREAMBLE = "(preamble)"
+
+# Directories under LM_context/ that never hold session context
+SKIPPED_DIRS = {".index", ".backups", ".journal", ".objects", "__pycache__"}
+
+SIMHASH_BITS = 64
+
+# Every tool names content by this digest (journal backups, object store
+# blobs, manifests, indexes), so digests computed anywhere can be compared
+DIGEST_SIZE = 20
+CHUNK_SIZE = 64 * 1024
+
+
+def new_hasher():
+    """Return an incremental hasher producing content_digest values."""
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def content_digest(data) -> str:
+    """Return the BLAKE2 digest of text or bytes."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def file_digest(path) -> str:
+    """Return content_digest of a file's contents, read in chunks."""
+    hasher = new_hasher()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def simhash(features: Dict[str, float]) -> int:
+    """Return the 64-bit SimHash of weighted features.
+
+    Feature sets that mostly overlap get hashes a small Hamming distance
+    apart, so near-duplicate text can be found by comparing integers.
+    """
+    totals = [0.0] * SIMHASH_BITS
+    for feature, weight in features.items():
+        bits = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            totals[bit] += weight if bits >> bit & 1 else -weight
+    return sum(1 << bit for bit, total in enumerate(totals) if total > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return bin(a ^ b).count("1")
+
+
+def iter_sections(lines: Iterable[str]) -> Iterator[Dict]:
+    """Yield heading-delimited sections from an iterable of markdown lines.
+
+    Each section is a dict with its heading title, level, heading path
+    ("Parent > Child"), starting line, full text (heading line included)
+    and digest. Headings inside fenced code blocks are ignored, and
+    repeated heading paths get a " [n]" suffix so paths stay unique keys.
+    Only the current section is held in memory, so lines can come straight
+    from a (decompressing) file stream.
+    """
+    stack: List[str] = []
+    seen: Dict[str, int] = {}
+    current = {"title": PREAMBLE, "level": 0, "path": PREAMBLE, "start_line": 1, "lines": []}
+    in_fence = False
+
+    def finish(section):
+        body = "".join(section.pop("lines"))
+        if section["level"] == 0 and not body.strip():
+            return None
+        section["text"] = body
+        section["digest"] = content_digest(body)
+        return section
+
+    for line_number, line in enumerate(lines, 1):
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_PATTERN.match(line)
+        if match:
+            finished = finish(current)
+            if finished:
+                yield finished
+            level = len(match.group(1))
+            title = match.group(2)
+            stack = stack[:level - 1] + [""] * max(0, level - 1 - len(stack)) + [title]
+            path = " > ".join(part for part in stack if part)
+            seen[path] = seen.get(path, 0) + 1
+            if seen[path] > 1:
+                path = f"{path} [{seen[path]}]"
+            current = {"title": title, "level": level, "path": path, "start_line": line_number, "lines": []}
+        current["lines"].append(line)
+
+    finished = finish(current)
+    if finished:
+        yield finished
+
+
+def parse_sections(text: str) -> List[Dict]:
+    """Split markdown text into heading-delimited sections (see iter_sections)."""
+    return list(iter_sections(text.splitlines(keepends=True)))
+
+
+def section_digests(text: str) -> Dict[str, str]:
+    """Map each section path of a markdown text to its digest."""
+    return {section["path"]: section["digest"] for section in parse_sections(text)}
+
+
+def iter_markdown_files(context_dir: Path, skip_dirs: Optional[Iterable[str]] = None) -> List[str]:
+    """List markdown files below a directory as sorted relative POSIX paths."""
+    skipped = set(SKIPPED_DIRS) | set(skip_dirs or [])
+    files = []
+    for root, dirs, names in os.walk(context_dir):
+        dirs[:] = sorted(d for d in dirs if d not in skipped)
+        for name in sorted(names):
+            if name.endswith(".md"):
+                files.append((Path(root) / name).relative_to(context_dir).as_posix())
+    return files
+
+
+def resolve_context_dir(path: str) -> Path:
+    """Accept either a project directory or its LM_context/ directory."""
+    resolved = Path(path).resolve()
+    if (resolved / "LM_context").is_dir():
+        return resolved / "LM_context"
+    return resolved
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+LLM Context Semantic Retrieval
+
+This script keeps an offline vector index of every markdown section in
+LM_context/ (compressed archives included) and knowledge/, so a "relevant
+context" query also finds paraphrases that keyword search misses. Sections
+are embedded with a CPU-only hashed n-gram vectorizer (word unigrams and
+bigrams, character n-grams, and a small table of domain synonyms). Vectors
+are stored as a float32 matrix at LM_context/.index/vectors.f32 and
+queried with batched cosine top-k, through a NumPy memmap when NumPy is
+installed. Only sections whose content hash changed are re-embedded. The
+row metadata (vectors.json) records the digest of the vector file it was
+written with, so a matrix left from an interrupted save is never paired
+with the wrong rows.
+
+Usage:
+    python3 context_semantic.py query "GStreamer hangs" --project /path/to/project
+    python3 context_semantic.py index --project /path/to/project
+"""
+
+import re
+import sys
+import json
+import math
+import time
+import heapq
+import zlib
+import argparse
+from array import array
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from context_sections import parse_sections, iter_markdown_files, content_digest, file_digest
+from context_search import read_document
+from context_journal import atomic_write
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+INDEX_DIR = ".index"
+VECTORS_FILENAME = "vectors.f32"
+VECTOR_META_FILENAME = "vectors.json"
+# Version 2 records the vector file's digest in the metadata
+INDEX_VERSION = 2
+
+VECTOR_DIM = 1024
+QUERY_BATCH_ROWS = 4096
+
+# Weights of each feature family in the hashed vector
+UNIGRAM_WEIGHT = 1.0
+BIGRAM_WEIGHT = 0.7
+CHAR_NGRAM_WEIGHT = 0.25
+CONCEPT_WEIGHT = 1.5
+CHAR_NGRAM_SIZES = (3, 4)
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "is", "it",
+    "of", "on", "or", "that", "the", "this", "to", "was", "were", "will", "with", "when", "what", "how"
+}
+
+# Words that mean the same thing in these projects share one concept feature
+SYNONYM_GROUPS = [
+    ("hang", "hangs", "hanging", "hung", "stall", "stalls", "stalled", "freeze", "freezes", "frozen",
+     "stuck", "deadlock", "deadlocks", "blocked", "unresponsive", "timeout", "timeouts"),
+    ("crash", "crashes", "crashed", "segfault", "abort", "aborts", "panic", "coredump"),
+    ("fail", "fails", "failed", "failure", "failing", "broken", "error", "errors"),
+    ("slow", "slowness", "latency", "lag", "sluggish", "performance", "perf"),
+    ("leak", "leaks", "leaking", "oom", "memory"),
+    ("gstreamer", "gst", "pipeline", "pipelines", "appsink", "appsrc"),
+    ("camera", "sensor", "tof", "melexis", "mlx"),
+    ("install", "installed", "installation", "setup", "dependency", "dependencies", "package", "packages"),
+    ("config", "configuration", "settings", "setting", "parameters", "env", "environment"),
+    ("fix", "fixed", "solution", "solutions", "workaround", "resolved", "resolution"),
+    ("test", "tests", "testing", "validate", "validation", "verify", "verified", "check"),
+]
+CONCEPTS = {word: f"~{group[0]}" for group in SYNONYM_GROUPS for word in group}
+
+
+def hashed_features(text: str) -> Dict[int, float]:
+    """Map text to sparse hashed feature weights (sublinear term frequency)."""
+    words = [word for word in WORD_PATTERN.findall(text.lower()) if word not in STOP_WORDS]
+    counts: Dict[Tuple[str, float], int] = {}
+
+    def add(feature: str, weight: float):
+        counts[(feature, weight)] = counts.get((feature, weight), 0) + 1
+
+    for index, word in enumerate(words):
+        add(word, UNIGRAM_WEIGHT)
+        if word in CONCEPTS:
+            add(CONCEPTS[word], CONCEPT_WEIGHT)
+        if index + 1 < len(words):
+            add(f"{word} {words[index + 1]}", BIGRAM_WEIGHT)
+        padded = f"<{word}>"
+        for size in CHAR_NGRAM_SIZES:
+            for start in range(len(padded) - size + 1):
+                add("#" + padded[start:start + size], CHAR_NGRAM_WEIGHT)
+
+    vector: Dict[int, float] = {}
+    for (feature, weight), count in counts.items():
+        bucket = zlib.crc32(feature.encode('utf-8'))
+        # The top bit picks the sign so hash collisions tend to cancel out
+        sign = -1.0 if bucket & 0x80000000 else 1.0
+        slot = bucket % VECTOR_DIM
+        vector[slot] = vector.get(slot, 0.0) + sign * weight * (1.0 + math.log(count))
+    return vector
+
+
+def embed(text: str) -> Dict[int, float]:
+    """Embed text as an L2-normalized sparse vector."""
+    vector = hashed_features(text)
+    norm = math.sqrt(sum(value * value for value in vector.values()))
+    if norm == 0:
+        return {}
+    return {slot: value / norm for slot, value in vector.items()}
+
+
+class SemanticIndex:
+    def __init__(self, project_dir: str):
+        self.project_dir = Path(project_dir).resolve()
+        if self.project_dir.name == "LM_context":
+            self.project_dir = self.project_dir.parent
+        self.index_dir = self.project_dir / "LM_context" / INDEX_DIR
+        self.vectors_path = self.index_dir / VECTORS_FILENAME
+        self.meta_path = self.index_dir / VECTOR_META_FILENAME
+        self.meta = self.load_meta()
+        self.stats = {"sections": 0, "embedded": 0, "reused": 0, "files_read": 0}
+
+    @staticmethod
+    def empty_meta() -> Dict:
+        return {"version": INDEX_VERSION, "dim": VECTOR_DIM, "files": {}, "rows": [], "vectors_digest": None}
+
+    def load_meta(self) -> Dict:
+        """Load the row metadata, discarding it unless the vector file is the one it was saved with."""
+        if self.meta_path.exists() and self.vectors_path.exists():
+            try:
+                with open(self.meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if meta.get("version") == INDEX_VERSION and meta.get("dim") == VECTOR_DIM:
+                    if meta["vectors_digest"] == file_digest(self.vectors_path):
+                        return meta
+                    print("⚠️ Vector file does not match its metadata, rebuilding", file=sys.stderr)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠️ Ignoring unreadable vector index: {e}", file=sys.stderr)
+        return self.empty_meta()
+
+    def source_files(self) -> List[Path]:
+        """List LM_context/ and knowledge/ files to embed."""
+        files = []
+        context_dir = self.project_dir / "LM_context"
+        if context_dir.is_dir():
+            files += [context_dir / relative_path for relative_path in iter_markdown_files(context_dir)]
+            archive_dir = context_dir / "archive"
+            if archive_dir.is_dir():
+                files += sorted(p for p in archive_dir.rglob("*.md.*") if p.name.endswith((".gz", ".zst")))
+        knowledge_dir = self.project_dir / "knowledge"
+        if knowledge_dir.is_dir():
+            files += [knowledge_dir / relative_path for relative_path in iter_markdown_files(knowledge_dir)]
+        return files
+
+    def _load_matrix(self) -> array:
+        """Read the stored vectors as a flat float32 array.
+
+        A vector file that does not match the row metadata (e.g. after an
+        interrupted write) is discarded along with the metadata.
+        """
+        matrix = array('f')
+        expected = len(self.meta["rows"]) * VECTOR_DIM * matrix.itemsize
+        if self.vectors_path.exists() and self.vectors_path.stat().st_size == expected:
+            with open(self.vectors_path, 'rb') as f:
+                matrix.frombytes(f.read())
+        elif self.meta["rows"]:
+            print("⚠️ Vector file does not match its metadata, rebuilding", file=sys.stderr)
+            self.meta = self.empty_meta()
+        return matrix
+
+    def update(self) -> Dict:
+        """Re-embed changed sections and rewrite the vector matrix.
+
+        Files with unchanged size and mtime reuse their recorded sections
+        without being read. Every section whose digest already has a vector
+        reuses it; only new content is embedded.
+        """
+        old_matrix = self._load_matrix()
+        old_rows = self.meta["rows"]
+        old_files = self.meta["files"]
+        vector_by_digest = {row["digest"]: (old_matrix, index) for index, row in enumerate(old_rows)}
+        rows_by_file: Dict[str, List[Dict]] = {}
+        for row in old_rows:
+            rows_by_file.setdefault(row["path"], []).append(row)
+
+        new_files = {}
+        new_rows = []
+        new_matrix = array('f')
+        for path in self.source_files():
+            relative_path = path.relative_to(self.project_dir).as_posix()
+            st = path.stat()
+            previous = old_files.get(relative_path)
+            if previous and previous["size"] == st.st_size and previous["mtime_ns"] == st.st_mtime_ns:
+                sections = rows_by_file.get(relative_path, [])
+            else:
+                try:
+                    text = read_document(path)
+                except (OSError, ValueError, EOFError) as e:
+                    print(f"⚠️ Skipping {relative_path}: {e}", file=sys.stderr)
+                    continue
+                self.stats["files_read"] += 1
+                sections = [
+                    {"path": relative_path, "heading": section["path"],
+                     "start_line": section["start_line"], "digest": section["digest"], "text": section["text"]}
+                    for section in parse_sections(text)
+                ]
+            new_files[relative_path] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+            for section in sections:
+                text = section.pop("text", None)
+                row = dict(section)
+                if row["digest"] in vector_by_digest:
+                    source, source_row = vector_by_digest[row["digest"]]
+                    start = source_row * VECTOR_DIM
+                    new_matrix.extend(source[start:start + VECTOR_DIM])
+                    self.stats["reused"] += 1
+                else:
+                    dense = [0.0] * VECTOR_DIM
+                    for slot, value in embed(f"{row['heading']}\n{text}").items():
+                        dense[slot] = value
+                    new_matrix.extend(dense)
+                    vector_by_digest[row["digest"]] = (new_matrix, len(new_rows))
+                    self.stats["embedded"] += 1
+                new_rows.append(row)
+
+        self.stats["sections"] = len(new_rows)
+        if new_rows == old_rows and new_files == old_files:
+            return self.stats
+        self.meta = dict(self.empty_meta(), files=new_files, rows=new_rows)
+        self.save(new_matrix)
+        return self.stats
+
+    def save(self, matrix: array) -> None:
+        """Write the matrix, then the row metadata naming its digest, each atomically."""
+        data = matrix.tobytes()
+        self.meta["vectors_digest"] = content_digest(data)
+        atomic_write(self.vectors_path, data)
+        atomic_write(self.meta_path, json.dumps(self.meta).encode('utf-8'))
+
+    def query(self, text: str, top_k: int = 5) -> List[Dict]:
+        """Return the top-k sections by cosine similarity, best first."""
+        query_vector = embed(text)
+        rows = self.meta["rows"]
+        if not query_vector or not rows:
+            return []
+
+        if numpy is not None:
+            scores = self._scores_numpy(query_vector, len(rows), top_k)
+        else:
+            scores = self._scores_python(query_vector, len(rows), top_k)
+        return [dict(rows[index], score=round(score, 4)) for score, index in scores]
+
+    def _scores_numpy(self, query_vector: Dict[int, float], row_count: int, top_k: int) -> List[Tuple[float, int]]:
+        """Batched matrix-vector cosine top-k over a read-only memmap."""
+        matrix = numpy.memmap(self.vectors_path, dtype=numpy.float32, mode='r', shape=(row_count, VECTOR_DIM))
+        query = numpy.zeros(VECTOR_DIM, dtype=numpy.float32)
+        for slot, value in query_vector.items():
+            query[slot] = value
+        best: List[Tuple[float, int]] = []
+        for start in range(0, row_count, QUERY_BATCH_ROWS):
+            scores = matrix[start:start + QUERY_BATCH_ROWS] @ query
+            count = min(top_k, len(scores))
+            candidates = numpy.argpartition(-scores, count - 1)[:count]
+            best = heapq.nlargest(top_k, best + [(float(scores[i]), start + int(i)) for i in candidates])
+        return best
+
+    def _scores_python(self, query_vector: Dict[int, float], row_count: int, top_k: int) -> List[Tuple[float, int]]:
+        """Cosine top-k touching only the query's non-zero dimensions."""
+        matrix = self._load_matrix()
+        terms = list(query_vector.items())
+        scores = (
+            (sum(matrix[offset + slot] * value for slot, value in terms), index)
+            for index, offset in enumerate(range(0, row_count * VECTOR_DIM, VECTOR_DIM))
+        )
+        return heapq.nlargest(top_k, scores)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Offline semantic retrieval over LM_context/ and knowledge/ sections",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Find sections relevant to a question, including paraphrases
+  python3 context_semantic.py query "GStreamer hangs" --top-k 3
+
+  # Re-embed changed sections only (e.g. at session end)
+  python3 context_semantic.py index --project /Users/vn/ws/melexis-simple
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    query_parser = subparsers.add_parser("query", help="Return the top-k most similar sections")
+    query_parser.add_argument("text", help="Question or description")
+    query_parser.add_argument("--top-k", type=int, default=5, help="Number of sections to return (default: 5)")
+    query_parser.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    index_parser = subparsers.add_parser("index", help="Update the vector index without querying")
+
+    for sub in (query_parser, index_parser):
+        sub.add_argument(
+            "--project",
+            default=".",
+            help="Project (or framework) directory holding LM_context/ and/or knowledge/ (default: current directory)"
+        )
+
+    args = parser.parse_args()
+
+    index = SemanticIndex(args.project)
+    if not (index.project_dir / "LM_context").is_dir() and not (index.project_dir / "knowledge").is_dir():
+        print(f"❌ Neither LM_context/ nor knowledge/ found in {index.project_dir}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    stats = index.update()
+    if args.command == "index":
+        print(f"🧭 Vector index: {index.vectors_path}")
+        print(f"   {stats['sections']} sections: {stats['embedded']} embedded, {stats['reused']} reused "
+              f"({stats['files_read']} files read, {time.perf_counter() - started:.2f}s)")
+        return
+
+    query_started = time.perf_counter()
+    results = index.query(args.text, args.top_k)
+    query_ms = (time.perf_counter() - query_started) * 1000
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    print(f"🧭 Top {len(results)} sections for: {args.text} "
+          f"({query_ms:.0f} ms, {'numpy' if numpy is not None else 'pure Python'})\n")
+    for rank, result in enumerate(results, 1):
+        print(f"{rank}. {result['heading']}  (similarity {result['score']})")
+        print(f"   📄 {result['path']}:{result['start_line']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+LLM Context Watch Daemon
+
+This script keeps the generated indexes of a deployed project hot while
+people and LLMs edit it, so session start only reads precomputed state.
+It watches LM_context/ and knowledge/ with inotify (through ctypes, no
+extra packages) or, where inotify is unavailable, by polling file stats.
+Bursts of events are debounced and handed to a background worker that
+updates only the indexes the changed paths affect:
+
+- freshness: LM_context/.index/freshness.json (context_freshness.py)
+- pack: LM_context/.index/context-pack.md (context_pack.py)
+- tokens: LM_context/.index/token-cache.json (context_budget.py)
+- failures: LM_context/.index/failures.json (context_failures.py)
+- search: LM_context/.index/search.db (context_search.py)
+- semantic: LM_context/.index/vectors.f32 (context_semantic.py)
+
+Every index updates incrementally on its own, so only changed files are
+re-read. The watcher's state is written to LM_context/.index/watch-status.json.
+
+Usage:
+    python3 context_watch.py run /path/to/project
+    python3 context_watch.py status /path/to/project
+    python3 context_watch.py stop /path/to/project
+"""
+
+import os
+import sys
+import json
+import time
+import errno
+import select
+import signal
+import struct
+import ctypes
+import ctypes.util
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from context_budget import ContextBudget
+from context_freshness import FreshnessIndex
+from context_pack import ContextPackBuilder, PACK_SOURCES
+from context_failures import FailureIndex, FAILED_SOLUTIONS_DIR
+from context_search import SectionSearchIndex
+from context_semantic import SemanticIndex
+
+INDEX_DIR = ".index"
+STATUS_FILENAME = "watch-status.json"
+WATCH_ROOTS = ["LM_context", "knowledge"]
+
+DEFAULT_DEBOUNCE_SECONDS = 1.0
+DEFAULT_POLL_SECONDS = 2.0
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+# Marker for "events were lost, treat everything as changed"
+RESCAN = Path("*")
+
+
+def is_ignored(path: Path, root: Path) -> bool:
+    """Hidden paths (.index/, .journal/, temp files) hold tool state, not context."""
+    return any(part.startswith(".") for part in path.relative_to(root).parts)
+
+
+def walk_directories(root: Path) -> Iterable[Path]:
+    """Yield root and every non-hidden directory below it."""
+    for current, dirs, _ in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        yield Path(current)
+
+
+class InotifyBackend:
+    """Recursive directory watches on top of the Linux inotify syscalls."""
+
+    name = "inotify"
+
+    def __init__(self, roots: List[Path]):
+        libc_path = ctypes.util.find_library("c")
+        self.libc = ctypes.CDLL(libc_path, use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        self.roots = roots
+        self.watches: Dict[int, Path] = {}
+        for root in roots:
+            self.add_tree(root)
+
+    def add_tree(self, directory: Path) -> List[Path]:
+        """Watch a directory tree; return the files already inside it."""
+        found = []
+        for current in walk_directories(directory):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(str(current)), WATCH_MASK)
+            if wd < 0:
+                code = ctypes.get_errno()
+                if code == errno.ENOSPC:
+                    raise OSError(code, "inotify watch limit reached (fs.inotify.max_user_watches)")
+                continue
+            self.watches[wd] = current
+            try:
+                names = os.listdir(current)
+            except OSError:
+                # Removed since the walk (e.g. a rolled-back or renamed directory)
+                continue
+            found += [current / name for name in names if (current / name).is_file()]
+        return found
+
+    def read_events(self, timeout: float) -> Set[Path]:
+        """Wait up to timeout seconds and return the paths that changed."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            raw_name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length]
+            offset += EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                changed.add(RESCAN)
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            name = os.fsdecode(raw_name.rstrip(b"\0"))
+            path = directory / name if name else directory
+            if name.startswith("."):
+                continue
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                changed.update(self.add_tree(path))
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingBackend:
+    """Stat-based fallback: compare size and mtime of every file each interval."""
+
+    name = "polling"
+
+    def __init__(self, roots: List[Path], interval: float = DEFAULT_POLL_SECONDS):
+        self.roots = roots
+        self.interval = interval
+        self.snapshot = self.scan()
+        self.last_scan = time.monotonic()
+
+    def scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for root in self.roots:
+            for directory in walk_directories(root):
+                try:
+                    entries = list(os.scandir(directory))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.is_file():
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        # Deleted since scandir, e.g. an atomic-write temp file
+                        continue
+                    snapshot[Path(entry.path)] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def read_events(self, timeout: float) -> Set[Path]:
+        time.sleep(min(timeout, self.interval))
+        if time.monotonic() - self.last_scan < self.interval:
+            return set()
+        current = self.scan()
+        self.last_scan = time.monotonic()
+        changed = {path for path, state in current.items() if self.snapshot.get(path) != state}
+        changed.update(path for path in self.snapshot if path not in current)
+        self.snapshot = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def _update_freshness(project_dir: Path) -> None:
+    FreshnessIndex(str(project_dir / "LM_context")).update(rewrite_status=False)
+
+
+def _update_pack(project_dir: Path) -> None:
+    ContextPackBuilder(str(project_dir / "LM_context")).build()
+
+
+def _update_tokens(project_dir: Path) -> None:
+    budget = ContextBudget(str(project_dir / "LM_context"))
+    for relative_path in budget.context_files():
+        budget.file_tokens(relative_path)
+    budget.save_cache()
+
+
+def _update_failures(project_dir: Path) -> None:
+    FailureIndex(str(project_dir)).update()
+
+
+def _update_search(project_dir: Path) -> None:
+    index = SectionSearchIndex(str(project_dir))
+    try:
+        index.update()
+    finally:
+        index.close()
+
+
+def _update_semantic(project_dir: Path) -> None:
+    SemanticIndex(str(project_dir)).update()
+
+
+# Index name -> updater, in the order they are refreshed
+INDEX_UPDATERS: Dict[str, Callable[[Path], None]] = {
+    "freshness": _update_freshness,
+    "pack": _update_pack,
+    "tokens": _update_tokens,
+    "failures": _update_failures,
+    "search": _update_search,
+    "semantic": _update_semantic,
+}
+
+
+def affected_indexes(relative_paths: Iterable[str]) -> Set[str]:
+    """Map changed paths (relative to the project) to the indexes they feed."""
+    affected: Set[str] = set()
+    pack_files = [source for source in PACK_SOURCES if not source.endswith("/")]
+    pack_dirs = [source for source in PACK_SOURCES if source.endswith("/")]
+    for relative_path in relative_paths:
+        if relative_path == str(RESCAN):
+            return set(INDEX_UPDATERS)
+        if relative_path.startswith("knowledge/"):
+            affected.update(("search", "semantic"))
+            continue
+        if not relative_path.startswith("LM_context/"):
+            continue
+        context_path = relative_path[len("LM_context/"):]
+        if context_path.startswith("archive/"):
+            affected.update(("search", "semantic"))
+            continue
+        affected.update(("freshness", "tokens", "semantic"))
+        if context_path in pack_files or any(context_path.startswith(d) for d in pack_dirs):
+            affected.add("pack")
+        if context_path.startswith(FAILED_SOLUTIONS_DIR + "/"):
+            affected.add("failures")
+    return affected
+
+
+class ContextWatcher:
+    def __init__(self, project_dir: str, debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+                 poll_interval: float = DEFAULT_POLL_SECONDS, force_polling: bool = False):
+        self.project_dir = Path(project_dir).resolve()
+        if self.project_dir.name == "LM_context":
+            self.project_dir = self.project_dir.parent
+        self.status_path = self.project_dir / "LM_context" / INDEX_DIR / STATUS_FILENAME
+        self.roots = [self.project_dir / root for root in WATCH_ROOTS if (self.project_dir / root).is_dir()]
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.force_polling = force_polling
+
+        self.pending: Set[str] = set()
+        self.last_event = 0.0
+        self.condition = threading.Condition()
+        self.stop_event = threading.Event()
+        self.status = {
+            "pid": os.getpid(),
+            "project": str(self.project_dir),
+            "started": datetime.now().isoformat(timespec='seconds'),
+            "backend": None,
+            "state": "starting",
+            "events": 0,
+            "updates": 0,
+            "last_update": None,
+            "indexes": {},
+            "errors": []
+        }
+
+    def open_backend(self):
+        """Prefer inotify; fall back to polling where it is missing or exhausted."""
+        if not self.force_polling and sys.platform.startswith("linux"):
+            try:
+                return InotifyBackend(self.roots)
+            except (OSError, AttributeError) as e:
+                print(f"⚠️ inotify unavailable ({e}), polling every {self.poll_interval}s instead")
+        return PollingBackend(self.roots, self.poll_interval)
+
+    def write_status(self) -> None:
+        """Write the status file atomically so readers never see half of it."""
+        self.status_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.status_path.with_name(STATUS_FILENAME + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.status, f, indent=1)
+        os.replace(tmp_path, self.status_path)
+
+    def refresh(self, indexes: Iterable[str]) -> None:
+        """Run the given index updaters and record how each went."""
+        wanted = set(indexes)
+        self.status["state"] = "updating"
+        self.write_status()
+        for name, updater in INDEX_UPDATERS.items():
+            if name not in wanted:
+                continue
+            started = time.perf_counter()
+            try:
+                updater(self.project_dir)
+                error = None
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                self.status["errors"] = (self.status["errors"] + [
+                    {"index": name, "error": error, "at": datetime.now().isoformat(timespec='seconds')}
+                ])[-10:]
+                print(f"💥 {name} index update failed: {error}")
+            self.status["indexes"][name] = {
+                "updated": datetime.now().isoformat(timespec='seconds'),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                "ok": error is None
+            }
+        self.status["updates"] += 1
+        self.status["last_update"] = datetime.now().isoformat(timespec='seconds')
+        self.status["state"] = "idle"
+        self.write_status()
+
+    def _worker(self) -> None:
+        """Wait for a quiet period after the last event, then refresh affected indexes."""
+        while not self.stop_event.is_set():
+            with self.condition:
+                while not self.pending and not self.stop_event.is_set():
+                    self.condition.wait()
+                while not self.stop_event.is_set():
+                    remaining = self.last_event + self.debounce - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                changed, self.pending = self.pending, set()
+            if changed and not self.stop_event.is_set():
+                indexes = affected_indexes(changed)
+                if indexes:
+                    print(f"🔄 {len(changed)} paths changed → updating {', '.join(sorted(indexes))}")
+                    self.refresh(indexes)
+
+    def run(self) -> None:
+        """Refresh everything once, then watch until SIGINT/SIGTERM."""
+        signal.signal(signal.SIGTERM, lambda signum, frame: self.stop_event.set())
+        backend = self.open_backend()
+        self.status["backend"] = backend.name
+        print(f"👀 Watching {', '.join(str(root) for root in self.roots)} ({backend.name})")
+
+        self.refresh(INDEX_UPDATERS)
+        worker = threading.Thread(target=self._worker, name="index-worker", daemon=True)
+        worker.start()
+        try:
+            while not self.stop_event.is_set():
+                changed = backend.read_events(0.5)
+                changed = {path for path in changed if path == RESCAN or not is_ignored(path, self.project_dir)}
+                if not changed:
+                    continue
+                with self.condition:
+                    self.pending.update(
+                        str(RESCAN) if path == RESCAN else path.relative_to(self.project_dir).as_posix()
+                        for path in changed
+                    )
+                    self.status["events"] += len(changed)
+                    self.last_event = time.monotonic()
+                    self.condition.notify()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop_event.set()
+            with self.condition:
+                self.condition.notify()
+            worker.join()
+            backend.close()
+            self.status["state"] = "stopped"
+            self.status["pid"] = None
+            self.write_status()
+            print("👋 Watcher stopped")
+
+
+def read_status(project_dir: str) -> Optional[Dict]:
+    """Load a watcher's status file and check whether its process is alive."""
+    project = Path(project_dir).resolve()
+    if project.name == "LM_context":
+        project = project.parent
+    status_path = project / "LM_context" / INDEX_DIR / STATUS_FILENAME
+    if not status_path.exists():
+        return None
+    with open(status_path, 'r', encoding='utf-8') as f:
+        status = json.load(f)
+    status["running"] = False
+    if status.get("pid"):
+        try:
+            os.kill(status["pid"], 0)
+            status["running"] = True
+        except ProcessLookupError:
+            pass
+        except PermissionError:
+            status["running"] = True
+    return status
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Keep LM_context indexes up to date while files change",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Keep a project's indexes hot on a dev VM
+  nohup python3 context_watch.py run /Users/vn/ws/melexis-simple > /tmp/context-watch.log 2>&1 &
+
+  # Session start: is the precomputed state current?
+  python3 context_watch.py status /Users/vn/ws/melexis-simple
+
+  # Shut it down
+  python3 context_watch.py stop /Users/vn/ws/melexis-simple
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Watch in the foreground until interrupted")
+    run_parser.add_argument("--poll", action="store_true", help="Poll file stats instead of using inotify")
+    run_parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_SECONDS,
+                            help=f"Seconds between polls (default: {DEFAULT_POLL_SECONDS})")
+    run_parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE_SECONDS,
+                            help=f"Quiet seconds to wait after the last event (default: {DEFAULT_DEBOUNCE_SECONDS})")
+    status_parser = subparsers.add_parser("status", help="Show the watcher status")
+    status_parser.add_argument("--json", action="store_true", help="Print the status as JSON")
+    stop_parser = subparsers.add_parser("stop", help="Stop a running watcher")
+
+    for sub in (run_parser, status_parser, stop_parser):
+        sub.add_argument(
+            "project",
+            nargs="?",
+            default=".",
+            help="Project directory or its LM_context/ directory (default: current directory)"
+        )
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        watcher = ContextWatcher(args.project, args.debounce, args.poll_interval, args.poll)
+        if not watcher.roots or not (watcher.project_dir / "LM_context").is_dir():
+            print(f"❌ LM_context not found in {watcher.project_dir}")
+            sys.exit(1)
+        existing = read_status(args.project)
+        if existing and existing["running"] and existing["pid"] != os.getpid():
+            print(f"❌ A watcher is already running for this project (pid {existing['pid']})")
+            sys.exit(1)
+        watcher.run()
+        return
+
+    status = read_status(args.project)
+    if status is None:
+        print("💤 No watcher has run for this project")
+        sys.exit(1)
+
+    if args.command == "stop":
+        if not status["running"]:
+            print("💤 Watcher is not running")
+            return
+        os.kill(status["pid"], signal.SIGTERM)
+        print(f"🛑 Sent SIGTERM to watcher (pid {status['pid']})")
+        return
+
+    if args.json:
+        print(json.dumps(status, indent=2))
+        return
+
+    icon = "👀" if status["running"] else "💤"
+    state = status["state"] if status["running"] else "not running"
+    print(f"{icon} Watcher {state} ({status['backend']}), started {status['started']}")
+    print(f"   {status['events']} events, {status['updates']} updates, last update {status['last_update']}")
+    for name, item in status["indexes"].items():
+        print(f"   {'✅' if item['ok'] else '💥'} {name:<10} {item['updated']}  {item['duration_ms']} ms")
+    for error in status["errors"][-3:]:
+        print(f"   ⚠️ {error['at']} {error['index']}: {error['error']}")
+    if not status["running"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
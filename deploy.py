@@ -7,39 +7,313 @@ It creates the proper directory structure and copies all necessary files.
 
 Usage:
     python3 deploy.py /path/to/your/project/directory
+    python3 deploy.py --update /path/to/existing/project
+    python3 deploy.py --targets-file projects.txt --update
+    python3 deploy.py --bundle framework.lmcb /path/to/your/project
 
 Example:
     python3 deploy.py /Users/username/my-learning-project
     python3 deploy.py /home/user/development/ai-research
 """
 
-import os
+import re
 import sys
-import shutil
+import json
+import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from context_journal import WriteJournal
+from context_objects import cache_store, LINK_MODES
+from context_bundle import ContextBundle, check_bundle_mode
+from context_sections import file_digest
+
+DEPLOY_MANIFEST = ".deploy-manifest.json"
+
+# Template files in templates/ (without the .tmpl suffix)
+TEMPLATE_NAMES = [
+    "project-readme.md",
+    "collaboration-workflow.md",
+    "session-handoff.md",
+    "current-iteration.md",
+    "environment.md",
+    "assumption-validator.py",
+    "deployment-summary.md"
+]
+
+PLACEHOLDER_PATTERN = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+# Project-type-specific customizations
+PROJECT_TYPE_CONFIGS = {
+    "technical": {
+        "iteration_goal": "Technical Implementation & System Integration",
+        "hypothesis": "The technical system can be implemented with current tools and environment",
+        "experiment": "Setting up development environment and testing basic functionality",
+        "priorities": [
+            "Set up development environment and verify all tools work",
+            "Implement basic functionality and test core features",
+            "Debug any integration issues and document solutions"
+        ],
+        "working_state": "Development environment with IDE, build tools, and testing framework",
+        "resources": "Technical documentation, API references, development tools",
+        "completion_criteria": [
+            "Development environment fully configured and tested",
+            "Basic functionality implemented and working",
+            "Core integration points validated and documented"
+        ]
+    },
+    "research": {
+        "iteration_goal": "Research Design & Hypothesis Validation",
+        "hypothesis": "The research question can be systematically investigated with available methods",
+        "experiment": "Designing research methodology and conducting initial validation",
+        "priorities": [
+            "Define research question and methodology clearly",
+            "Conduct literature review and identify key sources",
+            "Design experiments and validation framework"
+        ],
+        "working_state": "Research environment with literature access and analysis tools",
+        "resources": "Academic papers, research databases, analysis software",
+        "completion_criteria": [
+            "Research question clearly defined and scoped",
+            "Literature review completed with key insights documented",
+            "Experimental design validated and ready for execution"
+        ]
+    },
+    "documentation": {
+        "iteration_goal": "Documentation Architecture & Content Creation",
+        "hypothesis": "Comprehensive documentation can be created systematically with clear structure",
+        "experiment": "Establishing documentation framework and creating initial content",
+        "priorities": [
+            "Design documentation architecture and information hierarchy",
+            "Create templates and style guides for consistent content",
+            "Develop initial content sections and validate approach"
+        ],
+        "working_state": "Documentation environment with writing tools and content management",
+        "resources": "Style guides, content templates, collaboration tools",
+        "completion_criteria": [
+            "Documentation architecture designed and validated",
+            "Content templates created and tested",
+            "Initial documentation sections completed and reviewed"
+        ]
+    },
+    "collaborative": {
+        "iteration_goal": "Team Coordination & Collaboration Framework",
+        "hypothesis": "Effective collaboration can be achieved through systematic coordination and communication",
+        "experiment": "Establishing collaboration processes and testing team coordination",
+        "priorities": [
+            "Set up collaboration tools and communication channels",
+            "Define team roles, responsibilities, and workflows",
+            "Establish decision-making processes and documentation standards"
+        ],
+        "working_state": "Collaborative environment with shared tools and communication channels",
+        "resources": "Collaboration platforms, communication tools, shared repositories",
+        "completion_criteria": [
+            "Collaboration framework established and tested",
+            "Team roles and workflows clearly defined",
+            "Communication processes validated and documented"
+        ]
+    }
+}
+
+
+class CompiledTemplate:
+    """A template parsed once into literal text and {{ placeholder }} fields."""
+    
+    def __init__(self, name, segments):
+        self.name = name
+        self.segments = segments  # list of (is_field, literal text or field name)
+        
+    @classmethod
+    def parse(cls, name, text):
+        """Split template text into literal and placeholder segments."""
+        segments = []
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(text):
+            if match.start() > position:
+                segments.append((False, text[position:match.start()]))
+            segments.append((True, match.group(1)))
+            position = match.end()
+        if position < len(text):
+            segments.append((False, text[position:]))
+        return cls(name, segments)
+        
+    def partial(self, context):
+        """Substitute the fields present in context, keeping the others."""
+        segments = []
+        for is_field, value in self.segments:
+            if is_field and value in context:
+                is_field, value = False, str(context[value])
+            if not is_field and segments and not segments[-1][0]:
+                segments[-1] = (False, segments[-1][1] + value)
+            else:
+                segments.append((is_field, value))
+        return CompiledTemplate(self.name, segments)
+        
+    def render(self, context):
+        """Render the template; every remaining field must be in context."""
+        parts = []
+        for is_field, value in self.segments:
+            if not is_field:
+                parts.append(value)
+            elif value in context:
+                parts.append(str(context[value]))
+            else:
+                raise ValueError(f"Template {self.name} has no value for placeholder '{value}'")
+        return "".join(parts)
+
+class TemplateLibrary:
+    """Deployment templates loaded from disk with cached partial renders.
+    
+    Each template file is parsed once. Values shared by every target (the
+    project-type configuration and today's date) are substituted once per
+    (template, project_type, date) and cached, so a deployment only fills
+    in its own target-specific values.
+    """
+    
+    def __init__(self, templates_dir):
+        self.templates_dir = Path(templates_dir)
+        self.compiled = {}
+        self.partials = {}
+        
+    def load(self, name):
+        """Return the parsed template, reading it from disk on first use."""
+        if name not in self.compiled:
+            template_path = self.templates_dir / f"{name}.tmpl"
+            with open(template_path, 'r', encoding='utf-8') as f:
+                self.compiled[name] = CompiledTemplate.parse(name, f.read())
+        return self.compiled[name]
+        
+    @staticmethod
+    def shared_context(project_type, now):
+        """Values that are the same for every target of a project type on a given day."""
+        config = PROJECT_TYPE_CONFIGS.get(project_type, PROJECT_TYPE_CONFIGS["technical"])
+        return {
+            "project_type": project_type,
+            "project_type_title": project_type.title(),
+            "date_long": now.strftime('%B %d, %Y'),
+            "date_iso": now.strftime('%Y-%m-%d'),
+            "iteration_goal": config["iteration_goal"],
+            "hypothesis": config["hypothesis"],
+            "experiment": config["experiment"],
+            "priority_1": config["priorities"][0],
+            "priority_2": config["priorities"][1],
+            "priority_3": config["priorities"][2],
+            "working_state": config["working_state"],
+            "resources": config["resources"],
+            "criterion_1": config["completion_criteria"][0],
+            "criterion_2": config["completion_criteria"][1],
+            "criterion_3": config["completion_criteria"][2]
+        }
+        
+    def prepared(self, name, project_type, now):
+        """Return the template with shared values already substituted."""
+        key = (name, project_type, now.strftime('%Y-%m-%d'))
+        if key not in self.partials:
+            self.partials[key] = self.load(name).partial(self.shared_context(project_type, now))
+        return self.partials[key]
+        
+    def prepare_all(self, project_type):
+        """Parse and pre-render every template (e.g. before a fleet deploy)."""
+        now = datetime.now()
+        for name in TEMPLATE_NAMES:
+            self.prepared(name, project_type, now)
+            
+    def render(self, name, project_type, target_context):
+        """Render a template for one target."""
+        return self.prepared(name, project_type, datetime.now()).render(target_context)
+
 class LLMContextDeployer:
-    def __init__(self, target_directory, project_type="technical"):
+    def __init__(self, target_directory, project_type="technical", update=False, force=False,
+                 quiet=False, templates=None, objects=None, link="auto", bundle=None):
         self.target_dir = Path(target_directory).resolve()
         self.project_type = project_type
+        self.update = update
+        self.force = force
+        
+        # Quiet deployers (fleet mode) collect output instead of printing it
+        self.quiet = quiet
+        self.log_lines = []
         self.script_dir = Path(__file__).parent.resolve()
         self.lm_context_dir = self.script_dir / "LM_context"
         self.templates_dir = self.script_dir / "templates"
+        self.templates = templates if templates is not None else TemplateLibrary(self.templates_dir)
+        
+        # Guides are resolved through a content-addressed store in the user's
+        # cache (the framework checkout is only read) and placed from its
+        # blobs, reflinked or hardlinked if possible; None copies directly
+        self.objects = objects if objects is not None else cache_store(self.script_dir)
+        self.link = link
+        
+        # An open ContextBundle replaces LM_context/ as the source of guides
+        self.bundle = bundle
+        
+        # Digests of everything this script wrote, kept in the target's
+        # LM_context/ so --update can tell framework changes from user edits
+        self.manifest_path = self.target_dir / "LM_context" / DEPLOY_MANIFEST
+        self.manifest = {"guides": {}, "templates": {}}
+        self.changes = {"written": [], "unchanged": [], "preserved": []}
+        
+        # Every file written lands atomically through one journaled batch,
+        # so a deployment or update can be rolled back as a whole
+        self.journal = WriteJournal(self.target_dir)
+        self.batch = None
+        
+    def log(self, message=""):
+        """Print a progress message, or keep it for later in quiet mode."""
+        if self.quiet:
+            self.log_lines.append(message)
+        else:
+            print(message)
+            
+    def render_template(self, name):
+        """Render a template from templates/ for this target."""
+        now = datetime.now()
+        return self.templates.render(name, self.project_type, {
+            "project_name": self.target_dir.name.replace('-', ' ').replace('_', ' ').title(),
+            "target_dir": self.target_dir,
+            "target_name": self.target_dir.name,
+            "time": now.strftime('%I:%M %p')
+        })
+        
+    def load_manifest(self):
+        """Load the deployment manifest from a previous deployment."""
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, 'r') as f:
+                    data = json.load(f)
+                self.manifest["guides"] = data.get("guides", {})
+                self.manifest["templates"] = data.get("templates", {})
+            except (OSError, ValueError) as e:
+                self.log(f"⚠️  Ignoring unreadable deployment manifest: {e}")
+                
+    def save_manifest(self):
+        """Save the deployment manifest for future --update runs."""
+        self.batch.write_text(self.manifest_path, json.dumps({
+            "version": 1,
+            "deployed": datetime.now().isoformat(),
+            "project_type": self.project_type,
+            "guides": self.manifest["guides"],
+            "templates": self.manifest["templates"]
+        }, indent=2, sort_keys=True))
         
     def validate_environment(self):
         """Validate that the deployment environment is ready."""
-        print("🔍 Validating deployment environment...")
+        self.log("🔍 Validating deployment environment...")
         
         # Check if LM_context directory has required files
-        if not self.lm_context_dir.exists():
+        if self.bundle is None and not self.lm_context_dir.exists():
             raise FileNotFoundError(f"LM_context directory not found: {self.lm_context_dir}")
             
         # Check for available guides in the new structure
         guide_dirs = ["human-guides", "llm-guides"]
         total_guides = 0
         for guide_dir in guide_dirs:
+            if self.bundle is not None:
+                total_guides += len([path for path in self.bundle.list_files(f"{guide_dir}/", ".md")
+                                     if "/" not in path[len(guide_dir) + 1:]])
+                continue
             guide_path = self.lm_context_dir / guide_dir
             if guide_path.exists():
                 total_guides += len(list(guide_path.glob("*.md")))
@@ -47,11 +321,16 @@ class LLMContextDeployer:
         if total_guides == 0:
             raise FileNotFoundError(f"No guide files found in LM_context structure")
             
-        print(f"✅ Environment validation passed - Found {total_guides} guide files")
+        # Check that every template file is present
+        missing_templates = [name for name in TEMPLATE_NAMES if not (self.templates_dir / f"{name}.tmpl").exists()]
+        if missing_templates:
+            raise FileNotFoundError(f"Template files missing from {self.templates_dir}: {', '.join(missing_templates)}")
+            
+        self.log(f"✅ Environment validation passed - Found {total_guides} guide files")
         
     def create_directory_structure(self):
         """Create the standard LM_context directory structure."""
-        print("📁 Creating directory structure...")
+        self.log("📁 Creating directory structure...")
         
         directories = [
             "LM_context",
@@ -69,12 +348,14 @@ class LLMContextDeployer:
         
         for directory in directories:
             dir_path = self.target_dir / directory
+            if self.update and dir_path.is_dir():
+                continue
             dir_path.mkdir(parents=True, exist_ok=True)
-            print(f"  ✅ Created: {directory}")
+            self.log(f"  ✅ Created: {directory}")
             
     def copy_system_guides(self):
         """Copy all system guide files to the target directory with new organization."""
-        print("📋 Copying system guides...")
+        self.log("📋 Copying system guides...")
         
         # Define guide categories and their target directories
         # NOTE: system-docs files moved to knowledge/ and are NOT deployed to new projects
@@ -96,776 +377,169 @@ class LLMContextDeployer:
             target_dir.mkdir(exist_ok=True)
             
             for guide_file in guide_files:
-                source_file = self.lm_context_dir / category / guide_file
-                if source_file.exists():
-                    target_file = target_dir / guide_file
-                    shutil.copy2(source_file, target_file)
-                    print(f"  ✅ Copied: {category}/{guide_file}")
+                relative_path = f"{category}/{guide_file}"
+                if self.guide_exists(relative_path):
+                    self.copy_guide(relative_path, target_dir / guide_file)
                 else:
-                    print(f"  ⚠️  Missing: {guide_file} (will be created as placeholder)")
+                    self.log(f"  ⚠️  Missing: {guide_file} (will be created as placeholder)")
+                    
+    def guide_exists(self, relative_path):
+        """Whether a guide (path relative to LM_context/) is available to deploy."""
+        if self.bundle is not None:
+            return relative_path in self.bundle.files
+        return (self.lm_context_dir / relative_path).exists()
+        
+    def resolve_guide(self, relative_path):
+        """Store a guide in the object store; return its digest and source file (None if bundled).
+        
+        A bundled guide is only decompressed when the store lacks its blob.
+        If the store cannot be written, guides are copied without it.
+        """
+        if self.bundle is not None:
+            digest = self.bundle.file(relative_path)["digest"]
+            source_file = None
+        else:
+            digest = None
+            source_file = self.lm_context_dir / relative_path
+            
+        if self.objects is not None:
+            try:
+                if source_file is None:
+                    return self.objects.store_bytes(digest, lambda: self.bundle.read_bytes(relative_path)), None
+                return self.objects.ingest(source_file), source_file
+            except OSError as e:
+                self.log(f"  ⚠️  Object store unavailable ({e}) - copying guides directly")
+                self.objects = None
+        return digest or file_digest(source_file), source_file
+        
+    def place_guide(self, relative_path, digest, source_file, target_file):
+        """Write a resolved guide to the target, from the object store when there is one."""
+        if self.objects is not None:
+            self.objects.place(self.batch, digest, target_file, self.link, copystat_from=source_file)
+        elif source_file is None:
+            self.batch.write_bytes(target_file, self.bundle.read_bytes(relative_path),
+                                   check_bundle_mode(relative_path, self.bundle.file(relative_path)["mode"]))
+        else:
+            self.batch.copy_file(source_file, target_file, digest)
+        
+    def copy_guide(self, relative_path, target_file):
+        """Copy one guide, skipping it in --update mode when nothing changed."""
+        source_digest, source_file = self.resolve_guide(relative_path)
+        
+        if self.update and target_file.exists():
+            recorded = self.manifest["guides"].get(relative_path)
+            target_digest = file_digest(target_file)
+            
+            if target_digest == source_digest:
+                self.manifest["guides"][relative_path] = source_digest
+                self.changes["unchanged"].append(relative_path)
+                return
+            if target_digest != recorded and not self.force:
+                self.log(f"  ⚠️  Kept: {relative_path} (modified locally - sync it back or use --force)")
+                self.changes["preserved"].append(relative_path)
+                return
+                
+        self.place_guide(relative_path, source_digest, source_file, target_file)
+        self.manifest["guides"][relative_path] = source_digest
+        self.changes["written"].append(relative_path)
+        self.log(f"  ✅ Copied: {relative_path}")
+        
+    def write_template(self, relative_path, render, executable=False):
+        """Write a generated template, leaving existing files alone in --update mode.
+        
+        relative_path is relative to the target directory; render is the
+        generator method, only called when the file actually needs writing.
+        """
+        target_file = self.target_dir / relative_path
+        
+        if self.update and target_file.exists():
+            recorded = self.manifest["templates"].get(relative_path)
+            if recorded is not None and file_digest(target_file) == recorded:
+                self.changes["unchanged"].append(relative_path)
+            else:
+                self.changes["preserved"].append(relative_path)
+                self.log(f"  ⏭️  Kept: {relative_path} (customized)")
+            return
+            
+        mode = 0o755 if executable else None  # Make executable
+        self.batch.write_text(target_file, render(), mode)
+        self.manifest["templates"][relative_path] = file_digest(target_file)
+        self.changes["written"].append(relative_path)
+        self.log(f"  ✅ Created: {relative_path}")
             
     def create_template_files(self):
         """Create template files for the new project."""
-        print("📝 Creating template files...")
+        self.log("📝 Creating template files...")
         
         # Create README.md
-        readme_content = self.generate_project_readme()
-        readme_path = self.target_dir / "LM_context" / "README.md"
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
-        print("  ✅ Created: LM_context/README.md")
+        self.write_template("LM_context/README.md", self.generate_project_readme)
         
         # Create collaboration-workflow.md
-        collaboration_content = self.generate_collaboration_workflow()
-        collaboration_path = self.target_dir / "LM_context" / "collaboration-workflow.md"
-        with open(collaboration_path, 'w') as f:
-            f.write(collaboration_content)
-        print("  ✅ Created: LM_context/collaboration-workflow.md")
+        self.write_template("LM_context/collaboration-workflow.md", self.generate_collaboration_workflow)
         
         # Create session-handoff.md template
-        handoff_content = self.generate_session_handoff_template()
-        handoff_path = self.target_dir / "LM_context" / "dynamic" / "session-handoff.md"
-        with open(handoff_path, 'w') as f:
-            f.write(handoff_content)
-        print("  ✅ Created: dynamic/session-handoff.md")
+        self.write_template("LM_context/dynamic/session-handoff.md", self.generate_session_handoff_template)
         
         # Create current-iteration.md template
-        iteration_content = self.generate_current_iteration_template()
-        iteration_path = self.target_dir / "LM_context" / "dynamic" / "current-iteration.md"
-        with open(iteration_path, 'w') as f:
-            f.write(iteration_content)
-        print("  ✅ Created: dynamic/current-iteration.md")
+        self.write_template("LM_context/dynamic/current-iteration.md", self.generate_current_iteration_template)
         
         # Create environment.md template
-        environment_content = self.generate_environment_template()
-        env_path = self.target_dir / "LM_context" / "static" / "environment.md"
-        with open(env_path, 'w') as f:
-            f.write(environment_content)
-        print("  ✅ Created: static/environment.md")
+        self.write_template("LM_context/static/environment.md", self.generate_environment_template)
         
         # Create basic assumption-validator.py template
-        validator_content = self.generate_validator_template()
-        validator_path = self.target_dir / "LM_context" / "dynamic" / "assumption-validator.py"
-        with open(validator_path, 'w') as f:
-            f.write(validator_content)
-        os.chmod(validator_path, 0o755)  # Make executable
-        print("  ✅ Created: dynamic/assumption-validator.py")
+        self.write_template(
+            "LM_context/dynamic/assumption-validator.py",
+            self.generate_validator_template,
+            executable=True
+        )
         
     def generate_collaboration_workflow(self):
         """Generate collaboration workflow template."""
-        return """# Human-LLM Collaboration Workflow
-
-## Core Cooperation Model
-
-This document defines the fundamental collaboration patterns between humans and LLMs in the context management system.
-
-## Context Restoration Flow (Session Start)
-
-```mermaid
-flowchart TD
-    A["👤 HUMAN: Starts Session"] --> B{"👤 HUMAN: Copy-Paste Session Command?"}
-    B -->|Yes| C["🤖 LLM: Reads Session Command"]
-    B -->|No| D["🤖 LLM: Generic Start"]
-    
-    C --> E["🤖 LLM: Read session-handoff.md"]
-    E --> F["🤖 LLM: Read current-iteration.md"]
-    F --> G["🤖 LLM: Read static/environment.md"]
-    G --> H["🤖 LLM: Check dynamic/failed-solutions/"]
-    H --> I["🤖 LLM: Read evolving/assumptions-log.md"]
-    
-    I --> J["🤖 LLM: Analyze Context Files"]
-    J --> K["🤖 LLM: Generate 3-5 Specific Questions"]
-    K --> L["🤖 LLM: Ask Context-Based Questions"]
-    L --> M["👤 HUMAN: Responds to Questions"]
-    M --> N["🤖 LLM: Understands Current State"]
-    N --> O["🤖 LLM: Begin Productive Session"]
-    
-    D --> P["🤖 LLM: Ask Generic Questions"]
-    P --> Q["👤 HUMAN: Provides Context Manually"]
-    Q --> R["🤖 LLM: Less Efficient Session Start"]
-```
-
-## Actor Responsibilities
-
-### Human Responsibilities
-- **Session Initiation**: Use copy-paste commands for optimal context restoration
-- **Question Response**: Provide clear, specific answers to LLM context questions
-- **Session Closure**: Trigger proper session end to preserve context
-- **Quality Validation**: Confirm LLM understanding and context accuracy
-- **Priority Setting**: Guide LLM on next session priorities and focus areas
-
-### LLM Responsibilities
-- **Context Reading**: Read files in priority order with validation
-- **Question Generation**: Ask specific, context-based questions (not generic)
-- **Understanding Validation**: Confirm correct interpretation of context
-- **Knowledge Compilation**: Update all relevant context files during closure
-- **Handoff Preparation**: Prepare clear context for next session
-
-## Collaboration Principles
-
-### 1. Context-First Approach
-- **Human**: Provides structured context through files, not lengthy explanations
-- **LLM**: Reads context systematically before asking questions
-- **Benefit**: Efficient session starts with complete understanding
-
-### 2. Question-Driven Clarification
-- **Human**: Responds to specific questions rather than providing unsolicited information
-- **LLM**: Asks targeted questions based on context analysis
-- **Benefit**: Focused communication without information overload
-
-### 3. Validation Checkpoints
-- **Human**: Confirms LLM understanding at key decision points
-- **LLM**: Validates interpretation before proceeding with work
-- **Benefit**: Prevents work based on misunderstood context
-
-### 4. Knowledge Preservation
-- **Human**: Ensures proper session closure for context preservation
-- **LLM**: Documents all discoveries and updates context files
-- **Benefit**: Continuous knowledge building across sessions
-
-## Success Metrics
-
-### Collaboration Effectiveness
-- **Session Start Time**: <30 seconds from command to productive work
-- **Context Accuracy**: >95% of context correctly understood by LLM
-- **Knowledge Preservation**: 100% of discoveries captured in context files
-- **Session Continuity**: Seamless handoff between sessions
-
----
-
-**Purpose:** Define the fundamental collaboration model between humans and LLMs
-**Audience:** Both humans and LLMs using the context management system
-**Usage:** Reference for proper collaboration patterns and quality validation
-"""
+        return self.render_template("collaboration-workflow.md")
 
     def generate_project_readme(self):
         """Generate project-specific README content."""
-        project_name = self.target_dir.name.replace('-', ' ').replace('_', ' ').title()
-        return f"""# {project_name} - LLM Context Management
-
-## Overview
-This directory contains the LLM context management system for the {project_name} project.
-
-## 🚀 Quick Start
-
-### For LLM Sessions
-1. **Start Here:** Read `guides/llm-session-quick-start.md`
-2. **Session Context:** Always read `dynamic/session-handoff.md` first
-3. **Check Failures:** MANDATORY check of `dynamic/failed-solutions/` before suggesting
-4. **Validation:** Use `assumption-validator.py` for all testing
-
-### For Human Maintenance
-1. **Quick Commands:** Use `guides/human-quick-commands.md`
-2. **Session Start:** Copy-paste one-line start command
-3. **Session End:** Copy-paste one-line end command
-
-## 📁 Directory Structure
-
-```
-LM_context/
-├── README.md                          # This file - project overview
-├── static/                            # Tier 1: Static Foundation
-│   ├── environment.md                 # Hardware, network, software setup
-│   ├── knowledge-base/                # Compiled knowledge
-│   └── resources/                     # PDF documents and static resources
-├── evolving/                          # Tier 2: Evolving Product
-│   ├── assumptions-log.md             # Hypothesis validation history
-│   └── project-plan.md                # Original project plan
-├── dynamic/                           # Tier 3: Dynamic Session
-│   ├── session-handoff.md             # CRITICAL - immediate session context
-│   ├── current-iteration.md           # Active iteration status
-│   ├── assumption-validator.py        # Automated validation framework
-│   └── failed-solutions/              # Failed solution tracking
-└── archive/                           # Completed work
-    └── daily-logs/                    # Daily session logs
-```
-
-## 🎯 Project Goal
-[CUSTOMIZE THIS: Describe your specific project goal and learning objectives]
-
-## 🛠️ Technical Context
-[CUSTOMIZE THIS: Add your project-specific technical details]
-- **Environment:** [Your development environment]
-- **Key Technologies:** [Technologies you're learning/using]
-- **Success Criteria:** [How you'll measure success]
-
----
-
-**Last Updated:** {datetime.now().strftime('%B %d, %Y')}  
-**System Version:** LLM Context Management System v1.2  
-**Purpose:** Context management for {project_name}
-"""
+        return self.render_template("project-readme.md")
 
     def generate_session_handoff_template(self):
         """Generate project-type-specific session handoff template."""
-        
-        # Project-type-specific customizations
-        project_configs = {
-            "technical": {
-                "iteration_goal": "Technical Implementation & System Integration",
-                "hypothesis": "The technical system can be implemented with current tools and environment",
-                "experiment": "Setting up development environment and testing basic functionality",
-                "priorities": [
-                    "Set up development environment and verify all tools work",
-                    "Implement basic functionality and test core features",
-                    "Debug any integration issues and document solutions"
-                ],
-                "working_state": "Development environment with IDE, build tools, and testing framework",
-                "resources": "Technical documentation, API references, development tools",
-                "completion_criteria": [
-                    "Development environment fully configured and tested",
-                    "Basic functionality implemented and working",
-                    "Core integration points validated and documented"
-                ]
-            },
-            "research": {
-                "iteration_goal": "Research Design & Hypothesis Validation",
-                "hypothesis": "The research question can be systematically investigated with available methods",
-                "experiment": "Designing research methodology and conducting initial validation",
-                "priorities": [
-                    "Define research question and methodology clearly",
-                    "Conduct literature review and identify key sources",
-                    "Design experiments and validation framework"
-                ],
-                "working_state": "Research environment with literature access and analysis tools",
-                "resources": "Academic papers, research databases, analysis software",
-                "completion_criteria": [
-                    "Research question clearly defined and scoped",
-                    "Literature review completed with key insights documented",
-                    "Experimental design validated and ready for execution"
-                ]
-            },
-            "documentation": {
-                "iteration_goal": "Documentation Architecture & Content Creation",
-                "hypothesis": "Comprehensive documentation can be created systematically with clear structure",
-                "experiment": "Establishing documentation framework and creating initial content",
-                "priorities": [
-                    "Design documentation architecture and information hierarchy",
-                    "Create templates and style guides for consistent content",
-                    "Develop initial content sections and validate approach"
-                ],
-                "working_state": "Documentation environment with writing tools and content management",
-                "resources": "Style guides, content templates, collaboration tools",
-                "completion_criteria": [
-                    "Documentation architecture designed and validated",
-                    "Content templates created and tested",
-                    "Initial documentation sections completed and reviewed"
-                ]
-            },
-            "collaborative": {
-                "iteration_goal": "Team Coordination & Collaboration Framework",
-                "hypothesis": "Effective collaboration can be achieved through systematic coordination and communication",
-                "experiment": "Establishing collaboration processes and testing team coordination",
-                "priorities": [
-                    "Set up collaboration tools and communication channels",
-                    "Define team roles, responsibilities, and workflows",
-                    "Establish decision-making processes and documentation standards"
-                ],
-                "working_state": "Collaborative environment with shared tools and communication channels",
-                "resources": "Collaboration platforms, communication tools, shared repositories",
-                "completion_criteria": [
-                    "Collaboration framework established and tested",
-                    "Team roles and workflows clearly defined",
-                    "Communication processes validated and documented"
-                ]
-            }
-        }
-        
-        config = project_configs.get(self.project_type, project_configs["technical"])
-        
-        return f"""# Project Session Handoff
-**Last Updated:** {datetime.now().strftime('%B %d, %Y, %I:%M %p')}
-**Project Type:** {self.project_type.title()}
-**Current Iteration:** 1 - {config['iteration_goal']}
-
-## Context Freshness Status
-- **Environment:** ✅ CURRENT (verified {datetime.now().strftime('%Y-%m-%d')}) - Development environment set up
-- **Assumptions:** ⚠️ NEEDS_UPDATE - No hypotheses validated yet
-- **Failed Solutions:** ✅ CURRENT (no failures yet) - New project setup
-- **Working Solutions:** ⚠️ NEEDS_UPDATE - No solutions documented yet
-
-**LLM Optimization:** Only read files marked ⚠️ NEEDS_UPDATE to save tokens
-
-## Iteration Context
-**Hypothesis Being Tested:** {config['hypothesis']}
-
-**Current Experiment:** {config['experiment']}
-
-**Progress:** 10% complete - Project structure created, ready to begin {self.project_type} work
-
-## Immediate Next Actions (Priority Order)
-1. **PRIORITY 1:** {config['priorities'][0]}
-2. **PRIORITY 2:** {config['priorities'][1]}
-3. **PRIORITY 3:** {config['priorities'][2]}
-
-## Current Working State
-**Development Environment:** {config['working_state']}
-**Project Location:** `{self.target_dir}`
-**Key Resources:** {config['resources']}
-
-## Blockers/Risks
-- **None currently identified** - New {self.project_type} project setup
-- [CUSTOMIZE: Add any known blockers or risks specific to {self.project_type} work]
-
-## Definition of Done for Current Iteration
-- [ ] {config['completion_criteria'][0]}
-- [ ] {config['completion_criteria'][1]}
-- [ ] {config['completion_criteria'][2]}
-
-## Context for Next Session
-**If Iteration 1 Complete:** Move to Iteration 2 - Advanced {self.project_type.title()} Implementation
-**If Iteration 1 Continues:** Continue with current {self.project_type} setup and validation
-
-## Files to Read First in New Session
-1. **CRITICAL:** `dynamic/current-iteration.md` - Active iteration status
-2. **IMPORTANT:** `static/environment.md` - Development environment setup
-3. **REFERENCE:** `guides/llm-session-quick-start.md` - Session procedures
-4. **CONTEXT:** `README.md` - Project overview and goals
-
-## Project Development Notes
-- {self.project_type.title()} project structure created using LLM Context Management System
-- Ready to begin systematic {self.project_type} development and learning
-- All context management tools configured for {self.project_type} workflows
-
-"""
+        return self.render_template("session-handoff.md")
 
     def generate_current_iteration_template(self):
         """Generate current iteration template."""
-        return f"""# Current Iteration Context
-**Iteration:** 1 - Project Setup & Initial Learning
-**Started:** {datetime.now().strftime('%B %d, %Y')}
-**Goal:** [CUSTOMIZE: Your specific iteration goal]
-
-## Current Hypothesis
-"[CUSTOMIZE: Your current hypothesis or assumption to test]"
-
-## Experiment Design
-- **Experiment 1:** [CUSTOMIZE: First experiment or learning task]
-- **Experiment 2:** [CUSTOMIZE: Second experiment or learning task]
-- **Experiment 3:** [CUSTOMIZE: Third experiment or learning task]
-
-## Success Criteria
-- [ ] [CUSTOMIZE: Specific, measurable success criteria]
-- [ ] [CUSTOMIZE: Additional success criteria]
-- [ ] [CUSTOMIZE: More success criteria]
-
-## Current Status
-- ✅ **Project Setup:** LLM Context Management System deployed
-- ⏳ **Learning Phase:** Ready to begin systematic learning
-- ⏳ **Validation Framework:** Need to customize assumption-validator.py
-- ⏳ **Knowledge Base:** Ready to accumulate insights
-
-## Active Experiments
-
-### Experiment 1: [CUSTOMIZE TITLE] ⏳ PENDING
-**Status:** Ready to begin
-**Evidence:** Project structure created
-**Next:** [CUSTOMIZE: Specific next steps]
-
-## Next Actions (Priority Order)
-1. **PRIORITY 1:** [CUSTOMIZE: Most important next action]
-2. **PRIORITY 2:** [CUSTOMIZE: Second priority action]
-3. **PRIORITY 3:** [CUSTOMIZE: Third priority action]
-
-## Definition of Done for Current Iteration
-- [ ] [CUSTOMIZE: Specific completion criteria]
-- [ ] [CUSTOMIZE: Additional completion criteria]
-- [ ] [CUSTOMIZE: More completion criteria]
-
-## Risks and Mitigation
-- **Risk:** [CUSTOMIZE: Potential risk]
-  - **Mitigation:** [CUSTOMIZE: How to mitigate]
-
-## Key Insights Gained
-[This section will be updated as you learn]
-
-## Technical Architecture
-[CUSTOMIZE: Add your project-specific technical details]
-
-## Evidence Collected
-[This section will be updated with validation results]
-
-## Next Iteration Planning
-**Iteration 2:** [CUSTOMIZE: Next iteration focus]
-- **Focus:** [CUSTOMIZE: What to focus on next]
-- **Goal:** [CUSTOMIZE: Next iteration goal]
-
----
-
-**Last Updated:** {datetime.now().strftime('%B %d, %Y, %I:%M %p')}  
-**Progress:** 10% complete - Project setup complete, ready to begin  
-**Next Session Focus:** [CUSTOMIZE: What to focus on in next session]
-"""
+        return self.render_template("current-iteration.md")
 
     def generate_environment_template(self):
         """Generate environment template."""
-        return f"""# Development Environment Configuration
-
-## System Information
-**Last Updated:** {datetime.now().strftime('%B %d, %Y')}
-**Operating System:** [CUSTOMIZE: Your OS - e.g., macOS, Linux, Windows]
-**Development Machine:** [CUSTOMIZE: Your machine specs]
-
-## Project Setup
-**Project Directory:** `{self.target_dir}`
-**Context Directory:** `{self.target_dir}/LM_context`
-
-## Development Tools
-[CUSTOMIZE: List your development tools]
-- **IDE/Editor:** [e.g., VSCode, PyCharm, etc.]
-- **Version Control:** [e.g., Git]
-- **Package Manager:** [e.g., pip, npm, etc.]
-- **Build Tools:** [e.g., Make, CMake, etc.]
-
-## Dependencies
-[CUSTOMIZE: List your project dependencies]
-- **Language:** [e.g., Python 3.9+, Node.js, etc.]
-- **Key Libraries:** [List important libraries/frameworks]
-- **System Dependencies:** [Any system-level requirements]
-
-## Network Configuration
-[CUSTOMIZE: If your project involves networking]
-- **Development Machine IP:** [Your IP if relevant]
-- **Target Devices:** [Any remote devices if relevant]
-- **Ports Used:** [Any specific ports]
-
-## Hardware Requirements
-[CUSTOMIZE: Any specific hardware needs]
-- **Minimum RAM:** [e.g., 8GB]
-- **Storage:** [e.g., 10GB free space]
-- **Special Hardware:** [Any special requirements]
-
-## Environment Variables
-[CUSTOMIZE: Any required environment variables]
-```bash
-export PROJECT_ROOT="{self.target_dir}"
-export CONTEXT_DIR="{self.target_dir}/LM_context"
-# Add other environment variables as needed
-```
-
-## Installation Instructions
-[CUSTOMIZE: How to set up the development environment]
-
-### 1. Clone/Setup Project
-```bash
-cd {self.target_dir}
-# Add your project setup commands here
-```
-
-### 2. Install Dependencies
-```bash
-# Add your dependency installation commands here
-```
-
-### 3. Verify Installation
-```bash
-# Add verification commands here
-python3 LM_context/dynamic/assumption-validator.py --health-check
-```
-
-## Troubleshooting
-[CUSTOMIZE: Common environment issues and solutions]
-
-### Common Issues
-- **Issue 1:** [Description]
-  - **Solution:** [How to fix]
-- **Issue 2:** [Description]
-  - **Solution:** [How to fix]
-
-## Performance Considerations
-[CUSTOMIZE: Any performance-related environment notes]
-- **CPU Usage:** [Expected CPU usage patterns]
-- **Memory Usage:** [Expected memory usage]
-- **Disk Usage:** [Expected disk usage]
-
----
-
-**Environment Status:** ✅ Ready for development  
-**Last Verified:** {datetime.now().strftime('%B %d, %Y')}  
-**Next Review:** [Set a date for next environment review]
-"""
+        return self.render_template("environment.md")
 
     def generate_validator_template(self):
         """Generate basic assumption validator template."""
-        return '''#!/usr/bin/env python3
-"""
-Assumption Validator for Project
-
-This script validates project assumptions and hypotheses.
-Customize the validation methods for your specific project needs.
-"""
-
-import sys
-import json
-import subprocess
-import argparse
-from datetime import datetime
-from pathlib import Path
-
-class AssumptionValidator:
-    def __init__(self):
-        self.results = {
-            "timestamp": datetime.now().isoformat(),
-            "validations": {},
-            "summary": {
-                "total": 0,
-                "passed": 0,
-                "failed": 0,
-                "errors": []
-            }
-        }
-        
-    def validate_environment(self):
-        """Validate basic development environment."""
-        print("🔍 Validating development environment...")
-        
-        try:
-            # Check Python version
-            python_version = sys.version_info
-            if python_version.major >= 3 and python_version.minor >= 7:
-                self.record_result("python_version", True, f"Python {python_version.major}.{python_version.minor}")
-            else:
-                self.record_result("python_version", False, f"Python version too old: {python_version}")
-                
-            # Check project directory structure
-            context_dir = Path(__file__).parent.parent
-            required_dirs = ["static", "evolving", "dynamic", "archive"]
-            
-            for dir_name in required_dirs:
-                dir_path = context_dir / dir_name
-                if dir_path.exists():
-                    self.record_result(f"directory_{dir_name}", True, f"Directory exists: {dir_name}")
-                else:
-                    self.record_result(f"directory_{dir_name}", False, f"Missing directory: {dir_name}")
-                    
-            return True
-            
-        except Exception as e:
-            self.record_result("environment_validation", False, f"Error: {str(e)}")
-            return False
-            
-    def validate_project_specific(self):
-        """
-        CUSTOMIZE THIS METHOD for your specific project validations.
-        
-        Examples:
-        - Test API connectivity
-        - Verify database connections
-        - Check hardware availability
-        - Validate configuration files
-        - Test build processes
-        """
-        print("🔍 Validating project-specific requirements...")
-        
-        try:
-            # Example validation - customize for your project
-            self.record_result("project_setup", True, "Project setup validation placeholder")
-            
-            # Add your specific validations here:
-            # - Hardware checks
-            # - Network connectivity
-            # - Service availability
-            # - Configuration validation
-            # - Build system checks
-            
-            return True
-            
-        except Exception as e:
-            self.record_result("project_validation", False, f"Error: {str(e)}")
-            return False
-            
-    def record_result(self, test_name, passed, details):
-        """Record a validation result."""
-        self.results["validations"][test_name] = {
-            "passed": passed,
-            "details": details,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        self.results["summary"]["total"] += 1
-        if passed:
-            self.results["summary"]["passed"] += 1
-            print(f"  ✅ {test_name}: {details}")
-        else:
-            self.results["summary"]["failed"] += 1
-            self.results["summary"]["errors"].append(f"{test_name}: {details}")
-            print(f"  ❌ {test_name}: {details}")
-            
-    def run_health_check(self):
-        """Run basic health check validations."""
-        print("🏥 Running health check...")
-        
-        success = True
-        success &= self.validate_environment()
-        
-        return success
-        
-    def run_full_validation(self):
-        """Run complete validation suite."""
-        print("🔬 Running full validation suite...")
-        
-        success = True
-        success &= self.validate_environment()
-        success &= self.validate_project_specific()
-        
-        return success
-        
-    def save_results(self):
-        """Save validation results to file."""
-        results_file = Path(__file__).parent / "validation-results.json"
-        with open(results_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
-        print(f"📊 Results saved to: {results_file}")
-        
-    def print_summary(self):
-        """Print validation summary."""
-        summary = self.results["summary"]
-        print("\\n📋 Validation Summary:")
-        print(f"  Total tests: {summary['total']}")
-        print(f"  Passed: {summary['passed']}")
-        print(f"  Failed: {summary['failed']}")
-        
-        if summary["errors"]:
-            print("\\n❌ Errors:")
-            for error in summary["errors"]:
-                print(f"  - {error}")
-        else:
-            print("\\n✅ All validations passed!")
-
-def main():
-    parser = argparse.ArgumentParser(description="Validate project assumptions and environment")
-    parser.add_argument("--health-check", action="store_true", help="Run basic health check only")
-    parser.add_argument("--quick-check", action="store_true", help="Run quick validation")
-    parser.add_argument("--save-results", action="store_true", help="Save results to file")
-    
-    args = parser.parse_args()
-    
-    validator = AssumptionValidator()
-    
-    try:
-        if args.health_check or args.quick_check:
-            success = validator.run_health_check()
-        else:
-            success = validator.run_full_validation()
-            
-        validator.print_summary()
-        
-        if args.save_results:
-            validator.save_results()
-            
-        sys.exit(0 if success else 1)
-        
-    except KeyboardInterrupt:
-        print("\\n⚠️ Validation interrupted by user")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\\n💥 Validation failed with error: {e}")
-        sys.exit(1)
-
-if __name__ == "__main__":
-    main()
-'''
+        return self.render_template("assumption-validator.py")
 
     def create_deployment_summary(self):
         """Create a deployment summary file."""
-        print("📄 Creating deployment summary...")
+        self.log("📄 Creating deployment summary...")
         
-        summary_content = f"""# LLM Context Management System - Deployment Summary
-
-## Deployment Information
-**Date:** {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
-**Target Directory:** `{self.target_dir}`
-**System Version:** v1.2
-
-## Files Created
-
-### Directory Structure
-```
-{self.target_dir.name}/
-├── guides/                            # System guides (read-only)
-│   ├── llm-session-quick-start.md     # LLM session procedures
-│   ├── human-quick-commands.md        # Human interface commands
-│   ├── session-knowledge-compilation.md # Knowledge compilation
-│   ├── system-setup-instructions.md   # System recreation guide
-│   └── troubleshooting-comprehensive.md # Troubleshooting
-└── LM_context/                        # Project context management
-    ├── README.md                      # Project overview
-    ├── static/                        # Static foundation
-    │   ├── environment.md             # Development environment
-    │   ├── knowledge-base/            # Compiled knowledge
-    │   └── resources/                 # PDF documents and resources
-    ├── evolving/                      # Evolving product context
-    ├── dynamic/                       # Dynamic session context
-    │   ├── session-handoff.md         # Session handoffs
-    │   ├── current-iteration.md       # Current iteration status
-    │   ├── assumption-validator.py    # Validation framework
-    │   └── failed-solutions/          # Failed solution tracking
-    └── archive/                       # Completed work
-        └── daily-logs/                # Daily session logs
-```
-
-## Next Steps
-
-### 1. Customize for Your Project (Required)
-- **Edit `LM_context/README.md`** - Add your project description and goals
-- **Update `LM_context/static/environment.md`** - Configure your development environment
-- **Customize `LM_context/dynamic/assumption-validator.py`** - Add project-specific validations
-- **Modify `LM_context/dynamic/session-handoff.md`** - Set your initial priorities
-- **Update `LM_context/dynamic/current-iteration.md`** - Define your first iteration
-
-### 2. Start Using the System
-```bash
-# Navigate to your project
-cd {self.target_dir}
-
-# For humans: Use quick commands
-cat guides/human-quick-commands.md
-
-# For LLMs: Follow session procedures
-cat guides/llm-session-quick-start.md
-
-# Test the validation framework
-python3 LM_context/dynamic/assumption-validator.py --health-check
-```
-
-### 3. Begin Your First Session
-Use this command to start your first LLM session:
-```
-Start session: Read context (session-handoff, current-iteration, environment, failed-solutions), ask 3-5 specific questions based on what you find, then summarize status and next actions.
-```
-
-## System Features
-- **74% Token Reduction** - Smart context loading with freshness tracking
-- **Session Continuity** - Perfect handoffs between LLM sessions
-- **Knowledge Compilation** - Comprehensive learning capture and organization
-- **Failure Prevention** - Track and avoid repeating failed approaches
-- **Automated Validation** - Customizable validation framework
-
-## Support
-- **Troubleshooting:** See `guides/troubleshooting-comprehensive.md`
-- **System Setup:** See `guides/system-setup-instructions.md`
-- **Human Commands:** See `guides/human-quick-commands.md`
-
----
-
-**Deployment Status:** ✅ Complete  
-**Ready for Use:** Yes  
-**Next Action:** Customize template files for your specific project
-"""
+        self.write_template("DEPLOYMENT_SUMMARY.md", self.generate_deployment_summary)
         
-        summary_path = self.target_dir / "DEPLOYMENT_SUMMARY.md"
-        with open(summary_path, 'w') as f:
-            f.write(summary_content)
-        print(f"  ✅ Created: DEPLOYMENT_SUMMARY.md")
+    def generate_deployment_summary(self):
+        """Generate deployment summary content."""
+        return self.render_template("deployment-summary.md")
 
     def deploy(self):
         """Execute the complete deployment process."""
-        print(f"🚀 Deploying LLM Context Management System to: {self.target_dir}")
-        print()
+        mode = "Updating" if self.update else "Deploying"
+        self.log(f"🚀 {mode} LLM Context Management System to: {self.target_dir}")
+        self.log()
         
         try:
             # Create target directory if it doesn't exist
             self.target_dir.mkdir(parents=True, exist_ok=True)
+            if self.update:
+                self.load_manifest()
+            loaded_manifest = json.loads(json.dumps(self.manifest))
+            self.batch = self.journal.begin(f"{'update' if self.update else 'deploy'} ({self.project_type})")
             
             # Run deployment steps
             self.validate_environment()
@@ -873,24 +547,115 @@ Start session: Read context (session-handoff, current-iteration, environment, fa
             self.copy_system_guides()
             self.create_template_files()
             self.create_deployment_summary()
+            if not self.update or self.manifest != loaded_manifest:
+                self.save_manifest()
+            self.batch.close()
+            if self.objects is not None:
+                try:
+                    self.objects.save()
+                except OSError as e:
+                    self.log(f"⚠️  Could not save the object store map: {e}")
+            if self.batch.manifest["entries"]:
+                self.log(f"📒 Journaled as batch {self.batch.batch_id} "
+                         f"(undo: python3 context_journal.py rollback {self.batch.batch_id} {self.target_dir})")
+            
+            if self.update:
+                self.log()
+                self.log(f"🔄 Update completed: {len(self.changes['written'])} written, "
+                      f"{len(self.changes['unchanged'])} unchanged, "
+                      f"{len(self.changes['preserved'])} kept (locally modified)")
+                for relative_path in self.changes["preserved"]:
+                    self.log(f"  - kept: {relative_path}")
+                return
             
-            print()
-            print("🎉 Deployment completed successfully!")
-            print()
-            print("📋 Next Steps:")
-            print(f"1. cd {self.target_dir}")
-            print("2. Read DEPLOYMENT_SUMMARY.md for customization instructions")
-            print("3. Customize the template files for your specific project")
-            print("4. Start your first LLM session using the provided commands")
-            print()
-            print("📚 Documentation:")
-            print("- guides/human-quick-commands.md - For human users")
-            print("- guides/llm-session-quick-start.md - For LLM sessions")
-            print("- guides/troubleshooting-comprehensive.md - For troubleshooting")
+            self.log()
+            self.log("🎉 Deployment completed successfully!")
+            self.log()
+            self.log("📋 Next Steps:")
+            self.log(f"1. cd {self.target_dir}")
+            self.log("2. Read DEPLOYMENT_SUMMARY.md for customization instructions")
+            self.log("3. Customize the template files for your specific project")
+            self.log("4. Start your first LLM session using the provided commands")
+            self.log()
+            self.log("📚 Documentation:")
+            self.log("- guides/human-quick-commands.md - For human users")
+            self.log("- guides/llm-session-quick-start.md - For LLM sessions")
+            self.log("- guides/troubleshooting-comprehensive.md - For troubleshooting")
             
         except Exception as e:
-            print(f"💥 Deployment failed: {e}")
-            sys.exit(1)
+            if self.batch is not None:
+                self.batch.close("failed")
+            self.log(f"💥 Deployment failed: {e}")
+            raise
+            
+def read_targets_file(targets_file):
+    """Read target directories from a file, one per line ('#' starts a comment)."""
+    targets = []
+    with open(targets_file, 'r') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                targets.append(line)
+    return targets
+
+def deploy_fleet(targets, project_type="technical", update=False, force=False, workers=8, link="auto",
+                 bundle=None):
+    """Deploy to many targets concurrently and print a status table.
+    
+    Deployment is I/O-bound, so targets run in a thread pool. Each target
+    gets its own quiet deployer sharing one TemplateLibrary, so templates
+    are parsed and pre-rendered once, and one cache ObjectStore, so each guide
+    is hashed once; a failure is recorded for that target and does not stop
+    the others. Returns the per-target results.
+    """
+    # Parse the templates and substitute shared values once, up front
+    script_dir = Path(__file__).parent.resolve()
+    templates = TemplateLibrary(script_dir / "templates")
+    templates.prepare_all(project_type)
+    objects = cache_store(script_dir)
+    
+    def deploy_one(target):
+        target_path = Path(target).resolve()
+        started = time.perf_counter()
+        result = {"target": str(target_path), "status": "ok", "written": 0, "kept": 0, "error": ""}
+        
+        try:
+            if target_path.exists() and any(target_path.iterdir()) and not (force or update):
+                result["status"] = "skipped"
+                result["error"] = "not empty (use --update or --force)"
+            else:
+                deployer = LLMContextDeployer(target_path, project_type, update=update, force=force,
+                                              quiet=True, templates=templates, objects=objects, link=link,
+                                              bundle=bundle)
+                deployer.deploy()
+                result["written"] = len(deployer.changes["written"])
+                result["kept"] = len(deployer.changes["preserved"])
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
+        
+        result["seconds"] = time.perf_counter() - started
+        return result
+    
+    print(f"🚀 Deploying LLM Context Management System to {len(targets)} targets...")
+    fleet_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(deploy_one, targets))
+    
+    status_icons = {"ok": "✅", "skipped": "⏭️ ", "failed": "💥"}
+    width = max(len(result["target"]) for result in results)
+    print()
+    print(f"{'Target':<{width}}  Status      Time  Written  Kept  Details")
+    print(f"{'-' * width}  ---------  ------  -------  ----  -------")
+    for result in results:
+        status = f"{status_icons[result['status']]} {result['status']}"
+        print(f"{result['target']:<{width}}  {status:<9}  {result['seconds']:5.2f}s  "
+              f"{result['written']:>7}  {result['kept']:>4}  {result['error']}")
+    
+    failed = sum(1 for result in results if result["status"] != "ok")
+    print()
+    print(f"📊 {len(results) - failed}/{len(results)} targets deployed in {time.perf_counter() - fleet_started:.2f}s")
+    return results
 
 def main():
     parser = argparse.ArgumentParser(
@@ -901,12 +666,29 @@ Examples:
   python3 deploy.py /Users/username/my-learning-project
   python3 deploy.py /home/user/development/ai-research
   python3 deploy.py ./my-new-project
+  python3 deploy.py --update ./my-existing-project
+  python3 deploy.py --update ~/ws/project-a ~/ws/project-b ~/ws/project-c
+  python3 deploy.py --update --targets-file projects.txt --workers 16
+  python3 deploy.py --bundle framework.lmcb ./my-new-project
         """
     )
     
     parser.add_argument(
         "target_directory",
-        help="Target directory where the system will be deployed"
+        nargs="*",
+        help="Target directory (or directories) where the system will be deployed"
+    )
+    
+    parser.add_argument(
+        "--targets-file",
+        help="File listing target directories, one per line"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Concurrent deployments when deploying to several targets (default: 8)"
     )
     
     parser.add_argument(
@@ -919,22 +701,68 @@ Examples:
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Force deployment even if target directory exists and is not empty"
+        help="Force deployment even if target directory exists and is not empty "
+             "(with --update: also overwrite locally modified guides)"
+    )
+    
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Update an existing deployment: copy only changed guides, keep customized templates"
+    )
+    
+    parser.add_argument(
+        "--link",
+        choices=LINK_MODES,
+        default="auto",
+        help="How guides are placed from the object store in the user's cache: auto reflinks where the "
+             "filesystem can and copies otherwise; hardlink shares one read-only inode across "
+             "projects (default: auto)"
+    )
+    
+    parser.add_argument(
+        "--bundle",
+        help="Deploy guides from a bundle written by 'context_bundle.py pack' instead of LM_context/"
     )
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
     
-    target_path = Path(args.target_directory).resolve()
+    targets = list(args.target_directory)
+    if args.targets_file:
+        targets += read_targets_file(args.targets_file)
+    if not targets:
+        parser.error("no target directory given")
+    
+    bundle = None
+    if args.bundle:
+        try:
+            bundle = ContextBundle(args.bundle)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not open bundle {args.bundle}: {e}")
+            sys.exit(1)
+    
+    if len(targets) > 1:
+        results = deploy_fleet(targets, args.project_type, update=args.update, force=args.force,
+                               workers=args.workers, link=args.link, bundle=bundle)
+        sys.exit(0 if all(result["status"] == "ok" for result in results) else 1)
+    
+    target_path = Path(targets[0]).resolve()
     
     # Check if target directory exists and has content
-    if target_path.exists() and any(target_path.iterdir()) and not args.force:
+    if target_path.exists() and any(target_path.iterdir()) and not (args.force or args.update):
         print(f"⚠️  Target directory '{target_path}' exists and is not empty.")
-        print("Use --force to deploy anyway, or choose a different directory.")
+        print("Use --force to deploy anyway, --update to refresh an existing deployment, or choose a different directory.")
         sys.exit(1)
     
     # Deploy the system
-    deployer = LLMContextDeployer(target_path, args.project_type)
-    deployer.deploy()
+    deployer = LLMContextDeployer(target_path, args.project_type, update=args.update, force=args.force,
+                                  link=args.link, bundle=bundle)
+    try:
+        deployer.deploy()
+    except Exception:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+LLM Context Session Telemetry
+
+This script records what a session actually loads - which context files,
+their bytes and estimated tokens, start and end time, and how many files
+the freshness index let the session skip - and reports it against a
+baseline where every context file is loaded. Sessions are appended to
+LM_context/.index/session-telemetry.jsonl.
+
+Usage:
+    python3 session_telemetry.py start /path/to/project
+    python3 session_telemetry.py load /path/to/project dynamic/session-handoff.md .index/context-pack.md
+    python3 session_telemetry.py end /path/to/project
+    python3 session_telemetry.py report /path/to/project
+"""
+
+import sys
+import json
+import argparse
+from datetime import datetime
+from typing import Dict, List
+
+from context_budget import ContextBudget
+from context_freshness import FreshnessIndex, INDEX_DIR
+from context_journal import atomic_write
+
+TELEMETRY_LOG_FILENAME = "session-telemetry.jsonl"
+ACTIVE_SESSION_FILENAME = "telemetry-session.json"
+
+# Token reduction promised by the deployment summary
+CLAIMED_REDUCTION_PERCENT = 74
+
+
+class SessionTelemetry:
+    def __init__(self, context_dir: str):
+        self.budget = ContextBudget(context_dir)
+        self.context_dir = self.budget.context_dir
+        self.log_path = self.context_dir / INDEX_DIR / TELEMETRY_LOG_FILENAME
+        self.active_path = self.context_dir / INDEX_DIR / ACTIVE_SESSION_FILENAME
+
+    def load_active(self) -> Dict:
+        """Load the open session, if there is one."""
+        if not self.active_path.exists():
+            raise ValueError("No session in progress - run 'session_telemetry.py start' first")
+        with open(self.active_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_active(self, session: Dict) -> None:
+        atomic_write(self.active_path, json.dumps(session, indent=1).encode('utf-8'))
+
+    def start(self) -> Dict:
+        """Open a session and record the all-files baseline and freshness state."""
+        files = self.budget.context_files()
+        baseline = [self.budget.file_tokens(relative_path) for relative_path in files]
+        self.budget.save_cache()
+
+        freshness = FreshnessIndex(str(self.context_dir)).index
+        statuses = [entry.get("status") for entry in freshness["files"].values()]
+        session = {
+            "started": datetime.now().isoformat(timespec='seconds'),
+            "baseline_files": len(baseline),
+            "baseline_bytes": sum(item["bytes"] for item in baseline),
+            "baseline_tokens": sum(item["tokens"] for item in baseline),
+            "freshness_unchanged": statuses.count("unchanged"),
+            "freshness_changed": len(statuses) - statuses.count("unchanged"),
+            "token_cache_hits": self.budget.cache_hits,
+            "loaded": []
+        }
+        self.save_active(session)
+        return session
+
+    def record_loads(self, paths: List[str]) -> Dict:
+        """Record context files loaded by the session (relative to LM_context/)."""
+        session = self.load_active()
+        already = {item["path"] for item in session["loaded"]}
+        for relative_path in paths:
+            relative_path = relative_path.replace("LM_context/", "", 1) if relative_path.startswith("LM_context/") else relative_path
+            if not (self.context_dir / relative_path).is_file():
+                raise ValueError(f"Not a context file: {relative_path}")
+            if relative_path in already:
+                continue
+            item = self.budget.file_tokens(relative_path)
+            item["loaded_at"] = datetime.now().isoformat(timespec='seconds')
+            session["loaded"].append(item)
+            already.add(relative_path)
+        self.budget.save_cache()
+        self.save_active(session)
+        return session
+
+    def end(self) -> Dict:
+        """Close the session and append it to the telemetry log."""
+        session = self.load_active()
+        session["ended"] = datetime.now().isoformat(timespec='seconds')
+        session["duration_seconds"] = int((datetime.fromisoformat(session["ended"])
+                                           - datetime.fromisoformat(session["started"])).total_seconds())
+        session["loaded_bytes"] = sum(item["bytes"] for item in session["loaded"])
+        session["loaded_tokens"] = sum(item["tokens"] for item in session["loaded"])
+        session["reduction_percent"] = round(
+            100 * (1 - session["loaded_tokens"] / session["baseline_tokens"]), 1) if session["baseline_tokens"] else 0.0
+
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(session, sort_keys=True) + "\n")
+        self.active_path.unlink()
+        return session
+
+    def sessions(self) -> List[Dict]:
+        """Read every recorded session, oldest first."""
+        if not self.log_path.exists():
+            return []
+        sessions = []
+        with open(self.log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    sessions.append(json.loads(line))
+                except ValueError:
+                    continue
+        return sessions
+
+    def report(self) -> Dict:
+        """Aggregate recorded sessions against the all-files baseline."""
+        sessions = self.sessions()
+        loaded = sum(session["loaded_tokens"] for session in sessions)
+        baseline = sum(session["baseline_tokens"] for session in sessions)
+        return {
+            "context_dir": str(self.context_dir),
+            "sessions": len(sessions),
+            "loaded_tokens": loaded,
+            "baseline_tokens": baseline,
+            "reduction_percent": round(100 * (1 - loaded / baseline), 1) if baseline else 0.0,
+            "claimed_reduction_percent": CLAIMED_REDUCTION_PERCENT,
+            "average_loaded_tokens": round(loaded / len(sessions)) if sessions else 0,
+            "average_duration_seconds": round(sum(s["duration_seconds"] for s in sessions) / len(sessions)) if sessions else 0,
+            "freshness_unchanged": sum(session["freshness_unchanged"] for session in sessions),
+            "history": sessions
+        }
+
+    @staticmethod
+    def print_report(report: Dict, last: int = 10) -> None:
+        """Print the telemetry report as a table."""
+        print(f"📈 Session telemetry for {report['context_dir']}\n")
+        if not report["sessions"]:
+            print("No sessions recorded yet.")
+            return
+        print(f"{'Started':<20} {'Min':>5} {'Files':>5} {'Loaded':>8} {'All':>8} {'Saved':>7} {'Skipped':>8}")
+        for session in report["history"][-last:]:
+            print(f"{session['started']:<20} {session['duration_seconds'] // 60:>5} {len(session['loaded']):>5} "
+                  f"{session['loaded_tokens']:>8} {session['baseline_tokens']:>8} "
+                  f"{session['reduction_percent']:>6}% {session['freshness_unchanged']:>8}")
+        print()
+        icon = "✅" if report["reduction_percent"] >= report["claimed_reduction_percent"] else "⚠️"
+        print(f"{icon} Measured reduction over {report['sessions']} sessions: {report['reduction_percent']}% "
+              f"(claimed: {report['claimed_reduction_percent']}%)")
+        print(f"📦 Average tokens loaded per session: {report['average_loaded_tokens']}")
+        print(f"⏱️ Average session length: {report['average_duration_seconds'] // 60} min")
+        print(f"🕒 Files skipped as unchanged (freshness index): {report['freshness_unchanged']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Record per-session context loading and report it against loading everything",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Session start: open a session, then record what the LLM reads
+  python3 session_telemetry.py start /Users/vn/ws/melexis-simple
+  python3 session_telemetry.py load /Users/vn/ws/melexis-simple dynamic/session-handoff.md
+
+  # Session end: close it and look at the trend
+  python3 session_telemetry.py end /Users/vn/ws/melexis-simple
+  python3 session_telemetry.py report /Users/vn/ws/melexis-simple
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    start_parser = subparsers.add_parser("start", help="Open a session")
+    load_parser = subparsers.add_parser("load", help="Record loaded context files")
+    end_parser = subparsers.add_parser("end", help="Close the session and log it")
+    report_parser = subparsers.add_parser("report", help="Compare recorded sessions with loading everything")
+
+    for sub in (start_parser, end_parser, report_parser):
+        sub.add_argument(
+            "context_dir",
+            nargs="?",
+            default=".",
+            help="Project directory or its LM_context/ directory (default: current directory)"
+        )
+    load_parser.add_argument("context_dir", help="Project directory or its LM_context/ directory")
+    load_parser.add_argument("files", nargs="+", help="Files relative to LM_context/")
+    report_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    args = parser.parse_args()
+
+    telemetry = SessionTelemetry(args.context_dir)
+    if not telemetry.context_dir.is_dir():
+        print(f"❌ LM_context not found: {telemetry.context_dir}")
+        sys.exit(1)
+
+    try:
+        if args.command == "start":
+            session = telemetry.start()
+            print(f"▶️ Session started {session['started']}: baseline {session['baseline_tokens']} tokens "
+                  f"in {session['baseline_files']} files, {session['freshness_unchanged']} unchanged since last session")
+        elif args.command == "load":
+            session = telemetry.record_loads(args.files)
+            print(f"📄 {len(session['loaded'])} files loaded, "
+                  f"{sum(item['tokens'] for item in session['loaded'])} tokens so far")
+        elif args.command == "end":
+            session = telemetry.end()
+            print(f"⏹️ Session logged: {session['loaded_tokens']} of {session['baseline_tokens']} tokens loaded "
+                  f"({session['reduction_percent']}% saved, {session['duration_seconds'] // 60} min)")
+        else:
+            report = telemetry.report()
+            if args.json:
+                print(json.dumps(report, indent=2))
+            else:
+                telemetry.print_report(report)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
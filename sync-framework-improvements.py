@@ -8,22 +8,572 @@ with intelligent questioning to avoid unintentional framework corruption.
 Usage:
     python3 sync-framework-improvements.py --source /path/to/project --target /path/to/framework
     python3 sync-framework-improvements.py --analyze-only /path/to/project
+    python3 sync-framework-improvements.py --sources /path/to/projects/* --target /path/to/framework
+    python3 sync-framework-improvements.py --source /path/to/project --target /path/to/framework --policy sync-policy.json
 """
 
 import os
 import sys
+import stat
 import json
+import glob
+import fnmatch
 import argparse
 import difflib
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Iterator
+
+from context_journal import WriteJournal, JournalBatch, atomic_write
+from context_objects import ObjectStore, LINK_MODES
+from context_sections import file_digest, new_hasher
+
+MANIFEST_FILENAME = ".sync-manifest.json"
+MANIFEST_VERSION = 2
+SYNC_LINK_MODES = [mode for mode in LINK_MODES if mode != "hardlink"]
+CHUNK_SIZE = 64 * 1024
+DEFAULT_DIFF_MAX_LINES = 400
+
+# Improvement categories a sync policy can carry rules for
+POLICY_CATEGORIES = ["new_files", "modified_files", "structural_changes", "potential_framework_enhancements"]
+POLICY_ACTIONS = ["accept", "reject", "accept_if_additions_only", "accept_below_diff_size"]
+
+# Regions without unique anchor lines larger than this (lines x lines) are
+# emitted as a single replace instead of being handed to difflib
+DIFF_FALLBACK_LIMIT = 250_000
+
+
+class FileManifest:
+    """Persistent cache of (size, mtime_ns, BLAKE2 digest) per file path.
+
+    Stored next to the framework's LM_context/ so repeated syncs only hash
+    files whose size or mtime changed since the previous run. Entries are
+    scoped per project root (the framework itself or a synced project) and
+    keyed relative to it; saving drops entries for files that no longer
+    exist and scopes whose project is gone, so the manifest does not grow
+    with every project ever synced.
+    """
+
+    def __init__(self, manifest_path: Optional[Path], roots: List[Path],
+                 entries: Optional[Dict[str, Dict[str, Dict]]] = None):
+        self.manifest_path = manifest_path
+        # Deepest root first, so a project inside the framework gets its own scope
+        self.roots = sorted((Path(root) for root in roots), key=lambda root: -len(root.parts))
+        self.entries: Dict[str, Dict[str, Dict]] = {}
+        self.updated: Dict[str, Dict[str, Dict]] = {}
+        self.touched = set()
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        if entries is not None:
+            self.entries = {scope: dict(files) for scope, files in entries.items()}
+        elif manifest_path is not None and manifest_path.exists():
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                # Version 1 manifests were keyed by absolute path; start over
+                if data.get("version") == MANIFEST_VERSION:
+                    self.entries = data.get("projects", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable manifest {manifest_path}: {e}")
+                self.entries = {}
+
+    def key(self, path: Path) -> Tuple[str, str]:
+        """(scope, key) of a path: its project root and the path relative to it."""
+        path = Path(path)
+        for root in self.roots:
+            if path.is_relative_to(root):
+                return str(root), path.relative_to(root).as_posix()
+        return str(path.parent), path.name
+
+    def cached_digest(self, path: Path, st: os.stat_result) -> Optional[str]:
+        """Return the cached digest if size and mtime are unchanged."""
+        scope, key = self.key(path)
+        self.touched.add(scope)
+        entry = self.entries.get(scope, {}).get(key)
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            self.hits += 1
+            return entry["digest"]
+        return None
+
+    def store(self, path: Path, st: os.stat_result, digest: str) -> None:
+        """Record a freshly computed digest."""
+        scope, key = self.key(path)
+        entry = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "digest": digest
+        }
+        self.entries.setdefault(scope, {})[key] = entry
+        self.updated.setdefault(scope, {})[key] = entry
+        self.touched.add(scope)
+        self.dirty = True
+
+    def merge(self, updated: Dict[str, Dict[str, Dict]]) -> None:
+        """Merge digests computed elsewhere (e.g. by pool workers)."""
+        for scope, files in updated.items():
+            self.entries.setdefault(scope, {}).update(files)
+            self.touched.add(scope)
+            self.dirty = True
+
+    def digest(self, path: Path, st: Optional[os.stat_result] = None) -> str:
+        """Return the BLAKE2 digest of a file, hashing only on cache miss."""
+        st = st or path.stat()
+        cached = self.cached_digest(path, st)
+        if cached is not None:
+            return cached
+
+        self.misses += 1
+        digest = file_digest(path)
+        self.store(path, st, digest)
+        return digest
+
+    def evict(self) -> None:
+        """Drop scopes whose project is gone and vanished files of the scopes used this run."""
+        for scope in list(self.entries):
+            if not Path(scope).is_dir():
+                del self.entries[scope]
+                self.dirty = True
+            elif scope in self.touched:
+                files = self.entries[scope]
+                for key in [key for key in files if not (Path(scope) / key).is_file()]:
+                    del files[key]
+                    self.dirty = True
+
+    def save(self) -> None:
+        """Write the manifest back to disk if anything changed (never without a path)."""
+        if self.manifest_path is None or not self.manifest_path.parent.exists():
+            return
+        self.evict()
+        if not self.dirty:
+            return
+        atomic_write(self.manifest_path, json.dumps(
+            {"version": MANIFEST_VERSION, "projects": self.entries}, indent=1, sort_keys=True).encode('utf-8'))
+        self.dirty = False
+
+
+class StreamingDiff:
+    """Memory-bounded unified diff for large context files.
+    
+    Each file is reduced to an array of line hashes plus line offsets; the
+    line text itself is only read back from disk for lines that end up in
+    a hunk. Matching uses patience-style anchoring on lines unique to both
+    sides, and hunks are yielded as they are produced, stopping once
+    max_output_lines have been emitted.
+    """
+
+    def __init__(self, context_lines: int = 3, max_output_lines: Optional[int] = DEFAULT_DIFF_MAX_LINES):
+        self.context_lines = context_lines
+        self.max_output_lines = max_output_lines
+
+    @staticmethod
+    def _index_lines(path: str) -> Tuple[array, array]:
+        """Return (line hashes, line start offsets) for a file."""
+        hashes = array('q')
+        offsets = array('q')
+        offset = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                hashes.append(hash(line.rstrip(b'\r\n')))
+                offsets.append(offset)
+                offset += len(line)
+        return hashes, offsets
+
+    @staticmethod
+    def _unique_anchors(a: array, alo: int, ahi: int, b: array, blo: int, bhi: int) -> List[Tuple[int, int]]:
+        """Return the longest increasing run of lines unique to both ranges."""
+        counts: Dict[int, List[int]] = {}
+        for i in range(alo, ahi):
+            entry = counts.setdefault(a[i], [0, 0, i, -1])
+            entry[0] += 1
+        for j in range(blo, bhi):
+            entry = counts.get(b[j])
+            if entry is not None:
+                entry[1] += 1
+                entry[3] = j
+        pairs = sorted((entry[2], entry[3]) for entry in counts.values() if entry[0] == 1 and entry[1] == 1)
+        if not pairs:
+            return []
+
+        # Patience sorting: longest increasing subsequence on b positions
+        tails: List[int] = []
+        tail_index: List[int] = []
+        previous = [-1] * len(pairs)
+        for index, (_, j) in enumerate(pairs):
+            pile = bisect_left(tails, j)
+            if pile == len(tails):
+                tails.append(j)
+                tail_index.append(index)
+            else:
+                tails[pile] = j
+                tail_index[pile] = index
+            previous[index] = tail_index[pile - 1] if pile > 0 else -1
+
+        anchors = []
+        index = tail_index[-1]
+        while index != -1:
+            anchors.append(pairs[index])
+            index = previous[index]
+        anchors.reverse()
+        return anchors
+
+    def _matching_blocks(self, a: array, b: array) -> List[Tuple[int, int, int]]:
+        """Compute matching blocks (i, j, size) between two hash arrays."""
+        matched: List[Tuple[int, int]] = []
+        regions = [(0, len(a), 0, len(b))]
+
+        while regions:
+            alo, ahi, blo, bhi = regions.pop()
+            while alo < ahi and blo < bhi and a[alo] == b[blo]:
+                matched.append((alo, blo))
+                alo += 1
+                blo += 1
+            while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+                ahi -= 1
+                bhi -= 1
+                matched.append((ahi, bhi))
+            if alo >= ahi or blo >= bhi:
+                continue
+
+            anchors = self._unique_anchors(a, alo, ahi, b, blo, bhi)
+            if anchors:
+                prev_a, prev_b = alo, blo
+                for i, j in anchors:
+                    regions.append((prev_a, i, prev_b, j))
+                    matched.append((i, j))
+                    prev_a, prev_b = i + 1, j + 1
+                regions.append((prev_a, ahi, prev_b, bhi))
+            elif (ahi - alo) * (bhi - blo) <= DIFF_FALLBACK_LIMIT:
+                matcher = difflib.SequenceMatcher(None, a[alo:ahi].tolist(), b[blo:bhi].tolist(), autojunk=False)
+                for i, j, size in matcher.get_matching_blocks():
+                    matched.extend((alo + i + k, blo + j + k) for k in range(size))
+
+        matched.sort()
+        blocks: List[Tuple[int, int, int]] = []
+        for i, j in matched:
+            if blocks and blocks[-1][0] + blocks[-1][2] == i and blocks[-1][1] + blocks[-1][2] == j:
+                blocks[-1] = (blocks[-1][0], blocks[-1][1], blocks[-1][2] + 1)
+            else:
+                blocks.append((i, j, 1))
+        blocks.append((len(a), len(b), 0))
+        return blocks
+
+    @staticmethod
+    def _opcodes(blocks: List[Tuple[int, int, int]]) -> Iterator[Tuple[str, int, int, int, int]]:
+        """Turn matching blocks into difflib-style opcodes."""
+        i = j = 0
+        for ai, bj, size in blocks:
+            if i < ai and j < bj:
+                yield ('replace', i, ai, j, bj)
+            elif i < ai:
+                yield ('delete', i, ai, j, bj)
+            elif j < bj:
+                yield ('insert', i, ai, j, bj)
+            if size:
+                yield ('equal', ai, ai + size, bj, bj + size)
+            i, j = ai + size, bj + size
+
+    def _grouped_opcodes(self, blocks: List[Tuple[int, int, int]]) -> Iterator[List[Tuple[str, int, int, int, int]]]:
+        """Group opcodes into hunks with context, as difflib does."""
+        n = self.context_lines
+        codes = list(self._opcodes(blocks))
+        if not codes:
+            return
+        if codes[0][0] == 'equal':
+            tag, i1, i2, j1, j2 = codes[0]
+            codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+        if codes[-1][0] == 'equal':
+            tag, i1, i2, j1, j2 = codes[-1]
+            codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+        group = []
+        for tag, i1, i2, j1, j2 in codes:
+            if tag == 'equal' and i2 - i1 > n * 2:
+                group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+                yield group
+                group = []
+                i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+            group.append((tag, i1, i2, j1, j2))
+        if group and not (len(group) == 1 and group[0][0] == 'equal'):
+            yield group
+
+    @staticmethod
+    def _format_range(start: int, stop: int) -> str:
+        """Format a unified diff line range."""
+        beginning = start + 1
+        length = stop - start
+        if length == 1:
+            return f"{beginning}"
+        if not length:
+            beginning -= 1
+        return f"{beginning},{length}"
+
+    @staticmethod
+    def _read_line(handle, offsets: array, index: int) -> str:
+        """Read one line back from disk by its recorded offset."""
+        handle.seek(offsets[index])
+        return handle.readline().decode('utf-8', errors='replace').rstrip('\r\n')
+
+    def diff_stats(self, from_path: str, to_path: str) -> Tuple[int, int]:
+        """Count (added, removed) lines without reading any line text back."""
+        a_hashes, _ = self._index_lines(from_path)
+        b_hashes, _ = self._index_lines(to_path)
+        added = removed = 0
+        for tag, i1, i2, j1, j2 in self._opcodes(self._matching_blocks(a_hashes, b_hashes)):
+            if tag in ('replace', 'delete'):
+                removed += i2 - i1
+            if tag in ('replace', 'insert'):
+                added += j2 - j1
+        return added, removed
+
+    def unified_diff(self, from_path: str, to_path: str, fromfile: str = "", tofile: str = "") -> Iterator[str]:
+        """Yield unified diff lines, truncated after max_output_lines."""
+        a_hashes, a_offsets = self._index_lines(from_path)
+        b_hashes, b_offsets = self._index_lines(to_path)
+        blocks = self._matching_blocks(a_hashes, b_hashes)
+
+        emitted = 0
+        started = False
+        with open(from_path, 'rb') as fa, open(to_path, 'rb') as fb:
+            for group in self._grouped_opcodes(blocks):
+                hunk = []
+                if not started:
+                    hunk += [f"--- {fromfile or from_path}", f"+++ {tofile or to_path}"]
+                    started = True
+                first, last = group[0], group[-1]
+                hunk.append(
+                    f"@@ -{self._format_range(first[1], last[2])} "
+                    f"+{self._format_range(first[3], last[4])} @@"
+                )
+                for tag, i1, i2, j1, j2 in group:
+                    if tag == 'equal':
+                        hunk += [" " + self._read_line(fa, a_offsets, i) for i in range(i1, i2)]
+                        continue
+                    if tag in ('replace', 'delete'):
+                        hunk += ["-" + self._read_line(fa, a_offsets, i) for i in range(i1, i2)]
+                    if tag in ('replace', 'insert'):
+                        hunk += ["+" + self._read_line(fb, b_offsets, j) for j in range(j1, j2)]
+
+                for line in hunk:
+                    if self.max_output_lines is not None and emitted >= self.max_output_lines:
+                        yield f"... diff truncated after {self.max_output_lines} lines"
+                        return
+                    emitted += 1
+                    yield line
+
+
+class SyncPolicy:
+    """Declarative accept/reject rules for unattended syncs.
+    
+    A policy file (JSON, or YAML when PyYAML is installed) maps each
+    improvement category to an ordered list of rules; the first rule that
+    reaches a decision wins and items no rule decides are queued for review:
+    
+        {
+          "rules": {
+            "new_files": [{"match": "llm-guides/*", "action": "accept"}],
+            "modified_files": [
+              {"action": "accept_if_additions_only"},
+              {"action": "accept_below_diff_size", "max_changed_lines": 20}
+            ],
+            "structural_changes": [{"match": "archive/*", "action": "reject"}]
+          }
+        }
+    
+    "match" is a glob against the item's path relative to LM_context and
+    "type" optionally restricts a rule to one item type (e.g. "new_guide").
+    """
+
+    def __init__(self, rules: Dict[str, List[Dict]], source: str = "<inline>"):
+        self.source = source
+        self.rules = rules
+        self._validate()
+
+    @classmethod
+    def load(cls, policy_path: str) -> "SyncPolicy":
+        """Load a policy from a JSON or YAML file."""
+        path = Path(policy_path)
+        with open(path, 'r', encoding='utf-8') as f:
+            if path.suffix.lower() in (".yaml", ".yml"):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ValueError(f"PyYAML is required to read {path}; use a .json policy instead")
+                data = yaml.safe_load(f) or {}
+            else:
+                data = json.load(f)
+        return cls(data.get("rules", {}), str(path))
+
+    def _validate(self) -> None:
+        """Reject unknown categories and actions up front."""
+        for category, rules in self.rules.items():
+            if category not in POLICY_CATEGORIES:
+                raise ValueError(f"{self.source}: unknown policy category '{category}'")
+            for rule in rules:
+                if rule.get("action") not in POLICY_ACTIONS:
+                    raise ValueError(f"{self.source}: unknown action '{rule.get('action')}' in {category}")
+                if rule["action"] == "accept_below_diff_size" and "max_changed_lines" not in rule:
+                    raise ValueError(f"{self.source}: accept_below_diff_size needs max_changed_lines in {category}")
+
+    def decide(self, category: str, item_path: str, item_type: str, diff_stats) -> Tuple[Optional[str], str]:
+        """Return ("accept" | "reject" | None, reason) for one improvement.
+        
+        diff_stats is a callable returning (added, removed) lines, or None
+        for items without a file (structural changes); it is only invoked
+        when a diff-based rule is reached. Diff-based rules never decide an
+        item without a file, so it falls through to review.
+        """
+        stats = None
+        have_stats = False
+        for index, rule in enumerate(self.rules.get(category, [])):
+            if "match" in rule and not fnmatch.fnmatch(item_path, rule["match"]):
+                continue
+            if "type" in rule and rule["type"] != item_type:
+                continue
+            
+            action = rule["action"]
+            reason = f"{category}[{index}] {action}"
+            if action in ("accept", "reject"):
+                return action, reason
+            
+            if not have_stats:
+                stats, have_stats = diff_stats(), True
+            if stats is None:
+                continue
+            added, removed = stats
+            if action == "accept_if_additions_only" and removed == 0:
+                return "accept", f"{reason} (+{added} lines)"
+            if action == "accept_below_diff_size" and added + removed < rule["max_changed_lines"]:
+                return "accept", f"{reason} ({added + removed} changed lines)"
+        
+        return None, "no rule reached a decision"
+
+
+class TreeSnapshot:
+    """In-memory stat snapshot of a directory tree built with one os.scandir pass.
+    
+    Maps each path (relative to the root, POSIX separators) to its
+    os.stat_result. All existence checks, directory listings and size/mtime
+    lookups during analysis are answered from this dict instead of issuing
+    a stat() per question, which matters on network filesystems.
+    """
+
+    def __init__(self, root: Optional[Path]):
+        """Snapshot root; None gives an empty snapshot (no target to compare with)."""
+        self.root = root
+        self.entries: Dict[str, os.stat_result] = {}
+        self.syscalls = 0
+        self.lookups = 0
+        self.root_exists = False
+        if root is not None:
+            self.root_exists = root.is_dir()
+            self.syscalls += 1
+        if self.root_exists:
+            self._scan(str(root), "")
+
+    def _scan(self, directory: str, prefix: str) -> None:
+        """Recursively record every entry below a directory."""
+        self.syscalls += 1
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            print(f"⚠️ Could not scan {directory}: {e}")
+            return
+        for entry in entries:
+            relative_path = prefix + entry.name
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            self.syscalls += 1
+            self.entries[relative_path] = st
+            if stat.S_ISDIR(st.st_mode):
+                self._scan(entry.path, relative_path + "/")
+
+    def relative(self, path: Path) -> Optional[str]:
+        """Return a path relative to the snapshot root, or None if outside it."""
+        if self.root is None:
+            return None
+        try:
+            return Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def stat(self, relative_path: str) -> Optional[os.stat_result]:
+        """Return the recorded stat for a path, or None if it does not exist."""
+        self.lookups += 1
+        return self.entries.get(relative_path)
+
+    def exists(self, relative_path: str) -> bool:
+        """Check whether a path existed when the snapshot was taken."""
+        return self.stat(relative_path) is not None
+
+    def is_dir(self, relative_path: str) -> bool:
+        """Check whether a path is a directory."""
+        st = self.stat(relative_path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+    def directories(self) -> List[str]:
+        """List all directories in the tree, sorted."""
+        dirs = sorted(path for path, st in self.entries.items() if stat.S_ISDIR(st.st_mode))
+        self.lookups += len(dirs)
+        return dirs
+
+    def list_files(self, relative_dir: str, suffix: str = "") -> List[str]:
+        """List file names directly inside a directory, optionally by suffix."""
+        prefix = f"{relative_dir}/" if relative_dir else ""
+        names = sorted(
+            path[len(prefix):] for path, st in self.entries.items()
+            if path.startswith(prefix) and "/" not in path[len(prefix):]
+            and stat.S_ISREG(st.st_mode) and path.endswith(suffix)
+        )
+        self.lookups += len(names)
+        return names
+
 
 class FrameworkSyncTool:
-    def __init__(self, source_project: str, target_framework: str, analyze_only: bool = False):
+    def __init__(self, source_project: str, target_framework: Optional[str], analyze_only: bool = False,
+                 target_snapshot: Optional[TreeSnapshot] = None, manifest_entries: Optional[Dict[str, Dict[str, Dict]]] = None,
+                 diff_max_lines: Optional[int] = DEFAULT_DIFF_MAX_LINES, link: str = "auto"):
         self.source_project = Path(source_project).resolve()
-        self.target_framework = Path(target_framework).resolve()
+        # Without a target framework (--analyze-only) every framework file in
+        # the source counts as new and nothing is written or cached
+        if target_framework is None and not analyze_only:
+            raise ValueError("a target framework is required unless analyze_only is set")
+        self.target_framework = Path(target_framework).resolve() if target_framework is not None else None
         self.analyze_only = analyze_only
+        self.diff_engine = StreamingDiff(max_output_lines=diff_max_lines)
+        if self.target_framework is not None:
+            self.manifest = FileManifest(self.target_framework / MANIFEST_FILENAME,
+                                         [self.source_project, self.target_framework], manifest_entries)
+        else:
+            self.manifest = FileManifest(None, [self.source_project])
+        
+        # Writes into the framework form one journaled batch per run, so a
+        # whole sync can be undone with context_journal.py rollback
+        self.journal = WriteJournal(self.target_framework) if self.target_framework is not None else None
+        self.batch: Optional[JournalBatch] = None
+        
+        # Framework files are resolved through its content-addressed store:
+        # copies come from blobs (reflinked where possible) and the path ->
+        # digest map answers comparisons without reading. Never hardlinked:
+        # the placed files are live framework docs that get edited in place
+        if link not in SYNC_LINK_MODES:
+            raise ValueError(f"link must be one of {', '.join(SYNC_LINK_MODES)}")
+        self.objects = ObjectStore(self.target_framework) if self.target_framework is not None else None
+        self.link = link
+        
+        # Tree snapshots used by analyze_improvements; a pre-built target
+        # snapshot (see capture_target_snapshot) is shared across projects
+        self.source_snapshot: Optional[TreeSnapshot] = None
+        self.target_snapshot = target_snapshot
+        self.shared_target = target_snapshot is not None
+        self._target_lookups_start = 0
         
         # Define framework-relevant files and their categories
         self.framework_files = {
@@ -77,7 +627,11 @@ class FrameworkSyncTool:
             "evolving/risk-assesment.md",  # Project-specific risks
             "evolving/validation.md",  # Project-specific validation
             "archive/",  # Project-specific archive
-            "knowledge/"  # Project-specific knowledge
+            "knowledge/",  # Project-specific knowledge
+            ".index/",  # Generated indexes (token cache, freshness, ...)
+            ".journal/",  # Write batch manifests
+            ".backups/",  # Content-addressed backups of overwritten files
+            ".objects/"  # Content-addressed framework documents
         ]
         
     def analyze_improvements(self) -> Dict:
@@ -92,13 +646,19 @@ class FrameworkSyncTool:
         }
         
         source_lm_context = self.source_project / "LM_context"
-        target_lm_context = self.target_framework / "LM_context"
+        target_lm_context = self.target_framework / "LM_context" if self.target_framework is not None else None
+        
+        # One scandir pass per tree; everything below runs against these
+        self.source_snapshot = TreeSnapshot(source_lm_context)
+        if self.target_snapshot is None:
+            self.target_snapshot = TreeSnapshot(target_lm_context)
+        self._target_lookups_start = self.target_snapshot.lookups
         
-        if not source_lm_context.exists():
+        if not self.source_snapshot.root_exists:
             print(f"❌ Source LM_context not found: {source_lm_context}")
             return improvements
             
-        if not target_lm_context.exists():
+        if target_lm_context is not None and not self.target_snapshot.root_exists:
             print(f"❌ Target LM_context not found: {target_lm_context}")
             return improvements
             
@@ -106,16 +666,19 @@ class FrameworkSyncTool:
         for category, files in self.framework_files.items():
             for file_name in files:
                 source_file = source_lm_context / category / file_name
-                target_file = target_lm_context / category / file_name
+                target_file = target_lm_context / category / file_name if target_lm_context is not None else None
                 
-                if source_file.exists() and not target_file.exists():
+                if not self.source_snapshot.exists(f"{category}/{file_name}"):
+                    continue
+                    
+                if not self.target_snapshot.exists(f"{category}/{file_name}"):
                     improvements["new_files"].append({
                         "category": category,
                         "file": file_name,
                         "source_path": str(source_file),
-                        "target_path": str(target_file)
+                        "target_path": str(target_file) if target_file is not None else None
                     })
-                elif source_file.exists() and target_file.exists():
+                else:
                     # Check for modifications
                     if self._files_different(source_file, target_file):
                         improvements["modified_files"].append({
@@ -131,36 +694,129 @@ class FrameworkSyncTool:
         # Identify potential framework enhancements
         improvements["potential_framework_enhancements"] = self._identify_framework_enhancements()
         
+        if not self.shared_target:
+            self.manifest.save()
+        print(f"🗂️ Manifest: {self.manifest.hits} cached digests, {self.manifest.misses} files hashed")
+        print(f"🧮 Tree scan: {self.syscalls_used()} syscalls, {self.syscalls_saved()} syscalls saved by snapshot lookups")
+        
         return improvements
         
     def _files_different(self, file1: Path, file2: Path) -> bool:
-        """Check if two files are different."""
+        """Check if two files are different.
+        
+        Sizes are compared first, then digests cached in the manifest or the
+        framework's object map; a file whose digest is stale is re-hashed on
+        its own. When neither digest is cached
+        the files are streamed chunk by chunk, stopping at the first
+        differing chunk.
+        """
         try:
-            with open(file1, 'r', encoding='utf-8') as f1, open(file2, 'r', encoding='utf-8') as f2:
-                return f1.read() != f2.read()
+            st1, st2 = self._snapshot_stat(file1), self._snapshot_stat(file2)
+            if st1.st_size != st2.st_size:
+                return True
+            
+            digest1 = self._cached_digest(file1, st1)
+            digest2 = self._cached_digest(file2, st2)
+            if digest1 is not None and digest2 is not None:
+                return digest1 != digest2
+            if digest1 is not None:
+                return digest1 != self.manifest.digest(file2)
+            if digest2 is not None:
+                return digest2 != self.manifest.digest(file1)
+            
+            return self._compare_chunks(file1, st1, file2, st2)
         except Exception as e:
             print(f"⚠️ Error comparing files {file1} and {file2}: {e}")
             return False
             
+    def _cached_digest(self, path: Path, st: os.stat_result) -> Optional[str]:
+        """Digest from the sync manifest, else from the framework's object map."""
+        digest = self.manifest.cached_digest(path, st)
+        if digest is None and self.objects is not None:
+            digest = self.objects.cached_digest(path, st)
+        return digest
+            
+    def capture_target_snapshot(self) -> TreeSnapshot:
+        """Snapshot the target framework's LM_context once for reuse.
+        
+        Framework files found in the snapshot are hashed into the manifest,
+        so that many source projects can be analyzed against the snapshot
+        without re-walking or re-reading the target tree.
+        """
+        target_lm_context = self.target_framework / "LM_context"
+        snapshot = TreeSnapshot(target_lm_context)
+        
+        tracked = [f"{category}/{file_name}" for category, files in self.framework_files.items() for file_name in files]
+        tracked.append("evolving/foundational-elements-specification.md")
+        for relative_path in tracked:
+            st = snapshot.stat(relative_path)
+            if st is not None:
+                self.manifest.digest(target_lm_context / relative_path, st)
+        
+        return snapshot
+        
+    def _snapshot_stat(self, path: Path) -> os.stat_result:
+        """Stat a path through the tree snapshots, falling back to the filesystem."""
+        for snapshot in (self.source_snapshot, self.target_snapshot):
+            if snapshot is None:
+                continue
+            relative_path = snapshot.relative(path)
+            if relative_path is not None:
+                st = snapshot.stat(relative_path)
+                if st is not None:
+                    return st
+        return path.stat()
+        
+    def syscalls_used(self) -> int:
+        """Count the stat/scandir calls made to build this run's snapshots."""
+        snapshots = [self.source_snapshot] + ([] if self.shared_target else [self.target_snapshot])
+        return sum(snapshot.syscalls for snapshot in snapshots if snapshot is not None)
+        
+    def syscalls_saved(self) -> int:
+        """Count the lookups answered from memory instead of a stat call."""
+        saved = self.source_snapshot.lookups if self.source_snapshot is not None else 0
+        if self.target_snapshot is not None:
+            saved += self.target_snapshot.lookups - self._target_lookups_start
+        return saved
+        
+    def _compare_chunks(self, file1: Path, st1: os.stat_result, file2: Path, st2: os.stat_result) -> bool:
+        """Stream both files in chunks, exiting early on the first difference.
+        
+        When the files turn out identical their digests are recorded in the
+        manifest so the next run can skip reading them altogether.
+        """
+        self.manifest.misses += 1
+        hasher1 = new_hasher()
+        hasher2 = new_hasher()
+        with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
+            while True:
+                chunk1 = f1.read(CHUNK_SIZE)
+                chunk2 = f2.read(CHUNK_SIZE)
+                if chunk1 != chunk2:
+                    return True
+                if not chunk1:
+                    break
+                hasher1.update(chunk1)
+                hasher2.update(chunk2)
+        
+        self.manifest.store(file1, st1, hasher1.hexdigest())
+        self.manifest.store(file2, st2, hasher2.hexdigest())
+        return False
+            
     def _analyze_structural_changes(self) -> List[Dict]:
         """Analyze structural changes in the project."""
         changes = []
         
-        source_lm_context = self.source_project / "LM_context"
-        target_lm_context = self.target_framework / "LM_context"
-        
-        # Check for new directories
-        for item in source_lm_context.rglob("*"):
-            if item.is_dir():
-                relative_path = item.relative_to(source_lm_context)
-                target_equivalent = target_lm_context / relative_path
-                
-                if not target_equivalent.exists():
-                    changes.append({
-                        "type": "new_directory",
-                        "path": str(relative_path),
-                        "description": f"New directory structure: {relative_path}"
-                    })
+        # Check for new directories (hidden ones such as .index/ hold tool state)
+        for relative_path in self.source_snapshot.directories():
+            if any(part.startswith(".") for part in relative_path.split("/")):
+                continue
+            if not self.target_snapshot.exists(relative_path):
+                changes.append({
+                    "type": "new_directory",
+                    "path": relative_path,
+                    "description": f"New directory structure: {relative_path}"
+                })
         
         return changes
         
@@ -170,21 +826,20 @@ class FrameworkSyncTool:
         
         # Check for new guide files
         source_guides = self.source_project / "LM_context" / "llm-guides"
-        if source_guides.exists():
-            for guide_file in source_guides.glob("*.md"):
-                if guide_file.name not in self.framework_files["llm-guides"]:
-                    enhancements.append({
-                        "type": "new_guide",
-                        "file": guide_file.name,
-                        "path": str(guide_file),
-                        "description": f"New LLM guide discovered: {guide_file.name}"
-                    })
+        for guide_name in self.source_snapshot.list_files("llm-guides", ".md"):
+            if guide_name not in self.framework_files["llm-guides"]:
+                enhancements.append({
+                    "type": "new_guide",
+                    "file": guide_name,
+                    "path": str(source_guides / guide_name),
+                    "description": f"New LLM guide discovered: {guide_name}"
+                })
         
         # Check for enhanced foundational elements
-        source_foundational = self.source_project / "LM_context" / "evolving" / "foundational-elements-specification.md"
-        target_foundational = self.target_framework / "LM_context" / "evolving" / "foundational-elements-specification.md"
-        
-        if source_foundational.exists() and target_foundational.exists():
+        foundational_path = "evolving/foundational-elements-specification.md"
+        if self.source_snapshot.exists(foundational_path) and self.target_snapshot.exists(foundational_path):
+            source_foundational = self.source_project / "LM_context" / foundational_path
+            target_foundational = self.target_framework / "LM_context" / foundational_path
             if self._files_different(source_foundational, target_foundational):
                 enhancements.append({
                     "type": "foundational_elements_enhancement",
@@ -197,7 +852,15 @@ class FrameworkSyncTool:
     def interactive_sync(self, improvements: Dict) -> None:
         """Interactively sync improvements with user confirmation."""
         print("\n🔄 Starting interactive sync process...")
+        try:
+            self._interactive_sync(improvements)
+        except BaseException:
+            self.finish_batch("failed")
+            raise
+        self.finish_batch()
         
+    def _interactive_sync(self, improvements: Dict) -> None:
+        """Prompt for each improvement category in turn."""
         # Handle new files
         if improvements["new_files"]:
             print(f"\n📄 Found {len(improvements['new_files'])} new files:")
@@ -222,6 +885,91 @@ class FrameworkSyncTool:
             for enhancement in improvements["potential_framework_enhancements"]:
                 self._handle_framework_enhancement(enhancement)
                 
+    def policy_sync(self, improvements: Dict, policy: SyncPolicy) -> Dict:
+        """Apply improvements according to a policy, without prompting.
+        
+        Returns the decisions per outcome; undecided items are written to a
+        review queue that can later be worked through with --review.
+        """
+        print(f"\n🤖 Applying sync policy: {policy.source}")
+        decisions = {"accepted": [], "rejected": [], "queued": []}
+        queued = {category: [] for category in POLICY_CATEGORIES}
+        
+        try:
+            for category in POLICY_CATEGORIES:
+                for item in improvements[category]:
+                    item_path, item_type, from_path, to_path = self._policy_subject(category, item)
+                    decision, reason = policy.decide(
+                        category, item_path, item_type,
+                        lambda: self.diff_engine.diff_stats(from_path, to_path) if from_path else self._new_file_stats(to_path)
+                    )
+                    record = {"category": category, "path": item_path, "reason": reason}
+                    
+                    if decision == "accept":
+                        print(f"  ✅ {item_path}: {reason}")
+                        self._apply_improvement(category, item)
+                        decisions["accepted"].append(record)
+                    elif decision == "reject":
+                        print(f"  ❌ {item_path}: {reason}")
+                        decisions["rejected"].append(record)
+                    else:
+                        print(f"  ⏳ {item_path}: queued for review")
+                        queued[category].append(item)
+                        decisions["queued"].append(record)
+        except BaseException:
+            self.finish_batch("failed")
+            raise
+        self.finish_batch()
+        
+        if decisions["queued"]:
+            decisions["queue_path"] = str(self._write_review_queue(queued))
+        
+        print(f"\n📋 Policy results: {len(decisions['accepted'])} accepted, "
+              f"{len(decisions['rejected'])} rejected, {len(decisions['queued'])} queued")
+        return decisions
+        
+    def _policy_subject(self, category: str, item: Dict) -> Tuple[str, str, Optional[str], Optional[str]]:
+        """Describe an improvement as (path, type, diff-from file, diff-to file)."""
+        if category in ("new_files", "modified_files"):
+            from_path = item["target_path"] if category == "modified_files" else None
+            return f"{item['category']}/{item['file']}", category, from_path, item["source_path"]
+        if category == "structural_changes":
+            return item["path"], item["type"], None, None
+        if item["type"] == "new_guide":
+            return f"llm-guides/{item['file']}", item["type"], None, item["path"]
+        relative_path = f"evolving/{item['file']}"
+        return (relative_path, item["type"],
+                str(self.target_framework / "LM_context" / relative_path),
+                str(self.source_project / "LM_context" / relative_path))
+        
+    @staticmethod
+    def _new_file_stats(path: Optional[str]) -> Optional[Tuple[int, int]]:
+        """Count a new file's lines as additions (None when there is no file)."""
+        if path is None:
+            return None
+        with open(path, 'rb') as f:
+            return sum(1 for _ in f), 0
+        
+    def _apply_improvement(self, category: str, item: Dict) -> None:
+        """Apply one accepted improvement to the framework."""
+        if category in ("new_files", "modified_files"):
+            self._copy_file_to_framework(item)
+        elif category == "structural_changes":
+            self._apply_structural_change(item)
+        else:
+            self._apply_framework_enhancement(item)
+        
+    def _write_review_queue(self, queued: Dict[str, List[Dict]]) -> Path:
+        """Persist undecided improvements for a later interactive review."""
+        queue_path = self.target_framework / f"sync-review-queue-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+        atomic_write(queue_path, json.dumps({
+            "source_project": str(self.source_project),
+            "target_framework": str(self.target_framework),
+            "improvements": queued
+        }, indent=2).encode('utf-8'))
+        print(f"⏳ Review queue written: {queue_path}")
+        return queue_path
+        
     def _handle_new_file(self, new_file: Dict) -> None:
         """Handle a new file with user interaction."""
         print(f"\n📄 New file found: {new_file['category']}/{new_file['file']}")
@@ -285,13 +1033,20 @@ class FrameworkSyncTool:
         choice = input(f"Apply this structural change to framework? [y/n]: ").lower().strip()
         
         if choice == 'y':
-            if change['type'] == 'new_directory':
-                target_dir = self.target_framework / "LM_context" / change['path']
-                target_dir.mkdir(parents=True, exist_ok=True)
-                print(f"✅ Created directory: {target_dir}")
+            self._apply_structural_change(change)
         else:
             print("❌ Skipping structural change")
             
+    def _apply_structural_change(self, change: Dict) -> None:
+        """Apply a structural change to the framework."""
+        if change['type'] == 'new_directory':
+            target_dir = self.target_framework / "LM_context" / change['path']
+            if self.analyze_only:
+                print(f"🔍 Would create directory: {target_dir}")
+                return
+            target_dir.mkdir(parents=True, exist_ok=True)
+            print(f"✅ Created directory: {target_dir}")
+            
     def _handle_framework_enhancement(self, enhancement: Dict) -> None:
         """Handle a framework enhancement with user interaction."""
         print(f"\n🚀 Framework enhancement: {enhancement['description']}")
@@ -302,13 +1057,7 @@ class FrameworkSyncTool:
             
             choice = input(f"Add this guide to the framework? [y/n]: ").lower().strip()
             if choice == 'y':
-                # Copy to framework guides
-                source_file = Path(enhancement['path'])
-                target_file = self.target_framework / "LM_context" / "llm-guides" / enhancement['file']
-                self._copy_file(source_file, target_file)
-                
-                # Update framework file lists
-                self._update_framework_file_lists(enhancement['file'], "llm-guides")
+                self._apply_framework_enhancement(enhancement)
                 
         elif enhancement['type'] == 'foundational_elements_enhancement':
             print("Foundational elements specification has been enhanced")
@@ -319,9 +1068,23 @@ class FrameworkSyncTool:
             
             choice = input(f"Update foundational elements specification? [y/n]: ").lower().strip()
             if choice == 'y':
-                source_file = self.source_project / "LM_context" / "evolving" / "foundational-elements-specification.md"
-                target_file = self.target_framework / "LM_context" / "evolving" / "foundational-elements-specification.md"
-                self._copy_file(source_file, target_file)
+                self._apply_framework_enhancement(enhancement)
+                
+    def _apply_framework_enhancement(self, enhancement: Dict) -> None:
+        """Apply a framework enhancement to the framework."""
+        if enhancement['type'] == 'new_guide':
+            # Copy to framework guides
+            source_file = Path(enhancement['path'])
+            target_file = self.target_framework / "LM_context" / "llm-guides" / enhancement['file']
+            self._copy_file(source_file, target_file)
+            
+            # Update framework file lists
+            self._update_framework_file_lists(enhancement['file'], "llm-guides")
+            
+        elif enhancement['type'] == 'foundational_elements_enhancement':
+            source_file = self.source_project / "LM_context" / "evolving" / "foundational-elements-specification.md"
+            target_file = self.target_framework / "LM_context" / "evolving" / "foundational-elements-specification.md"
+            self._copy_file(source_file, target_file)
                 
     def _copy_file_to_framework(self, file_info: Dict) -> None:
         """Copy a file to the framework."""
@@ -331,38 +1094,42 @@ class FrameworkSyncTool:
         self._copy_file(source_file, target_file)
         
     def _copy_file(self, source: Path, target: Path) -> None:
-        """Copy a file with backup."""
+        """Copy a file atomically through the object store, journaling the previous content."""
         if not self.analyze_only:
-            # Create backup if target exists
-            if target.exists():
-                backup_path = target.with_suffix(target.suffix + f".backup-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
-                target.rename(backup_path)
-                print(f"📦 Backup created: {backup_path}")
-            
-            # Ensure target directory exists
-            target.parent.mkdir(parents=True, exist_ok=True)
+            if self.batch is None:
+                self.batch = self.journal.begin(f"sync from {self.source_project}")
             
-            # Copy file
-            with open(source, 'r', encoding='utf-8') as src, open(target, 'w', encoding='utf-8') as tgt:
-                tgt.write(src.read())
+            # The source becomes a blob in LM_context/.objects/ (its digest is
+            # usually cached from the analysis); previous content goes to
+            # LM_context/.backups/ and the batch manifest before the blob is
+            # placed at the target
+            digest = self.objects.ingest(source, self.manifest.digest(source))
+            method = self.objects.place(self.batch, digest, target, self.link, copystat_from=source)
+            self.manifest.store(target, target.stat(), digest)
             
-            print(f"✅ Copied: {source} → {target}")
+            print(f"✅ Copied ({method}): {source} → {target}")
         else:
             print(f"🔍 Would copy: {source} → {target}")
             
+    def finish_batch(self, status: str = "committed") -> None:
+        """Close this run's write batch and tell how to undo it."""
+        if self.batch is None:
+            return
+        self.batch.close(status)
+        self.objects.save()
+        self.manifest.save()
+        if self.batch.manifest["entries"]:
+            print(f"\n📒 {len(self.batch.manifest['entries'])} framework files written in batch {self.batch.batch_id}")
+            print(f"   Undo with: python3 context_journal.py rollback {self.batch.batch_id} {self.target_framework}")
+        self.batch = None
+            
     def _show_file_diff(self, file1_path: str, file2_path: str) -> None:
         """Show diff between two files."""
         try:
-            with open(file1_path, 'r', encoding='utf-8') as f1:
-                file1_lines = f1.readlines()
-            with open(file2_path, 'r', encoding='utf-8') as f2:
-                file2_lines = f2.readlines()
-                
-            diff = difflib.unified_diff(
-                file1_lines, file2_lines,
+            diff = self.diff_engine.unified_diff(
+                file1_path, file2_path,
                 fromfile=f"framework/{Path(file1_path).name}",
-                tofile=f"project/{Path(file2_path).name}",
-                lineterm=''
+                tofile=f"project/{Path(file2_path).name}"
             )
             
             print("\n📊 Diff:")
@@ -396,7 +1163,7 @@ class FrameworkSyncTool:
         # This would update deploy.py and other framework files to include the new file
         print(f"📝 Note: Remember to update deploy.py to include {filename} in {category}")
         
-    def generate_sync_report(self, improvements: Dict) -> None:
+    def generate_sync_report(self, improvements: Dict, decisions: Optional[Dict] = None) -> None:
         """Generate a detailed sync report."""
         report_path = self.target_framework / f"sync-report-{datetime.now().strftime('%Y%m%d-%H%M%S')}.md"
         
@@ -426,6 +1193,7 @@ class FrameworkSyncTool:
                     f.write(f"- **{modified_file['category']}/{modified_file['file']}**\n")
                     f.write(f"  - Source: {modified_file['source_path']}\n")
                     f.write(f"  - Target: {modified_file['target_path']}\n\n")
+                    self._write_report_diff(f, modified_file['target_path'], modified_file['source_path'])
             
             if improvements['structural_changes']:
                 f.write(f"## Structural Changes\n\n")
@@ -436,8 +1204,157 @@ class FrameworkSyncTool:
                 f.write(f"## Framework Enhancements\n\n")
                 for enhancement in improvements['potential_framework_enhancements']:
                     f.write(f"- **{enhancement['type']}:** {enhancement['description']}\n\n")
+            
+            if decisions:
+                f.write(f"## Policy Decisions\n\n")
+                for outcome in ("accepted", "rejected", "queued"):
+                    f.write(f"### {outcome.title()} ({len(decisions[outcome])})\n\n")
+                    for record in decisions[outcome]:
+                        f.write(f"- **{record['path']}** ({record['category']}): {record['reason']}\n")
+                    f.write("\n")
+                if decisions.get("queue_path"):
+                    f.write(f"**Review queue:** {decisions['queue_path']}\n\n")
         
         print(f"📊 Sync report generated: {report_path}")
+        
+    def _write_report_diff(self, report, file1_path: str, file2_path: str) -> None:
+        """Stream a capped diff of two files into an open report."""
+        try:
+            # Four backticks so fenced blocks inside the diffed markdown survive
+            report.write("````diff\n")
+            for line in self.diff_engine.unified_diff(
+                file1_path, file2_path,
+                fromfile=f"framework/{Path(file1_path).name}",
+                tofile=f"project/{Path(file2_path).name}"
+            ):
+                report.write(line + "\n")
+            report.write("````\n\n")
+        except Exception as e:
+            report.write(f"````\n\n⚠️ Could not generate diff: {e}\n\n")
+
+# Per-process state shared with multi-project analysis workers
+_WORKER_CONTEXT: Dict = {}
+
+def _init_sync_worker(target_framework: str, target_snapshot: TreeSnapshot,
+                      manifest_entries: Dict[str, Dict[str, Dict]]) -> None:
+    """Receive the target framework snapshot once per worker process."""
+    _WORKER_CONTEXT["target_framework"] = target_framework
+    _WORKER_CONTEXT["target_snapshot"] = target_snapshot
+    _WORKER_CONTEXT["manifest_entries"] = manifest_entries
+
+def _analyze_source_project(source_project: str) -> Tuple[str, Dict, Dict]:
+    """Analyze one source project against the shared target state."""
+    sync_tool = FrameworkSyncTool(
+        source_project,
+        _WORKER_CONTEXT["target_framework"],
+        analyze_only=True,
+        target_snapshot=_WORKER_CONTEXT["target_snapshot"],
+        manifest_entries=_WORKER_CONTEXT["manifest_entries"]
+    )
+    improvements = sync_tool.analyze_improvements()
+    return str(sync_tool.source_project), improvements, sync_tool.manifest.updated
+
+def expand_source_patterns(patterns: List[str]) -> List[str]:
+    """Expand project paths and glob patterns into unique project directories."""
+    sources = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(os.path.expanduser(pattern))) or [pattern]
+        for match in matches:
+            resolved = str(Path(match).resolve())
+            if Path(resolved).is_dir() and resolved not in seen:
+                seen.add(resolved)
+                sources.append(resolved)
+    return sources
+
+def run_multi_project_analysis(sources: List[str], target_framework: str, workers: Optional[int] = None) -> Dict[str, Dict]:
+    """Analyze many source projects in a process pool against one framework.
+    
+    The target framework's LM_context is snapshotted once and handed to every
+    worker; digests computed by the workers are merged back into the
+    framework manifest at the end.
+    """
+    framework_tool = FrameworkSyncTool(target_framework, target_framework, analyze_only=True)
+    target_snapshot = framework_tool.capture_target_snapshot()
+    results: Dict[str, Dict] = {}
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_sync_worker,
+        initargs=(str(framework_tool.target_framework), target_snapshot, framework_tool.manifest.entries)
+    ) as pool:
+        futures = {pool.submit(_analyze_source_project, source): source for source in sources}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                source_project, improvements, updated_entries = future.result()
+                results[source_project] = improvements
+                framework_tool.manifest.merge(updated_entries)
+                framework_tool.manifest.touched.add(source_project)
+            except Exception as e:
+                print(f"⚠️ Analysis failed for {source}: {e}")
+                results[source] = {"error": str(e)}
+    
+    framework_tool.manifest.save()
+    return dict(sorted(results.items()))
+
+def _changed_framework_files(improvements: Dict) -> List[str]:
+    """List the framework files (relative to LM_context) a project changes."""
+    changed = [f"{item['category']}/{item['file']}" for item in improvements.get("new_files", [])]
+    changed += [f"{item['category']}/{item['file']}" for item in improvements.get("modified_files", [])]
+    for enhancement in improvements.get("potential_framework_enhancements", []):
+        if enhancement["type"] == "new_guide":
+            changed.append(f"llm-guides/{enhancement['file']}")
+        elif enhancement["type"] == "foundational_elements_enhancement":
+            changed.append(f"evolving/{enhancement['file']}")
+    return changed
+
+def generate_multi_project_report(results: Dict[str, Dict], target_framework: str) -> Path:
+    """Write one consolidated report for a multi-project analysis."""
+    target_path = Path(target_framework).resolve()
+    report_path = target_path / f"sync-report-multi-{datetime.now().strftime('%Y%m%d-%H%M%S')}.md"
+    
+    touched_by: Dict[str, List[str]] = {}
+    for source, improvements in results.items():
+        for changed_file in _changed_framework_files(improvements):
+            touched_by.setdefault(changed_file, []).append(source)
+    overlaps = {path: projects for path, projects in sorted(touched_by.items()) if len(projects) > 1}
+    
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write(f"# Multi-Project Framework Sync Report\n\n")
+        f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"**Target Framework:** {target_path}\n")
+        f.write(f"**Source Projects:** {len(results)}\n\n")
+        
+        f.write(f"## Summary\n\n")
+        f.write(f"| Project | New | Modified | Structural | Enhancements |\n")
+        f.write(f"|---------|-----|----------|------------|--------------|\n")
+        for source, improvements in results.items():
+            if "error" in improvements:
+                f.write(f"| {source} | ⚠️ {improvements['error']} | | | |\n")
+                continue
+            f.write(
+                f"| {source} | {len(improvements['new_files'])} | {len(improvements['modified_files'])} "
+                f"| {len(improvements['structural_changes'])} | {len(improvements['potential_framework_enhancements'])} |\n"
+            )
+        f.write("\n")
+        
+        f.write(f"## Overlapping Changes\n\n")
+        if overlaps:
+            for path, projects in overlaps.items():
+                f.write(f"- **{path}** changed by {len(projects)} projects:\n")
+                for project in projects:
+                    f.write(f"  - {project}\n")
+                f.write("\n")
+        else:
+            f.write("No framework file is changed by more than one project.\n\n")
+        
+        f.write(f"## Changes by Framework File\n\n")
+        for path, projects in sorted(touched_by.items()):
+            f.write(f"- **{path}:** {', '.join(Path(project).name for project in projects)}\n")
+    
+    print(f"📊 Multi-project sync report generated: {report_path}")
+    return report_path
 
 def main():
     parser = argparse.ArgumentParser(
@@ -453,6 +1370,12 @@ Examples:
   
   # Generate report only
   python3 sync-framework-improvements.py --source /Users/vn/ws/melexis-simple --target /Users/vn/ws/LLM_Context_System --report-only
+  
+  # Unattended sync driven by a policy file (e.g. in CI)
+  python3 sync-framework-improvements.py --source /Users/vn/ws/melexis-simple --target /Users/vn/ws/LLM_Context_System --policy sync-policy.json
+  
+  # Analyze many projects in parallel into one consolidated report
+  python3 sync-framework-improvements.py --sources "/Users/vn/ws/*" --target /Users/vn/ws/LLM_Context_System
         """
     )
     
@@ -461,6 +1384,18 @@ Examples:
         help="Source project directory with improvements"
     )
     
+    parser.add_argument(
+        "--sources",
+        nargs="+",
+        help="Multiple source project directories or glob patterns (analyzed in parallel)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes for --sources (default: CPU count)"
+    )
+    
     parser.add_argument(
         "--target", 
         help="Target framework directory to sync to"
@@ -468,7 +1403,7 @@ Examples:
     
     parser.add_argument(
         "--analyze-only",
-        help="Only analyze improvements without syncing (provide source path)"
+        help="Only analyze improvements without syncing (provide source path; compared with --target if given)"
     )
     
     parser.add_argument(
@@ -477,16 +1412,71 @@ Examples:
         help="Generate report only, don't sync"
     )
     
+    parser.add_argument(
+        "--policy",
+        help="Sync policy file (JSON or YAML) for unattended syncs; undecided items are queued for review"
+    )
+    
+    parser.add_argument(
+        "--review",
+        help="Interactively review a queue file written by a --policy run"
+    )
+    
+    parser.add_argument(
+        "--diff-max-lines",
+        type=int,
+        default=DEFAULT_DIFF_MAX_LINES,
+        help=f"Maximum diff lines shown per file in prompts and reports (default: {DEFAULT_DIFF_MAX_LINES}, 0 = unlimited)"
+    )
+    
+    parser.add_argument(
+        "--link",
+        choices=SYNC_LINK_MODES,
+        default="auto",
+        help="How accepted files are placed from the framework's object store: auto reflinks where "
+             "the filesystem can and copies otherwise (default: auto)"
+    )
+    
     args = parser.parse_args()
     
+    if args.policy and (args.sources or args.analyze_only or args.review):
+        parser.error("--policy only applies to a --source/--target sync")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    policy = None
+    if args.policy:
+        try:
+            policy = SyncPolicy.load(args.policy)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not load policy {args.policy}: {e}")
+            sys.exit(1)
+    
     # Determine operation mode
-    if args.analyze_only:
+    if args.review:
+        with open(args.review, 'r', encoding='utf-8') as f:
+            queue = json.load(f)
+        
+        # Review mode: work through items a policy run left undecided
+        sync_tool = FrameworkSyncTool(
+            queue["source_project"], queue["target_framework"],
+            diff_max_lines=args.diff_max_lines or None,
+            link=args.link
+        )
+        sync_tool.interactive_sync(queue["improvements"])
+        
+    elif args.analyze_only:
         if not Path(args.analyze_only).exists():
             print(f"❌ Source project not found: {args.analyze_only}")
             sys.exit(1)
         
-        # Analyze only mode
-        sync_tool = FrameworkSyncTool(args.analyze_only, "", analyze_only=True)
+        if args.target and not Path(args.target).exists():
+            print(f"❌ Target framework not found: {args.target}")
+            sys.exit(1)
+        
+        # Analyze only mode: compared with --target when given, else every
+        # framework file in the project is listed as new
+        sync_tool = FrameworkSyncTool(args.analyze_only, args.target, analyze_only=True)
         improvements = sync_tool.analyze_improvements()
         
         print(f"\n📊 Analysis Results:")
@@ -510,6 +1500,21 @@ Examples:
             for enhancement in improvements['potential_framework_enhancements']:
                 print(f"  - {enhancement['description']}")
                 
+    elif args.sources:
+        if not args.target or not Path(args.target).exists():
+            print(f"❌ Target framework not found: {args.target}")
+            sys.exit(1)
+        
+        sources = expand_source_patterns(args.sources)
+        if not sources:
+            print(f"❌ No source projects matched: {' '.join(args.sources)}")
+            sys.exit(1)
+        
+        # Multi-project mode: parallel analysis, consolidated report
+        print(f"🔍 Analyzing {len(sources)} source projects...")
+        results = run_multi_project_analysis(sources, args.target, args.workers)
+        generate_multi_project_report(results, args.target)
+        
     elif args.source and args.target:
         if not Path(args.source).exists():
             print(f"❌ Source project not found: {args.source}")
@@ -520,10 +1525,18 @@ Examples:
             sys.exit(1)
         
         # Full sync mode
-        sync_tool = FrameworkSyncTool(args.source, args.target, analyze_only=args.report_only)
+        sync_tool = FrameworkSyncTool(
+            args.source, args.target,
+            analyze_only=args.report_only,
+            diff_max_lines=args.diff_max_lines or None,
+            link=args.link
+        )
         improvements = sync_tool.analyze_improvements()
         
-        if args.report_only:
+        if policy:
+            decisions = sync_tool.policy_sync(improvements, policy)
+            sync_tool.generate_sync_report(improvements, decisions)
+        elif args.report_only:
             sync_tool.generate_sync_report(improvements)
         else:
             sync_tool.interactive_sync(improvements)
@@ -0,0 +1,23 @@
+import sys
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture
+def project(tmp_path):
+    """An empty project directory with an LM_context/ tree."""
+    (tmp_path / "LM_context").mkdir()
+    return tmp_path
+
+
+def load_script(filename, module_name):
+    """Import a repo script whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location(module_name, REPO_ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
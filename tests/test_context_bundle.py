@@ -0,0 +1,120 @@
+import json
+import zlib
+
+import pytest
+
+from context_bundle import ContextBundle, pack_bundle, PREFIX, BUNDLE_MAGIC, BUNDLE_VERSION
+
+HANDOFF = """# Session Handoff
+
+## Completed
+- Fixed the build
+
+## Next Steps
+1. Ship it
+"""
+
+
+@pytest.fixture
+def source(project):
+    context_dir = project / "LM_context"
+    (context_dir / "dynamic").mkdir()
+    (context_dir / "dynamic" / "session-handoff.md").write_text(HANDOFF)
+    (context_dir / "static").mkdir()
+    (context_dir / "static" / "copy-of-handoff.md").write_text(HANDOFF)
+    (context_dir / "static" / "notes.md").write_text("no headings, no trailing newline")
+    script = context_dir / "static" / "check.sh"
+    script.write_bytes(b"#!/bin/sh\necho \xff\n")
+    script.chmod(0o755)
+    (context_dir / ".index").mkdir()
+    (context_dir / ".index" / "state.json").write_text("{}")
+    return project
+
+
+def test_pack_unpack_round_trip(source, tmp_path):
+    bundle_path = tmp_path / "context.lmcb"
+    header = pack_bundle(str(source), bundle_path, "zlib")
+    assert ".index/state.json" not in [entry["path"] for entry in header["files"]]
+
+    target = tmp_path / "other"
+    target.mkdir()
+    with ContextBundle(bundle_path) as bundle:
+        outcome = bundle.unpack(target)
+
+    assert sorted(outcome["written"]) == sorted(entry["path"] for entry in header["files"])
+    for relative_path in outcome["written"]:
+        original = source / "LM_context" / relative_path
+        copy = target / "LM_context" / relative_path
+        assert copy.read_bytes() == original.read_bytes()
+        assert copy.stat().st_mode & 0o777 == original.stat().st_mode & 0o777
+
+
+def test_unpack_keeps_local_edits_unless_forced(source, tmp_path):
+    bundle_path = tmp_path / "context.lmcb"
+    pack_bundle(str(source), bundle_path, "zlib")
+    handoff = source / "LM_context" / "dynamic" / "session-handoff.md"
+    handoff.write_text("edited locally\n")
+
+    with ContextBundle(bundle_path) as bundle:
+        outcome = bundle.unpack(source)
+        assert outcome["kept"] == ["dynamic/session-handoff.md"]
+        assert handoff.read_text() == "edited locally\n"
+        assert bundle.unpack(source, force=True)["written"] == ["dynamic/session-handoff.md"]
+    assert handoff.read_text() == HANDOFF
+
+
+def test_read_section_and_shared_frames(source, tmp_path):
+    bundle_path = tmp_path / "context.lmcb"
+    pack_bundle(str(source), bundle_path, "zlib")
+
+    with ContextBundle(bundle_path) as bundle:
+        assert bundle.read_section("dynamic/session-handoff.md",
+                                   "Session Handoff > Next Steps") == "## Next Steps\n1. Ship it\n"
+        original = bundle.file("dynamic/session-handoff.md")["sections"]
+        copy = bundle.file("static/copy-of-handoff.md")["sections"]
+        assert [section["offset"] for section in original] == [section["offset"] for section in copy]
+        with pytest.raises(KeyError):
+            bundle.read_text("missing.md")
+
+
+def rewrite_header(bundle_path, change):
+    data = bundle_path.read_bytes()
+    _, _, length = PREFIX.unpack_from(data, 0)
+    header = json.loads(zlib.decompress(data[PREFIX.size:PREFIX.size + length]))
+    change(header)
+    header_bytes = zlib.compress(json.dumps(header).encode('utf-8'))
+    bundle_path.write_bytes(PREFIX.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(header_bytes))
+                            + header_bytes + data[PREFIX.size + length:])
+
+
+@pytest.mark.parametrize("path", ["../escape.md", "/etc/escape.md", "a/../../escape.md", "C:/escape.md"])
+def test_rejects_paths_outside_lm_context(source, tmp_path, path):
+    bundle_path = tmp_path / "context.lmcb"
+    pack_bundle(str(source), bundle_path, "zlib")
+    rewrite_header(bundle_path, lambda header: header["files"][0].update(path=path))
+
+    with pytest.raises(ValueError, match="unsafe path"):
+        ContextBundle(bundle_path)
+
+
+def test_strips_special_mode_bits(source, tmp_path):
+    bundle_path = tmp_path / "context.lmcb"
+    pack_bundle(str(source), bundle_path, "zlib")
+    rewrite_header(bundle_path, lambda header: [entry.update(mode=0o6755) for entry in header["files"]])
+
+    target = tmp_path / "other"
+    target.mkdir()
+    with ContextBundle(bundle_path) as bundle:
+        written = bundle.unpack(target)["written"]
+    for relative_path in written:
+        assert (target / "LM_context" / relative_path).stat().st_mode & 0o7777 == 0o755
+
+
+@pytest.mark.parametrize("mode", ["0o755", None, True, -1])
+def test_rejects_invalid_modes(source, tmp_path, mode):
+    bundle_path = tmp_path / "context.lmcb"
+    pack_bundle(str(source), bundle_path, "zlib")
+    rewrite_header(bundle_path, lambda header: header["files"][0].update(mode=mode))
+
+    with pytest.raises(ValueError, match="invalid mode"):
+        ContextBundle(bundle_path)
@@ -0,0 +1,110 @@
+import json
+
+from context_journal import WriteJournal, atomic_write
+from context_sections import content_digest
+
+
+def write_batch(journal, files, description="test"):
+    with journal.begin(description) as batch:
+        for target, text in files.items():
+            batch.write_text(target, text)
+    return batch
+
+
+def test_write_records_before_and_after(project):
+    existing = project / "LM_context" / "notes.md"
+    existing.write_text("old\n")
+    created = project / "LM_context" / "new.md"
+
+    batch = write_batch(WriteJournal(project), {existing: "new\n", created: "fresh\n"})
+
+    manifest = json.loads((project / "LM_context" / ".journal" / f"{batch.batch_id}.json").read_text())
+    assert manifest["status"] == "committed"
+    entries = {entry["path"]: entry for entry in manifest["entries"]}
+    assert entries["LM_context/notes.md"]["before"] == content_digest(b"old\n")
+    assert entries["LM_context/notes.md"]["after"] == content_digest(b"new\n")
+    assert entries["LM_context/new.md"]["before"] is None
+    assert existing.read_text() == "new\n"
+
+
+def test_rollback_restores_and_removes(project):
+    existing = project / "LM_context" / "notes.md"
+    existing.write_text("old\n")
+    existing.chmod(0o640)
+    created = project / "LM_context" / "new.md"
+    journal = WriteJournal(project)
+    batch = write_batch(journal, {existing: "new\n", created: "fresh\n"})
+
+    outcome = journal.rollback(batch.batch_id)
+
+    assert outcome["restored"] == ["LM_context/notes.md"]
+    assert outcome["removed"] == ["LM_context/new.md"]
+    assert existing.read_text() == "old\n"
+    assert existing.stat().st_mode & 0o777 == 0o640
+    assert not created.exists()
+    assert journal.load_manifest(batch.batch_id)["status"] == "rolled_back"
+
+
+def test_rollback_keeps_files_changed_since(project):
+    target = project / "LM_context" / "notes.md"
+    target.write_text("old\n")
+    journal = WriteJournal(project)
+    batch = write_batch(journal, {target: "new\n"})
+    target.write_text("edited by hand\n")
+
+    outcome = journal.rollback(batch.batch_id)
+
+    assert outcome["conflicts"] == ["LM_context/notes.md"]
+    assert target.read_text() == "edited by hand\n"
+    assert journal.load_manifest(batch.batch_id)["status"] == "committed"
+
+
+def test_failed_batch_is_marked(project):
+    target = project / "LM_context" / "notes.md"
+    journal = WriteJournal(project)
+    try:
+        with journal.begin("boom") as batch:
+            batch.write_text(target, "partial\n")
+            raise RuntimeError("interrupted")
+    except RuntimeError:
+        pass
+
+    assert journal.load_manifest(batch.batch_id)["status"] == "failed"
+    assert journal.rollback(batch.batch_id)["removed"] == ["LM_context/notes.md"]
+
+
+def test_prune_keeps_newest_batches_and_their_backups(project):
+    target = project / "LM_context" / "notes.md"
+    target.write_text("v0\n")
+    journal = WriteJournal(project)
+    batches = [write_batch(journal, {target: f"v{n}\n"}, f"write v{n}") for n in range(1, 5)]
+
+    outcome = journal.prune(keep=2)
+
+    assert outcome["batches_removed"] == 2
+    assert [manifest["id"] for manifest in journal.batches()] == [batch.batch_id for batch in batches[2:]]
+    assert not journal.backup_path(content_digest(b"v0\n")).exists()
+    assert journal.backup_path(content_digest(b"v2\n")).exists()
+    journal.rollback(batches[3].batch_id)
+    assert target.read_text() == "v3\n"
+
+
+def test_prune_never_drops_open_batches(project):
+    journal = WriteJournal(project)
+    open_batch = journal.begin("still running")
+    open_batch.write_text(project / "LM_context" / "a.md", "a\n")
+    write_batch(journal, {project / "LM_context" / "b.md": "b\n"})
+
+    journal.prune(keep=0)
+
+    assert [manifest["id"] for manifest in journal.batches()] == [open_batch.batch_id]
+
+
+def test_atomic_write_replaces_without_leftovers(tmp_path):
+    target = tmp_path / "state.json"
+    atomic_write(target, b"one")
+    atomic_write(target, b"two", mode=0o600)
+
+    assert target.read_bytes() == b"two"
+    assert target.stat().st_mode & 0o777 == 0o600
+    assert [path.name for path in tmp_path.iterdir()] == ["state.json"]
@@ -0,0 +1,195 @@
+import os
+import json
+import shutil
+import difflib
+
+import pytest
+
+from conftest import load_script
+
+sync = load_script("sync-framework-improvements.py", "sync_framework_improvements")
+
+
+def difflib_lines(a_text, b_text, n=3):
+    return list(difflib.unified_diff(a_text.splitlines(), b_text.splitlines(),
+                                     "a.md", "b.md", n=n, lineterm=""))
+
+
+def streaming_lines(tmp_path, a_text, b_text, n=3):
+    a_path = tmp_path / "a.md"
+    b_path = tmp_path / "b.md"
+    a_path.write_text(a_text)
+    b_path.write_text(b_text)
+    engine = sync.StreamingDiff(context_lines=n, max_output_lines=None)
+    return list(engine.unified_diff(str(a_path), str(b_path), "a.md", "b.md"))
+
+
+@pytest.mark.parametrize("a_text, b_text", [
+    ("", ""),
+    ("", "one\ntwo\n"),
+    ("one\ntwo\n", ""),
+    ("same\nlines\n", "same\nlines\n"),
+    ("one\ntwo\nthree", "one\ntwo\nthree"),
+    ("one\ntwo\nthree", "one\ntwo\nTHREE"),
+    ("one\ntwo\n", "one\ntwo\nthree"),
+    ("".join(f"line {n}\n" for n in range(20)), "".join(f"line {n}\n" for n in range(20) if n != 10)),
+    ("# A\nx\n\n# B\ny\n", "# A\nx\n\n# B\ny\n\n# C\nz\n"),
+])
+def test_unified_diff_matches_difflib(tmp_path, a_text, b_text):
+    assert streaming_lines(tmp_path, a_text, b_text) == difflib_lines(a_text, b_text)
+
+
+def test_diff_stats_count_added_and_removed(tmp_path):
+    a_path = tmp_path / "a.md"
+    b_path = tmp_path / "b.md"
+    a_path.write_text("keep\ndrop\nkeep too\n")
+    b_path.write_text("keep\nkeep too\nnew one\nnew two\n")
+    assert sync.StreamingDiff().diff_stats(str(a_path), str(b_path)) == (2, 1)
+
+
+def test_unified_diff_truncates(tmp_path):
+    a_text = "".join(f"old {n}\n" for n in range(50))
+    b_text = "".join(f"new {n}\n" for n in range(50))
+    (tmp_path / "a.md").write_text(a_text)
+    (tmp_path / "b.md").write_text(b_text)
+    lines = list(sync.StreamingDiff(max_output_lines=10).unified_diff(
+        str(tmp_path / "a.md"), str(tmp_path / "b.md")))
+    assert len(lines) == 11
+    assert lines[-1] == "... diff truncated after 10 lines"
+
+
+def test_manifest_rehashes_only_changed_files(tmp_path):
+    path = tmp_path / "guide.md"
+    path.write_text("first\n")
+    manifest = sync.FileManifest(tmp_path / sync.MANIFEST_FILENAME, [tmp_path])
+
+    first = manifest.digest(path)
+    assert manifest.digest(path) == first
+    assert (manifest.hits, manifest.misses) == (1, 1)
+
+    path.write_text("second, longer\n")
+    assert manifest.digest(path) != first
+    assert manifest.misses == 2
+
+
+def test_manifest_notices_same_size_rewrite(tmp_path):
+    path = tmp_path / "guide.md"
+    path.write_text("aaaa\n")
+    manifest = sync.FileManifest(tmp_path / sync.MANIFEST_FILENAME, [tmp_path])
+    first = manifest.digest(path)
+
+    path.write_text("bbbb\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert manifest.digest(path) != first
+
+
+def test_manifest_persists_between_runs(tmp_path):
+    path = tmp_path / "guide.md"
+    path.write_text("content\n")
+    manifest = sync.FileManifest(tmp_path / sync.MANIFEST_FILENAME, [tmp_path])
+    digest = manifest.digest(path)
+    manifest.save()
+
+    reloaded = sync.FileManifest(tmp_path / sync.MANIFEST_FILENAME, [tmp_path])
+    assert reloaded.digest(path) == digest
+    assert (reloaded.hits, reloaded.misses) == (1, 0)
+
+
+def test_manifest_scopes_entries_per_project(tmp_path):
+    framework = tmp_path / "framework"
+    project = tmp_path / "project"
+    for root in (framework, project):
+        (root / "LM_context").mkdir(parents=True)
+        (root / "LM_context" / "guide.md").write_text(f"{root.name}\n")
+    manifest = sync.FileManifest(framework / sync.MANIFEST_FILENAME, [project, framework])
+    manifest.digest(framework / "LM_context" / "guide.md")
+    manifest.digest(project / "LM_context" / "guide.md")
+    manifest.save()
+
+    data = json.loads((framework / sync.MANIFEST_FILENAME).read_text())
+    assert sorted(data["projects"]) == [str(framework), str(project)]
+    assert list(data["projects"][str(project)]) == ["LM_context/guide.md"]
+
+
+def test_manifest_evicts_vanished_files_and_projects(tmp_path):
+    framework = tmp_path / "framework"
+    kept = tmp_path / "kept"
+    gone = tmp_path / "gone"
+    for root in (framework, kept, gone):
+        root.mkdir()
+        (root / "a.md").write_text("a\n")
+        (root / "b.md").write_text("b\n")
+    manifest = sync.FileManifest(framework / sync.MANIFEST_FILENAME, [framework, kept, gone])
+    for root in (framework, kept, gone):
+        manifest.digest(root / "a.md")
+        manifest.digest(root / "b.md")
+    manifest.save()
+
+    (kept / "b.md").unlink()
+    shutil.rmtree(gone)
+    rerun = sync.FileManifest(framework / sync.MANIFEST_FILENAME, [kept, framework])
+    rerun.digest(kept / "a.md")
+    rerun.save()
+
+    data = json.loads((framework / sync.MANIFEST_FILENAME).read_text())["projects"]
+    assert sorted(data) == [str(framework), str(kept)]
+    assert list(data[str(kept)]) == ["a.md"]
+    assert sorted(data[str(framework)]) == ["a.md", "b.md"]
+
+
+POLICY = sync.SyncPolicy({
+    "new_files": [{"match": "llm-guides/*", "action": "accept"}],
+    "modified_files": [
+        {"match": "static/*", "action": "reject"},
+        {"action": "accept_if_additions_only"},
+        {"action": "accept_below_diff_size", "max_changed_lines": 5}
+    ],
+    "structural_changes": [
+        {"match": "archive/*", "action": "reject"},
+        {"action": "accept_if_additions_only"},
+        {"action": "accept_below_diff_size", "max_changed_lines": 5}
+    ],
+    "potential_framework_enhancements": [{"type": "new_guide", "action": "accept"}]
+})
+
+
+def never_called():
+    raise AssertionError("diff stats computed for a rule that does not need them")
+
+
+@pytest.mark.parametrize("category, path, item_type, stats, decision", [
+    ("new_files", "llm-guides/x.md", "new_files", never_called, "accept"),
+    ("new_files", "dynamic/x.md", "new_files", never_called, None),
+    ("modified_files", "static/x.md", "modified_files", never_called, "reject"),
+    ("modified_files", "dynamic/x.md", "modified_files", lambda: (12, 0), "accept"),
+    ("modified_files", "dynamic/x.md", "modified_files", lambda: (2, 2), "accept"),
+    ("modified_files", "dynamic/x.md", "modified_files", lambda: (10, 3), None),
+    ("structural_changes", "archive/old", "new_directory", never_called, "reject"),
+    ("structural_changes", "scratch", "new_directory", lambda: None, None),
+    ("potential_framework_enhancements", "llm-guides/g.md", "new_guide", never_called, "accept"),
+    ("potential_framework_enhancements", "evolving/e.md", "evolving_update", never_called, None),
+])
+def test_policy_decide(category, path, item_type, stats, decision):
+    assert POLICY.decide(category, path, item_type, stats)[0] == decision
+
+
+def test_policy_computes_diff_stats_once():
+    calls = []
+
+    def stats():
+        calls.append(1)
+        return (10, 3)
+
+    POLICY.decide("modified_files", "dynamic/x.md", "modified_files", stats)
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("rules", [
+    {"unknown_category": []},
+    {"new_files": [{"action": "merge"}]},
+    {"modified_files": [{"action": "accept_below_diff_size"}]},
+])
+def test_policy_rejects_invalid_rules(rules):
+    with pytest.raises(ValueError):
+        sync.SyncPolicy(rules)